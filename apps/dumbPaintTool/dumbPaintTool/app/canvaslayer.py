@@ -40,10 +40,24 @@ from .const import ToolType
 #   │                │                  |
 #   └────────────────┘                  -
 #        \---w--/
+#
+# The rows of the data are shared (copy on write) between the layer,
+# its snapshots and the preview; a row is copied only before
+# being modified if it is not listed in the owned rows.
+# The owned rows are kept referenced by their id to avoid
+# the id of a dropped row to be reused by a shared one
+
+def _writableRow(data, colors, owned, y):
+    drow = data[y]
+    if owned.get(id(drow)) is not drow:
+        drow = data[y] = drow.copy()
+        colors[y] = colors[y].copy()
+        owned[id(drow)] = drow
+    return drow, colors[y]
 
 class CanvasLayer():
     __slot__ = ('_pos','_name','_visible','_size','_data','_colors','_preview','_offset',
-                '_snapVersion', '_snapshots',
+                '_owned', '_snapVersion', '_snapshots',
                 #signals
                 'nameChanged','changed')
     def __init__(self,name:ttk.TTkString=ttk.TTkString('New')) -> None:
@@ -57,6 +71,7 @@ class CanvasLayer():
         self._offset = (0,0)
         self._visible = True
         self._preview = None
+        self._owned = {}
         self._data:  list[list[str         ]] = []
         self._colors:list[list[ttk.TTkColor]] = []
 
@@ -67,8 +82,10 @@ class CanvasLayer():
         cl._size    = self._size
         cl._offset  = self._offset
         cl._visible = self._visible
-        cl._data    = [row.copy() for row in self._data]
-        cl._colors  = [row.copy() for row in self._colors]
+        # The rows are shared with the clone
+        cl._data    = self._data.copy()
+        cl._colors  = self._colors.copy()
+        self._owned = {}
         return cl
 
     def restore(self, cl: object) -> None:
@@ -78,8 +95,9 @@ class CanvasLayer():
         self._size    = cl._size
         self._offset  = cl._offset
         self._visible = cl._visible
-        self._data    = [row.copy() for row in cl._data]
-        self._colors  = [row.copy() for row in cl._colors]
+        self._data    = cl._data.copy()
+        self._colors  = cl._colors.copy()
+        self._owned   = {}
         self.changed.emit()
 
     def restoreSnapshot(self, id:int) -> None:
@@ -107,8 +125,8 @@ class CanvasLayer():
             self._size    == value._size    and
             self._offset  == value._offset  and
             self._visible == value._visible and
-            all(a==b for a,b in zip(self._data,  value._data)) and
-            all(a==b for a,b in zip(self._colors,value._colors)) )
+            all(a is b or a==b for a,b in zip(self._data,  value._data)) and
+            all(a is b or a==b for a,b in zip(self._colors,value._colors)) )
 
     def update(self):
         self.changed.emit()
@@ -432,6 +450,22 @@ class CanvasLayer():
         self._name = ttk.TTkString("Pasted")
         self._snapVersion += 1
 
+    def _target(self, preview):
+        # The preview is an overlay sharing the rows of the layer,
+        # only the rows touched by the preview are copied
+        if preview:
+            data   = self._data.copy()
+            colors = self._colors.copy()
+            owned  = {}
+            self._preview = {'data':data,'colors':colors}
+        else:
+            self._snapVersion += 1
+            self._preview = None
+            data   = self._data
+            colors = self._colors
+            owned  = self._owned
+        return data,colors,owned
+
     def placeFill(self,geometry,tool,glyph:str,color:ttk.TTkColor,glyphEnabled=True,preview=False):
         ox,oy = self._offset
         w,h = self._size
@@ -443,66 +477,51 @@ class CanvasLayer():
         fax,fay = ox+min(ax,bx), oy+min(ay,by)
         fbx,fby = ox+max(ax,bx), oy+max(ay,by)
 
-        if preview:
-            data   = [_r.copy() for _r in self._data]
-            colors = [_r.copy() for _r in self._colors]
-            self._preview = {'data':data,'colors':colors}
-        else:
-            self._snapVersion += 1
-            self._preview = None
-            data   = self._data
-            colors = self._colors
+        data,colors,owned = self._target(preview)
 
         if tool == ToolType.RECTFILL:
             for y in range(fay,fby+1):
                 for x in range(fax,fbx+1):
-                    self._placeGlyph(data,colors,x,y,glyph,color,glyphEnabled,preview)
+                    self._placeGlyph(data,colors,owned,x,y,glyph,color,glyphEnabled,preview)
         if tool == ToolType.RECTEMPTY:
             for x in range(fax,fbx+1):
-                self._placeGlyph(data,colors,x,fay,glyph,color,glyphEnabled,preview)
-                self._placeGlyph(data,colors,x,fby,glyph,color,glyphEnabled,preview)
+                self._placeGlyph(data,colors,owned,x,fay,glyph,color,glyphEnabled,preview)
+                self._placeGlyph(data,colors,owned,x,fby,glyph,color,glyphEnabled,preview)
             for y in range(fay,fby+1):
-                self._placeGlyph(data,colors,fax,y,glyph,color,glyphEnabled,preview)
-                self._placeGlyph(data,colors,fbx,y,glyph,color,glyphEnabled,preview)
+                self._placeGlyph(data,colors,owned,fax,y,glyph,color,glyphEnabled,preview)
+                self._placeGlyph(data,colors,owned,fbx,y,glyph,color,glyphEnabled,preview)
         self.changed.emit()
         return True
 
     def placeGlyph(self,x,y,glyph:str,color:ttk.TTkColor,glyphEnabled=True,preview=False):
-        if preview:
-            data   = [_r.copy() for _r in self._data]
-            colors = [_r.copy() for _r in self._colors]
-            self._preview = {'data':data,'colors':colors}
-        else:
-            self._snapVersion += 1
-            self._preview = None
-            data   = self._data
-            colors = self._colors
+        data,colors,owned = self._target(preview)
 
         self.changed.emit()
-        return self._placeGlyph(data,colors,x,y,glyph,color,glyphEnabled,preview)
+        return self._placeGlyph(data,colors,owned,x,y,glyph,color,glyphEnabled,preview)
 
-    def _placeGlyph(self,data,colors,x,y,glyph:str,color:ttk.TTkColor,glyphEnabled=True,preview=False):
+    def _placeGlyph(self,data,colors,owned,x,y,glyph:str,color:ttk.TTkColor,glyphEnabled=True,preview=False):
         ox,oy = self._offset
         w,h = self._size
 
         if 0<=x<w and 0<=y<h:
+            drow,crow = _writableRow(data,colors,owned,oy+y)
             if glyphEnabled:
                 color = color if glyph != ' ' else color.background()
                 color = color if color else ttk.TTkColor.RST
-                data[  oy+y][ox+x] = glyph
-                colors[oy+y][ox+x] = color
+                drow[ox+x] = glyph
+                crow[ox+x] = color
             else:
-                glyph = data[  oy+y][ox+x]
-                oc = colors[oy+y][ox+x]
+                glyph = drow[ox+x]
+                oc = crow[ox+x]
                 nc = color
                 if glyph==' ':
                     if oc.hasBackground():
-                        colors[oy+y][ox+x] = oc.background()
+                        crow[ox+x] = oc.background()
                 else:
                     fg = nc.foreground() if nc.hasForeground()                        else oc.foreground()
                     bg = nc.background() if nc.hasBackground() and oc.hasBackground() else oc.background() if oc.hasBackground() else fg
                     color = fg+bg
-                    colors[oy+y][ox+x] = color
+                    crow[ox+x] = color
             return True
         return False
 
@@ -516,28 +535,21 @@ class CanvasLayer():
         x-=dw//2
         y-=dh//2
 
-        if preview:
-            data   = [_r.copy() for _r in self._data]
-            colors = [_r.copy() for _r in self._colors]
-            self._preview = {'data':data,'colors':colors}
-        else:
-            self._snapVersion += 1
-            self._preview = None
-            data   = self._data
-            colors = self._colors
+        data,colors,owned = self._target(preview)
 
         for _y,(darow,carow) in enumerate(zip(darea,carea),oy+y):
             for _x,(da,ca)   in enumerate(zip(darow,carow),ox+x):
                 if 0<=_x<w and 0<=_y<h and ( da!=' ' or ca.hasBackground()):
+                    drow,crow = _writableRow(data,colors,owned,_y)
                     if not transparent or (da==' ' and ca._bg):
-                        data[_y][_x]   = da
-                        colors[_y][_x] = ca
+                        drow[_x] = da
+                        crow[_x] = ca
                     elif da!=' ':
-                        data[_y][_x]   = da
-                        cc = colors[_y][_x]
+                        drow[_x] = da
+                        cc = crow[_x]
                         newC = ca.copy()
                         newC._bg = ca._bg if ca._bg else cc._bg
-                        colors[_y][_x] = newC
+                        crow[_x] = newC
 
         self.changed.emit()
 
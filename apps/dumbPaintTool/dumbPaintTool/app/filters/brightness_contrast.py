@@ -89,7 +89,8 @@ class BrightnessContrast(ttk.TTkWindow):
         self._colorCopy2 = [r.copy() for r in self._colorCopy]
     def _pushChanges(self):
         self._canvasLayer._preview = None
-        self._canvasLayer._colors = self._colorCopy2
+        # The rows may be shared with the snapshots, push a copy
+        self._canvasLayer._colors = [r.copy() for r in self._colorCopy2]
         self._canvasLayer.update()
 
     @ttk.pyTTkSlot(int)
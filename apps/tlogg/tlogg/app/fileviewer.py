@@ -22,27 +22,71 @@
 
 __all__ = ['FileViewer','FileViewerSearch','FileViewerArea']
 
+import re
+from bisect import bisect_left
+
 import TermTk as ttk
 
 from tlogg import TloggHelper, tloggProxy
 
 from . import TloggCfg
 
+def _compileHighlighters(colors):
+    '''
+    Return a function returning the index of the first highlighter
+    matching the text, None if no one matches.
+
+    The patterns are merged in a single regex, each alternative looks ahead
+    from the start of the line for its pattern so the rules keep their priority.
+    The line is still scanned once per rule in the worst case,
+    the merge only saves the per rule search calls.
+    '''
+    def _match(text):
+        for i,color in enumerate(colors):
+            if re.search(color['pattern'], text, re.IGNORECASE if color['ignorecase'] else 0):
+                return i
+        return None
+    if not colors:
+        return lambda text: None
+    try:
+        # The patterns including groups may use backreferences and
+        # the global inline flags (i.e. "(?x)") would apply to all the rules,
+        # those are not preserved by the merge
+        if any((rc := re.compile(color['pattern'])).groups or rc.flags & ~re.UNICODE
+               for color in colors):
+            return _match
+        rr = re.compile('|'.join(
+                f"(?=(?s:.*?)(?P<_hl{i}>(?{'i' if color['ignorecase'] else ''}:{color['pattern']})))"
+                for i,color in enumerate(colors)))
+    except re.error:
+        return _match
+    def _matchMerged(text):
+        if m := rr.match(text):
+            return int(m.lastgroup[3:])
+        return None
+    return _matchMerged
+
 class FileViewer(ttk.TTkAbstractScrollView):
     __slots__ = (
         '_fileBuffer', '_indexesMark', '_indexesSearched',
-        '_selected', '_indexing', '_searchRe',
-        '_selection', '_pressed'
+        '_selected', '_indexing', '_searchRe', '_searching',
+        '_selection', '_pressed',
+        '_lineCache', '_hlColors', '_hlMatch',
         # Signals
         'selected', 'marked')
     def __init__(self, *args, **kwargs):
         self._indexesMark = []
         self._indexesSearched = []
         self._indexing = None
+        self._searching = None
         self._selected = -1
         self._selection = None
         self._pressed = False
         self._searchRe = ""
+        # Colorized lines, (lineNum, selection, searchRe) -> (line, color)
+        self._lineCache = {}
+        self._hlColors = None
+        self._hlMatch = None
         # Signals
         self.selected = ttk.pyTTkSignal(int)
         self.marked = ttk.pyTTkSignal(list)
@@ -79,6 +123,43 @@ class FileViewer(ttk.TTkAbstractScrollView):
         self._indexesSearched = indexes
         self.viewChanged.emit()
 
+    def appendSearchedIndexes(self, indexes):
+        # The search results are received in order
+        self._indexesSearched += indexes
+        self.viewChanged.emit()
+
+    def truncateSearchedIndexes(self, line):
+        # Drop the results from line, those are searched again
+        del self._indexesSearched[bisect_left(self._indexesSearched, line):]
+        self.viewChanged.emit()
+
+    @ttk.pyTTkSlot(int)
+    def fileAppended(self, firstLine):
+        # Keep following the tail if the previous last line was visible
+        ox,oy = self.getViewOffsets()
+        h = self.height()
+        if oy+h > firstLine:
+            self.viewMoveTo(ox, max(0, self.getLen()-h))
+        self._lineCache.clear()
+        self.viewChanged.emit()
+
+    @ttk.pyTTkSlot()
+    def fileReloaded(self):
+        self._lineCache.clear()
+        self._selected = -1
+        self._selection = None
+        ox,_ = self.getViewOffsets()
+        self.viewMoveTo(ox, 0)
+        self.viewChanged.emit()
+
+    def searchProgress(self, progress):
+        self._searching = progress if progress < 1.0 else None
+        self.update()
+
+    def _isSearched(self, lineNum):
+        i = bisect_left(self._indexesSearched, lineNum)
+        return i < len(self._indexesSearched) and self._indexesSearched[i] == lineNum
+
     def searchRe(self, searchRe):
         self._searchRe = searchRe
         self.update()
@@ -159,17 +240,64 @@ class FileViewer(ttk.TTkAbstractScrollView):
     def getLineNum(self, num) -> int:
         return num
 
+    def _colorizedLine(self, num):
+        if num == self._selected:
+            selection = 1
+        elif self._selection and min(self._selection) <= num <= max(self._selection):
+            selection = 2
+        else:
+            selection = 0
+        key = (self.getLineNum(num), selection, self._searchRe)
+        # LRU, the most recent lines are moved to the end
+        if (ret := self._lineCache.pop(key, None)) is None:
+            ret = self._colorizeLine(num, selection)
+            if len(self._lineCache) >= max(0x40, 4*self.height()):
+                self._lineCache.pop(next(iter(self._lineCache)))
+        self._lineCache[key] = ret
+        return ret
+
+    def _colorizeLine(self, num, selection):
+        line = ttk.TTkString(self.getLine(num).replace('\n','')).tab2spaces()
+        if selection == 1:
+            selectedColor = ttk.TTkColor.bg("#008844")
+            searchedColor = ttk.TTkColor.fg("#FFFF00")+ttk.TTkColor.bg("#004400")
+            line = line.setColor(selectedColor)
+        elif selection == 2:
+            selectedColor = ttk.TTkColor.bg("#008888")
+            searchedColor = ttk.TTkColor.fg("#FFFF00")+ttk.TTkColor.bg("#004400")
+            line = line.setColor(selectedColor)
+        else:
+            selectedColor = ttk.TTkColor.RST
+            searchedColor = ttk.TTkColor.fg("#000000")+ttk.TTkColor.bg("#AAAAAA")
+            # Check in the filters a matching color
+            if (i := self._hlMatch(line._text)) is not None:
+                color = TloggCfg.colors[i]
+                selectedColor = ttk.TTkColor.fg(color['fg'])+ttk.TTkColor.bg(color['bg'])
+                searchedColor = ttk.TTkColor.fg(color['bg'])+ttk.TTkColor.bg(color['fg'])
+                line = line.setColor(selectedColor)
+        if self._searchRe:
+            if m := line.findall(regexp=self._searchRe, ignoreCase=True):
+                for match in m:
+                    line = line.setColor(searchedColor, match=match)
+        return line, selectedColor
+
     def paintEvent(self, canvas):
+        # The highlighters are replaced as a whole when edited
+        if self._hlColors is not TloggCfg.colors:
+            self._hlColors = TloggCfg.colors
+            self._hlMatch = _compileHighlighters(self._hlColors)
+            self._lineCache.clear()
         ox,oy = self.getViewOffsets()
         bufferLen = self.getLen()
+        lenLineNumber = len(str(self.getLineNum(bufferLen-1))) if bufferLen else 1
         for i in range(min(self.height(),bufferLen-oy)):
-            line = ttk.TTkString(self.getLine(i+oy).replace('\n','')).tab2spaces()
+            line, selectedColor = self._colorizedLine(i+oy)
             lineNum = self.getLineNum(i+oy)
             if lineNum in self._indexesMark:
                 symbolcolor = ttk.TTkColor.fg("#00ffff")
                 numberColor = ttk.TTkColor.bg("#444444")
                 symbol='❥'
-            elif lineNum in self._indexesSearched:
+            elif self._isSearched(lineNum):
                 symbolcolor = ttk.TTkColor.fg("#ff0000")
                 numberColor = ttk.TTkColor.bg("#444444")
                 symbol='●'
@@ -178,32 +306,7 @@ class FileViewer(ttk.TTkAbstractScrollView):
                 numberColor = ttk.TTkColor.bg("#444444")
                 symbol='○'
 
-            if i+oy == self._selected:
-                selectedColor = ttk.TTkColor.bg("#008844")
-                searchedColor = ttk.TTkColor.fg("#FFFF00")+ttk.TTkColor.bg("#004400")
-                line = line.setColor(selectedColor)
-            elif self._selection and min(self._selection) <= i+oy <= max(self._selection):
-                selectedColor = ttk.TTkColor.bg("#008888")
-                searchedColor = ttk.TTkColor.fg("#FFFF00")+ttk.TTkColor.bg("#004400")
-                line = line.setColor(selectedColor)
-            else:
-                selectedColor = ttk.TTkColor.RST
-                searchedColor = ttk.TTkColor.fg("#000000")+ttk.TTkColor.bg("#AAAAAA")
-                # Check in the filters a matching color
-                for color in TloggCfg.colors:
-                    #TTkLog.debug(f"{color['pattern']} - {line}")
-                    if m := line.findall(regexp=color['pattern'], ignoreCase=color['ignorecase']):
-                        selectedColor = ttk.TTkColor.fg(color['fg'])+ttk.TTkColor.bg(color['bg'])
-                        searchedColor = ttk.TTkColor.fg(color['bg'])+ttk.TTkColor.bg(color['fg'])
-                        line = line.setColor(selectedColor)
-                        break
-            if self._searchRe:
-                if m := line.findall(regexp=self._searchRe, ignoreCase=True):
-                    for match in m:
-                        line = line.setColor(searchedColor, match=match)
-
             # Add Line Number
-            lenLineNumber = len(str(self.getLineNum(bufferLen-1)))
             lineNumber = ttk.TTkString() + numberColor + str(lineNum).rjust(lenLineNumber) + ttk.TTkColor.RST + ' '
             # Compose print line
             printLine = ttk.TTkString() + symbolcolor + symbol + ttk.TTkColor.RST + ' ' + lineNumber + line.substring(ox)
@@ -214,11 +317,14 @@ class FileViewer(ttk.TTkAbstractScrollView):
         # Draw the loading banner
         if self._indexing is not None:
             canvas.drawText(pos=(0,0), text=f" [ Indexed: {int(100*self._indexing)}% ] ")
+        elif self._searching is not None:
+            canvas.drawText(pos=(0,0), text=f" [ Searching: {int(100*self._searching)}% ] ")
 
 class FileViewerSearch(FileViewer):
-    __slots__ = ('_indexes')
+    __slots__ = ('_indexes', '_lineSelected')
     def __init__(self, *args, **kwargs):
         self._indexes = []
+        self._lineSelected = -1
         FileViewer.__init__(self, *args, **kwargs)
         self._name = kwargs.get('name' , 'FileViewerSearch' )
 
@@ -238,22 +344,46 @@ class FileViewerSearch(FileViewer):
 
         self._indexesSearched = indexes
         self._indexes = [i for i in sorted(set(self._indexesSearched+self._indexesMark))]
+        self._selected = -1
+        self._lineSelected = lineSelected
         ox,_ = self.getViewOffsets()
+        self.viewMoveTo(ox, 0)
+        self._moveToLineSelected()
+        self.update()
+
+    def appendSearchedIndexes(self, indexes):
+        # The new results follow the previous ones,
+        # only the marked lines may need to be merged
+        self._indexesSearched += indexes
+        pos = bisect_left(self._indexes, indexes[0])
+        self._indexes[pos:] = sorted(set(self._indexes[pos:]+indexes))
+        self._moveToLineSelected()
+        self.viewChanged.emit()
 
-        lineToMove = 0
-        if lineSelected > -1:
-            for i, lineNum in enumerate(self._indexes):
-                if lineNum >= lineSelected:
-                   if lineNum == lineSelected:
-                       self._selected = i
-                   else:
-                       self._selected = -1
-                   # Try to keep the  selected area at the center of the widget
-                   lineToMove = i if i <= self.height()/2 else int(i-self.height()/2)
-                   break
+    @ttk.pyTTkSlot(int)
+    def fileAppended(self, firstLine):
+        # The results are extended by the incremental search
+        self._lineCache.clear()
+        self.viewChanged.emit()
 
+    def truncateSearchedIndexes(self, line):
+        del self._indexesSearched[bisect_left(self._indexesSearched, line):]
+        pos = bisect_left(self._indexes, line)
+        self._indexes[pos:] = sorted(set(_m for _m in self._indexesMark if _m >= line))
+        self.viewChanged.emit()
+
+    def _moveToLineSelected(self):
+        # Scroll to the line selected before the search, once reached by the results
+        lineSelected = self._lineSelected
+        if lineSelected == -1 or not self._indexes or self._indexes[-1] < lineSelected:
+            return
+        self._lineSelected = -1
+        i = bisect_left(self._indexes, lineSelected)
+        self._selected = i if self._indexes[i] == lineSelected else -1
+        # Try to keep the  selected area at the center of the widget
+        lineToMove = i if i <= self.height()/2 else int(i-self.height()/2)
+        ox,_ = self.getViewOffsets()
         self.viewMoveTo(ox, lineToMove)
-        self.update()
 
     def viewFullAreaSize(self) -> (int, int):
         if self._indexes is None:
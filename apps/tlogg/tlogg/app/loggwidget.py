@@ -30,9 +30,9 @@ from .fileviewer  import FileViewer, FileViewerArea, FileViewerSearch
 from .predefinedfilters import PredefinedFilters
 
 class LoggWidget(ttk.TTkSplitter):
-    __slots__ = ('_btn_filters', '_bls_label_1', '_bls_cb_icase', '_bls_search', '_bls_searchbox',
+    __slots__ = ('_btn_filters', '_bls_label_1', '_bls_cb_icase', '_bls_search', '_bls_searchbox', '_bls_cb_follow',
                  '_topViewport', '_bottomViewport',
-                 '_fileBuffer')
+                 '_fileBuffer', '_searchParams', '_searchRunning', '_searchPending')
     def __init__(self, filename, *args, **kwargs):
         super().__init__(*args, **kwargs|{'orientation':ttk.TTkK.VERTICAL})
 
@@ -46,6 +46,7 @@ class LoggWidget(ttk.TTkSplitter):
         self._bls_label_1   = ttk.TTkLabel(text=" Txt:", maxWidth=5)
         self._bls_cb_icase  = ttk.TTkCheckbox(text="Aa", maxWidth=5, checked=True)
         self._bls_search    = ttk.TTkButton(text="Search", maxWidth=10)
+        self._bls_cb_follow = ttk.TTkCheckbox(text="Follow", maxWidth=9)
         self._bls_searchbox = ttk.TTkComboBox(editable=True)
         self._bls_searchbox.addItems(TloggCfg.searches)
         self._bls_searchbox.setCurrentIndex(0)
@@ -55,6 +56,7 @@ class LoggWidget(ttk.TTkSplitter):
         bottomLayoutSearch.addWidget(self._bls_searchbox)
         bottomLayoutSearch.addWidget(self._bls_cb_icase)
         bottomLayoutSearch.addWidget(self._bls_search)
+        bottomLayoutSearch.addWidget(self._bls_cb_follow)
 
         bottomFrame.layout().addItem(bottomLayoutSearch)
 
@@ -67,6 +69,15 @@ class LoggWidget(ttk.TTkSplitter):
         # Define the Search Viewer
         self._bottomViewport = FileViewerSearch(filebuffer=self._fileBuffer)
         bottomViewer = FileViewerArea(parent=bottomFrame, fileView=self._bottomViewport)
+        self._searchParams = None
+        self._searchRunning = False
+        self._searchPending = None
+        self._fileBuffer.searchUpdated.connect(self._searchUpdated)
+        self._fileBuffer.searched.connect(self._searched)
+        # Follow mode
+        self._fileBuffer.appended.connect(self._fileAppended)
+        self._fileBuffer.reloaded.connect(self._fileReloaded)
+        self._bls_cb_follow.toggled.connect(self._fileBuffer.setFollow)
         self._bottomViewport.selected.connect(self._topViewport.selectAndMove)
         self._bottomViewport.marked.connect(self._topViewport.markIndexes)
         self._topViewport.marked.connect(self._bottomViewport.markIndexes)
@@ -87,11 +98,16 @@ class LoggWidget(ttk.TTkSplitter):
     def _search(self):
         searchtext = str(self._bls_searchbox.currentText())
         ttk.TTkLog.debug(f"{searchtext=}")
-        indexes = self._fileBuffer.searchRe(searchtext, ignoreCase=self._bls_cb_icase.checkState() == ttk.TTkK.Checked)
-        self._bottomViewport.searchedIndexes(indexes)
+        self._bottomViewport.searchedIndexes([])
         self._bottomViewport.searchRe(searchtext)
-        self._topViewport.searchedIndexes(indexes)
+        self._topViewport.searchedIndexes([])
         self._topViewport.searchRe(searchtext)
+        # The results are collected in _searchUpdated,
+        # a new search cancels the previous one
+        self._searchParams = (searchtext, self._bls_cb_icase.checkState() == ttk.TTkK.Checked)
+        self._searchRunning = True
+        self._searchPending = None
+        self._fileBuffer.searchReAsync(*self._searchParams)
         if TloggCfg.searches:
             x = set(TloggCfg.searches)
             ttk.TTkLog.debug(f"{x}")
@@ -104,3 +120,52 @@ class LoggWidget(ttk.TTkSplitter):
         self._bls_searchbox.clear()
         self._bls_searchbox.addItems(TloggCfg.searches)
         self._bls_searchbox.setCurrentIndex(0)
+
+    @ttk.pyTTkSlot(int)
+    def _searched(self, searchId):
+        # The id of the latest search is assigned before its thread starts,
+        # a short search may report before searchReAsync returns
+        if searchId != self._fileBuffer.searchId(): return
+        self._searchRunning = False
+        # Search the lines appended during the previous search
+        if self._searchPending is not None:
+            self._searchFrom(self._searchPending)
+
+    def _searchFrom(self, line):
+        self._searchPending = None
+        self._searchRunning = True
+        self._bottomViewport.truncateSearchedIndexes(line)
+        self._topViewport.truncateSearchedIndexes(line)
+        searchtext, icase = self._searchParams
+        self._fileBuffer.searchReAsync(searchtext, ignoreCase=icase, fromLine=line)
+
+    @ttk.pyTTkSlot(int)
+    def _fileAppended(self, firstLine):
+        self._topViewport.fileAppended(firstLine)
+        self._bottomViewport.fileAppended(firstLine)
+        if self._searchParams is None: return
+        # Only the appended lines are searched
+        if self._searchRunning:
+            self._searchPending = firstLine if self._searchPending is None else min(self._searchPending, firstLine)
+        else:
+            self._searchFrom(firstLine)
+
+    @ttk.pyTTkSlot()
+    def _fileReloaded(self):
+        self._topViewport.fileReloaded()
+        self._bottomViewport.fileReloaded()
+        if self._searchParams is None: return
+        # The whole file is searched again
+        self._bottomViewport.searchedIndexes([])
+        self._topViewport.searchedIndexes([])
+        self._searchFrom(0)
+
+    @ttk.pyTTkSlot(int, list, float)
+    def _searchUpdated(self, searchId, indexes, progress):
+        # The id of the latest search is assigned before its thread starts,
+        # a short search may report before searchReAsync returns
+        if searchId != self._fileBuffer.searchId(): return
+        self._bottomViewport.searchProgress(progress)
+        if indexes:
+            self._bottomViewport.appendSearchedIndexes(indexes)
+            self._topViewport.appendSearchedIndexes(indexes)
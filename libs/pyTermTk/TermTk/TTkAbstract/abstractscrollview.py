@@ -204,7 +204,7 @@ class TTkAbstractScrollView(TTkContainer, TTkAbstractScrollViewInterface):
         return self._viewOffsetX, self._viewOffsetY
 
     def wheelEvent(self, evt:TTkMouseEvent) -> bool:
-        delta = TTkCfg.scrollDelta
+        delta = TTkCfg.scrollDelta * evt.delta
         offx, offy = self.getViewOffsets()
         if evt.evt == TTkK.WHEEL_Up:
             self.viewMoveTo(offx, offy - delta)
@@ -119,13 +119,15 @@ class TTkAbstractTableModel():
 
     :py:class:`TTkTableModelCSV` subclass of :py:class:`TTkTableModelList` including the api to import csv data
 
+    :py:class:`TTkTableModelCSVStream` subclass of :py:class:`TTkAbstractTableModel` indexing and parsing large csv files on demand
+
     :py:class:`TTkTableModelSQLite3` subclass of :py:class:`TTkTableModelList` including support for `sqlite3 <https://www.sqlite.org>`__ databases
 
     '''
 
     __slots__ = (
         # Signals
-        'dataChanged', 'modelChanged'
+        'dataChanged', 'modelChanged', 'rowsInserted'
     )
 
     dataChanged:pyTTkSignal
@@ -148,9 +150,21 @@ class TTkAbstractTableModel():
 
         When the model topology changes, this signal must be emitted explicitly.
     '''
+    rowsInserted:pyTTkSignal
+    '''
+        This signal is emitted after rows have been inserted into the model,
+        it allows the views to extend their layout without a full refresh.
+
+        :param row: the position of the first inserted row
+        :type row: int
+
+        :param count: the number of inserted rows
+        :type count: int
+    '''
     def __init__(self):
         self.dataChanged = pyTTkSignal(tuple[int,int],tuple[int,int])
         self.modelChanged = pyTTkSignal()
+        self.rowsInserted = pyTTkSignal(int,int)
 
     def rowCount(self) -> int:
         '''
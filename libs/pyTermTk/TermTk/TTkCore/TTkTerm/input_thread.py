@@ -79,29 +79,54 @@ class TTkInput:
         if TTkInput._readInput:
             TTkInput._readInput.cont()
 
+    @staticmethod
+    def _mergeMouseEvents(mevt:TTkMouseEvent, nextMevt:TTkMouseEvent) -> TTkMouseEvent:
+        '''
+        Return the single event replacing two consecutive mouse events,
+        or None if they cannot be merged.
+
+        Only the last of consecutive Move/Drag events is relevant,
+        consecutive wheel steps at the same position are accumulated in the delta.
+        '''
+        if ( mevt.key != nextMevt.key or
+             mevt.evt != nextMevt.evt or
+             mevt.mod != nextMevt.mod ):
+            return None
+        if mevt.evt in (TTkK.Move, TTkK.Drag):
+            return nextMevt
+        if mevt.key == TTkK.Wheel and mevt.pos() == nextMevt.pos():
+            nextMevt.delta += mevt.delta
+            return nextMevt
+        return None
+
     @staticmethod
     def start() -> None:
         TTkInput._inputThread.start()
-        while inq := TTkInput._inputQueue.get():
+        inputQueue = TTkInput._inputQueue
+        inq = inputQueue.get()
+        while inq:
             kevt,mevt,paste = inq
 
-            # Try to filter out the queued moved mouse events
+            # Coalesce the mouse events already queued,
+            # the first one that cannot be merged is processed in the next iteration
+            fetched = False
             while (not kevt and
                    not paste and
-                   mevt and mevt.evt == TTkK.Drag and
-                   not TTkInput._inputQueue.empty() ):
-                mevtOld = mevt
-                kevt, mevt, paste = TTkInput._inputQueue.get()
-                if (kevt  or
-                    paste or
-                    mevt and mevt.evt != TTkK.Drag):
-                    TTkInput.inputEvent.emit(kevt, mevtOld)
+                   mevt and
+                   not inputQueue.empty() ):
+                inq = inputQueue.get()
+                if ( not inq or inq[0] or inq[2] or not inq[1] or
+                     (merged := TTkInput._mergeMouseEvents(mevt, inq[1])) is None ):
+                    fetched = True
                     break
+                mevt = merged
 
             if kevt or mevt:
                 TTkInput.inputEvent.emit(kevt, mevt)
             if paste:
                 TTkInput.pasteEvent.emit(paste)
+            if not fetched:
+                inq = inputQueue.get()
         TTkLog.debug("Close TTkInput")
 
     @staticmethod
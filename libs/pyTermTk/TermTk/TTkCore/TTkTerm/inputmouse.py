@@ -59,6 +59,11 @@ class TTkMouseEvent:
 
         The number of tap (keypressed) reported in this event, (i.e. a **doubleclick** is reported as tap=2)
 
+    .. py:attribute:: delta
+        :type: int
+
+        The number of wheel steps merged in this event, (i.e. a fast scroll of 3 wheel steps is reported as delta=3)
+
     .. py:attribute:: raw
         :type: str
 
@@ -85,8 +90,8 @@ class TTkMouseEvent:
     Left    = TTkK.WHEEL_Left
     Right   = TTkK.WHEEL_Right
 
-    __slots__ = ('x', 'y', 'key', 'evt', 'mod', 'tap', 'raw')
-    def __init__(self, x: int, y: int, key: int, evt: int, mod: int, tap: int, raw: str):
+    __slots__ = ('x', 'y', 'key', 'evt', 'mod', 'tap', 'raw', 'delta')
+    def __init__(self, x: int, y: int, key: int, evt: int, mod: int, tap: int, raw: str, delta: int = 1):
         self.x = x
         self.y = y
         self.key = key
@@ -94,6 +99,7 @@ class TTkMouseEvent:
         self.mod = mod
         self.raw = raw
         self.tap = tap
+        self.delta = delta
 
     def pos(self) -> tuple[int,int]:
         '''
@@ -107,7 +113,7 @@ class TTkMouseEvent:
     def clone(self, pos=None, evt=None):
         x,y = pos or (self.x, self.y)
         evt = evt or self.evt
-        return TTkMouseEvent(x, y, self.key, evt, self.mod, self.tap, self.raw)
+        return TTkMouseEvent(x, y, self.key, evt, self.mod, self.tap, self.raw, self.delta)
 
     def key2str(self):
         return {
@@ -146,4 +152,4 @@ class TTkMouseEvent:
         return "NONE!!!"
 
     def __str__(self):
-        return f"MouseEvent ({self.x},{self.y}) {self.key2str()} {self.evt2str()} {self.mod2str()} tap:{self.tap} - {self.raw}"
+        return f"MouseEvent ({self.x},{self.y}) {self.key2str()} {self.evt2str()} {self.mod2str()} tap:{self.tap} delta:{self.delta} - {self.raw}"
@@ -33,6 +33,9 @@ class TTkTermBase():
     SET_BRACKETED_PM   = "\033[?2004h" # Ps = 2 0 0 4  ⇒  Set bracketed paste mode, xterm.
     RESET_BRACKETED_PM = "\033[?2004l" # Ps = 2 0 0 4  ⇒  Reset bracketed paste mode, xterm.
 
+    BEGIN_SYNC_UPDATE = "\033[?2026h" # Ps = 2 0 2 6  ⇒  Begin Synchronized Output
+    END_SYNC_UPDATE   = "\033[?2026l" # Ps = 2 0 2 6  ⇒  End Synchronized Output
+
     class Mouse(str):
         ON         = "\033[?1002h\033[?1006h" # Enable reporting of mouse position on click and release
         OFF        = "\033[?1002l\033[?1006l" # Disable mouse reporting
@@ -91,8 +94,13 @@ class TTkTermBase():
     mouse: bool = True
     directMouse: bool = False
 
+    syncOutput: bool = False
+
     _sigWinChCb = None
 
+    _frameBuffer = None
+    _framePush = None
+
     @staticmethod
     def init(title: str = "TermTk", sigmask=0) -> None:
         TTkTermBase.title = title
@@ -147,11 +155,50 @@ class TTkTermBase():
         else:
             return f'\033]0;{tt}{txt}\a'
 
+    @staticmethod
+    def setSyncOutput(sync:bool=True) -> None:
+        '''
+        Enable/Disable the synchronized output (DEC mode 2026),
+        terminals not supporting this mode ignore the markers
+        '''
+        TTkTermBase.syncOutput = sync
+
+    @staticmethod
+    def beginFrame() -> None:
+        '''
+        Collect all the following :py:meth:`push` in a single buffer,
+        the frame is written at once by :py:meth:`endFrame`
+        '''
+        if TTkTermBase._framePush is not None: return
+        buffer = TTkTermBase._frameBuffer = []
+        TTkTermBase._framePush = TTkTermBase.push
+        TTkTermBase.push = lambda *args: buffer.append(str(*args))
+
+    @staticmethod
+    def endFrame() -> int:
+        '''
+        Write the frame collected since :py:meth:`beginFrame`,
+        wrapped in the synchronized output markers (DEC mode 2026) if :py:attr:`syncOutput` is enabled
+
+        :return: the number of bytes written (utf-8)
+        :rtype: int
+        '''
+        if (push := TTkTermBase._framePush) is None: return 0
+        buffer = TTkTermBase._frameBuffer
+        TTkTermBase.push = push
+        TTkTermBase._framePush = TTkTermBase._frameBuffer = None
+        if not (data := ''.join(buffer)): return 0
+        if TTkTermBase.syncOutput:
+            data = TTkTermBase.BEGIN_SYNC_UPDATE + data + TTkTermBase.END_SYNC_UPDATE
+        TTkTermBase.pushFrame(data)
+        return len(data.encode())
+
     # NOTE: Due to "I have no idea how to do it in a better way",
     # those methods are supposed to be overwritten with the
     # compatible one in "term_unix.py" or "term_pyodide.py"
     setSigmask = lambda *args: None
     push       = lambda *args: None
+    pushFrame  = lambda *args: TTkTermBase.push(*args)
     flush      = lambda *args: None
     setEcho    = lambda *args: None
     CRNL       = lambda *args: None
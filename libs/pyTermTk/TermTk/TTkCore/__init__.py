@@ -7,6 +7,7 @@ from .helper   import *
 from .propertyanimation import *
 from .ttk      import *
 from .canvas   import *
+from .canvas_array import *
 from .color    import *
 from .shortcut import *
 from .string   import *
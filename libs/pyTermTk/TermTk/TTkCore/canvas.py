@@ -26,9 +26,37 @@ from TermTk.TTkCore.TTkTerm.term import TTkTerm
 from TermTk.TTkCore.constant import TTkK
 from TermTk.TTkCore.log import TTkLog
 from TermTk.TTkCore.cfg import TTkCfg
-from TermTk.TTkCore.color import TTkColor
+from TermTk.TTkCore.color import TTkColor, _TTkColor
 from TermTk.TTkCore.string import TTkString
 
+class _TTkCursorMotion():
+    '''
+    Track the terminal cursor while a frame is pushed
+    and return the shortest sequence required to move it
+    '''
+    __slots__ = ('y','x')
+    def __init__(self):
+        # None = unknown position (i.e. before the first move or after writing the last column)
+        self.y = self.x = None
+
+    def motion(self, y:int, x:int) -> str:
+        ''' Return the cheapest sequence that moves the cursor to the cell (**x**, **y**) '''
+        cy, cx = self.y, self.x
+        ret = TTkTerm.Cursor.moveTo(y+1,x+1)
+        if cx is None or y < cy:
+            return ret
+        if y == cy:
+            if x > cx: rel = TTkTerm.Cursor.moveRight(x-cx)
+            elif x < cx: rel = TTkTerm.Cursor.moveLeft(cx-x)
+            else: return ''
+            return rel if len(rel) < len(ret) else ret
+        down = TTkTerm.Cursor.moveDown(y-cy)
+        if   x > cx: down += TTkTerm.Cursor.moveRight(x-cx)
+        elif x < cx: down += TTkTerm.Cursor.moveLeft(cx-x)
+        # Carriage return + line feeds, they land on the first column of the target row
+        feed = '\r' + '\n'*(y-cy) + (TTkTerm.Cursor.moveRight(x) if x else '')
+        return min((ret,down,feed), key=len)
+
 class TTkCanvas():
     ''' Init the Canvas object
 
@@ -42,6 +70,7 @@ class TTkCanvas():
         '_data', '_colors',
         '_bufferedData', '_bufferedColors',
         '_visible', '_transparent', '_doubleBuffer')
+    _arrayBacked = False
     _data:list[list[str]]
     _colors:list[list[TTkColor]]
     def __init__(self,
@@ -630,6 +659,9 @@ class TTkCanvas():
         if bx+bw<0 or by+bh<0 or bx>=cw or by>=ch: return
         if x+w<=bx or y+h<=by or bx+bw<=x or by+bh<=y: return
 
+        if canvas._arrayBacked:
+            canvas = canvas.toCanvas()
+
         if (0,0,cw,ch)==geom==bound and (cw,ch)==canvas.size() and not canvas._transparent:
             # fast Copy
             # the canvas match exactly on top of the current one
@@ -728,39 +760,117 @@ class TTkCanvas():
         data, colors = self._data, self._colors
         oldData, oldColors = self._bufferedData, self._bufferedColors
         lastcolor = TTkColor.RST
-        empty = True
-        ansi = ""
+        cursor = _TTkCursorMotion()
         for y,(lda,ldb,lca,lcb) in enumerate(zip(data,oldData,colors,oldColors)):
-            for x,(da,db,ca,cb) in enumerate(zip(lda,ldb,lca,lcb)):
-                if da==db and ca==cb:
-                    if not empty:
-                        TTkTerm.push(ansi)
-                        empty=True
-                    continue
-                ch = da
-                color = ca
-                if empty:
-                    ansi = TTkTerm.Cursor.moveTo(y+1,x+1)
-                    empty = False
-                if color != lastcolor:
-                    ansi += color-lastcolor
-                    lastcolor = color
-                ansi+=ch
-            if not empty:
+            if lda == ldb and lca == lcb: continue
+            ansi, lastcolor = TTkCanvas._diffRow(cursor, y, 0, len(lda), lda, ldb, lca, lcb, lastcolor)
+            if ansi:
                 TTkTerm.push(ansi)
-                empty=True
         # Reset the color at the end
-        TTkTerm.push(TTkColor.RST-lastcolor)
+        TTkTerm.push(_TTkColor._transition(TTkColor.RST, lastcolor))
         # TTkTerm.flush()
         # Switch the buffer
         self._bufferedData, self._bufferedColors = data, colors
         self._data,         self._colors         = oldData, oldColors
 
+    @staticmethod
+    def _diffRow(cursor, y, xa, xb, lda, ldb, lca, lcb, lastcolor):
+        '''
+        Return the sequence that updates the changed cells of the row **y** in the span [**xa**, **xb**)
+        and the last color used.
+
+        The cursor is moved with the shortest sequence available,
+        short gaps of unchanged cells sharing the current color are written again
+        when they are cheaper than the cursor motion, merging the adjacent runs.
+        '''
+        ansi = []
+        w = len(lda)
+        for x in range(xa,xb):
+            da,ca = lda[x],lca[x]
+            # The tail of a wide char is drawn by its head
+            if not da or (da==ldb[x] and ca==lcb[x]):
+                continue
+            if cursor.x != x or cursor.y != y:
+                mv = cursor.motion(y,x)
+                cx = cursor.x
+                if ( cursor.y == y and cx is not None and 0 < x-cx < len(mv) and
+                     all(len(ch)==1 for ch in lda[cx:x]) and
+                     all(c == lastcolor for c in lca[cx:x]) ):
+                    gap = ''.join(lda[cx:x])
+                    if len(gap.encode()) < len(mv):
+                        mv = gap
+                ansi.append(mv)
+            if ca is not lastcolor and ca != lastcolor:
+                ansi.append(_TTkColor._transition(ca, lastcolor))
+                lastcolor = ca
+            ansi.append(da)
+            nx = x+2 if x+1<w and lda[x+1]=='' else x+1
+            # Writing the last column leaves the cursor in an undefined (pending wrap) state
+            cursor.y, cursor.x = y, (nx if nx<w else None)
+        return ''.join(ansi), lastcolor
+
+    @staticmethod
+    def _damageSpans(damage, w, h) -> dict:
+        '''
+            Convert a list of damaged rectangles (x,y,w,h)
+            in a dict of rows {y:[(xa,xb),...]} with sorted and merged spans
+        '''
+        rows = {}
+        for dx,dy,dw,dh in damage:
+            xa,xb = max(0,dx),min(w,dx+dw)
+            if xa >= xb: continue
+            for iy in range(max(0,dy),min(h,dy+dh)):
+                rows.setdefault(iy,[]).append((xa,xb))
+        for iy,spans in rows.items():
+            if len(spans) == 1: continue
+            spans.sort()
+            merged = [spans[0]]
+            for xa,xb in spans[1:]:
+                ma,mb = merged[-1]
+                if xa <= mb:
+                    merged[-1] = (ma,max(mb,xb))
+                else:
+                    merged.append((xa,xb))
+            rows[iy] = merged
+        return rows
+
+    def pushToTerminalDamage(self, damage=None):
+        ''' Push to the terminal only the cells changed inside the damaged areas
+
+        Unlike :py:meth:`pushToTerminalBuffered` the buffers are not swapped,
+        the current canvas is kept valid so the next frame can be composed partially on top of it.
+
+        :param damage: the list of (x,y,w,h) areas to be checked, defaults to None (the whole canvas)
+        :type damage: list[tuple[int,int,int,int]], optional
+        '''
+        data, colors = self._data, self._colors
+        oldData, oldColors = self._bufferedData, self._bufferedColors
+        w,h = self._width, self._height
+        if damage is None:
+            rows = {iy:[(0,w)] for iy in range(h)}
+        else:
+            rows = TTkCanvas._damageSpans(damage, w, h)
+        lastcolor = TTkColor.RST
+        cursor = _TTkCursorMotion()
+        for y in sorted(rows):
+            lda,ldb,lca,lcb = data[y],oldData[y],colors[y],oldColors[y]
+            for xa,xb in rows[y]:
+                if lda[xa:xb] == ldb[xa:xb] and lca[xa:xb] == lcb[xa:xb]:
+                    continue
+                ansi, lastcolor = TTkCanvas._diffRow(cursor, y, xa, xb, lda, ldb, lca, lcb, lastcolor)
+                if ansi:
+                    TTkTerm.push(ansi)
+                ldb[xa:xb] = lda[xa:xb]
+                lcb[xa:xb] = lca[xa:xb]
+        # Reset the color at the end
+        TTkTerm.push(_TTkColor._transition(TTkColor.RST, lastcolor))
+
     def pushToTerminalBufferedNew(self, x, y, w, h):
         # TTkLog.debug("pushToTerminal")
         data, colors = self._data, self._colors
         oldData, oldColors = self._bufferedData, self._bufferedColors
         lastcolor = TTkColor.RST
+        cursor = _TTkCursorMotion()
         empty = True
         ansi = ""
         for y,(lda,ldb,lca,lcb) in enumerate(zip(data,oldData,colors,oldColors)):
@@ -774,11 +884,12 @@ class TTkCanvas():
                         count = 0
                         chBk = ''
                         empty=True
+                        cursor.y, cursor.x = y, x
                     continue
                 ch = da
                 color = ca
                 if empty:
-                    ansi = ("" if not chBk else chBk*count if count<=4 else f"{chBk}\033[{count-1}b") + TTkTerm.Cursor.moveTo(y+1,x+1)
+                    ansi = ("" if not chBk else chBk*count if count<=4 else f"{chBk}\033[{count-1}b") + cursor.motion(y,x)
                     empty = False
                     count = 0
                     chBk = ''
@@ -799,6 +910,7 @@ class TTkCanvas():
                 ansi += "" if not chBk else chBk*count if count<=4 else f"{chBk}\033[{count-1}b"
                 TTkTerm.push(ansi)
                 empty=True
+                cursor.y = cursor.x = None
         # Reset the color at the end
         TTkTerm.push(TTkColor.RST)
         if lastcolor._link:
@@ -0,0 +1,430 @@
+# MIT License
+#
+# Copyright (c) 2025 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+__all__ = ['TTkCanvasArray']
+
+from array import array
+from threading import Lock
+from weakref import WeakSet
+
+from TermTk.TTkCore.TTkTerm.term import TTkTerm
+from TermTk.TTkCore.constant import TTkK
+from TermTk.TTkCore.cfg import TTkCfg
+from TermTk.TTkCore.color import TTkColor, _TTkColor
+from TermTk.TTkCore.string import TTkString
+from TermTk.TTkCore.canvas import TTkCanvas, _TTkCursorMotion
+
+class _TTkInternTable(dict):
+    '''
+    Map any hashable key to a stable index,
+    the index 0 is reserved to None (the transparent cell)
+
+    The indexes are stable until the table exceeds **_maxSize**,
+    then the unused ones are dropped by :py:func:`_compactTables`
+    '''
+    __slots__ = ('_values', '_mutex', '_maxSize')
+    def __init__(self, maxSize:int=0x10000):
+        self._values = [None]
+        self._mutex = Lock()
+        self._maxSize = maxSize
+        super().__init__({None:0})
+
+    def __missing__(self, key):
+        with self._mutex:
+            if (idx := self.get(key)) is None:
+                idx = self._add(key)
+        return idx
+
+    def _add(self, key) -> int:
+        # Called holding _mutex, the value is stored before publishing its index
+        idx = len(self._values)
+        self._values.append(key)
+        self[key] = idx
+        return idx
+
+    def _compact(self, used:set) -> list[int]:
+        '''Keep only the used indexes, return the map from the old to the new ones'''
+        remap = [0]*len(self._values)
+        values = [None]
+        for idx in sorted(used):
+            if idx:
+                remap[idx] = len(values)
+                values.append(self._values[idx])
+        self._values = values
+        self.clear()
+        self.update({v:i for i,v in enumerate(values)})
+        return remap
+
+class _TTkColorTable(_TTkInternTable):
+    '''
+    Colors are unhashable,
+    they are indexed through their rendering properties (the same key used by the color interning)
+    '''
+    __slots__ = ('_colors')
+    def __init__(self):
+        self._colors = [None]
+        super().__init__()
+
+    @staticmethod
+    def _key(color):
+        if color is None: return None
+        return color._internKey()
+
+    def index(self, color) -> int:
+        key = _TTkColorTable._key(color)
+        if (idx := self.get(key)) is not None:
+            return idx
+        with self._mutex:
+            if (idx := self.get(key)) is None:
+                self._colors.append(_TTkColor._intern(color))
+                idx = self._add(key)
+        return idx
+
+    def _compact(self, used:set) -> list[int]:
+        colors = self._colors
+        self._colors = [None]+[colors[idx] for idx in sorted(used) if idx]
+        return super()._compact(used)
+
+_glyphTable = _TTkInternTable()
+_colorTable = _TTkColorTable()
+# All the array canvases, their rows are remapped when the tables are compacted
+_canvases = WeakSet()
+
+def _compactTables():
+    '''
+    Drop the glyphs and colors no longer used by any array canvas
+
+    It is called at the beginning of a canvas update (:py:meth:`TTkCanvasArray.updateSize`/:py:meth:`TTkCanvasArray.clean`)
+    where no index is held outside the canvases
+    '''
+    canvases = list(_canvases)
+    for table, attrs in (
+            (_glyphTable, ('_data',   '_bufferedData')),
+            (_colorTable, ('_colors', '_bufferedColors'))):
+        with table._mutex:
+            # The same row is remapped only once
+            rows = {id(row):row for c in canvases for attr in attrs for row in (getattr(c, attr, None) or [])}
+            remap = table._compact(set().union(*rows.values()))
+            for row in rows.values():
+                row[:] = array('I', map(remap.__getitem__, row))
+            # Too many entries in use, the next compaction is postponed
+            table._maxSize = max(table._maxSize, 2*len(table._values))
+
+def _checkTables():
+    if len(_glyphTable._values) > _glyphTable._maxSize or len(_colorTable._values) > _colorTable._maxSize:
+        _compactTables()
+
+class TTkCanvasArray(TTkCanvas):
+    ''' Canvas backend storing the cells in compact arrays
+
+    Each row is an :py:class:`array` of glyph indexes and an :py:class:`array` of color indexes,
+    glyphs and colors are interned in tables shared by all the array canvases.
+    clean, fill and the composition (:py:meth:`paintCanvas`) between array canvases are slice copies.
+
+    It is used for the widgets' canvases if :py:class:`TTkCfg`.arrayCanvas is enabled.
+
+    :param width: the width of the Canvas
+    :type width: int
+    :param height: the height of the Canvas
+    :type height: int
+    '''
+    __slots__ = ('__weakref__',)
+    _arrayBacked = True
+    _data:list[array]
+    _colors:list[array]
+
+    def __init__(self, *args, **kwargs) -> None:
+        _canvases.add(self)
+        super().__init__(*args, **kwargs)
+
+    def _baseRows(self, w):
+        if self._transparent:
+            return array('I',[0])*w, array('I',[0])*w
+        return array('I',[_glyphTable[' ']])*w, array('I',[_colorTable.index(TTkColor.RST)])*w
+
+    def updateSize(self):
+        if not self._visible: return
+        w,h = self._newWidth, self._newHeight
+        if w  == self._width and h == self._height:
+            return
+        _checkTables()
+        baseData, baseColors = self._baseRows(w)
+        self._data   = [array('I',baseData)   for _ in range(h)]
+        self._colors = [array('I',baseColors) for _ in range(h)]
+        if self._doubleBuffer:
+            self._bufferedData   = [array('I',baseData)   for _ in range(h)]
+            self._bufferedColors = [array('I',baseColors) for _ in range(h)]
+        self._height = h
+        self._width  = w
+
+    def clean(self):
+        if not self._visible: return
+        _checkTables()
+        w = self._width
+        baseData, baseColors = self._baseRows(w)
+        # Reuse the current rows, no allocation is required
+        for row in self._data:
+            row[:] = baseData
+        for row in self._colors:
+            row[:] = baseColors
+
+    def copy(self):
+        ret = TTkCanvasArray()
+        ret._width = self._width
+        ret._height = self._height
+        ret._data, ret._colors = self.copyBuffers()
+        return ret
+
+    def copyBuffers(self):
+        retData   = [array('I',row) for row in self._data]
+        retColors = [array('I',row) for row in self._colors]
+        return retData, retColors
+
+    def toCanvas(self) -> TTkCanvas:
+        ''' Return a list backed :py:class:`TTkCanvas` copy of this canvas '''
+        ret = TTkCanvas()
+        ret._width  = self._width
+        ret._height = self._height
+        ret._newWidth  = self._width
+        ret._newHeight = self._height
+        ret._transparent = self._transparent
+        glyphs, colors = _glyphTable._values, _colorTable._colors
+        ret._data   = [[glyphs[i] for i in row] for row in self._data]
+        ret._colors = [[colors[i] for i in row] for row in self._colors]
+        return ret
+
+    def _set(self, _y, _x, _ch, _col=TTkColor.RST):
+        if 0 <= _y < self._height and \
+           0 <= _x < self._width  :
+            self._data[_y][_x] = _glyphTable[_ch]
+            self._colors[_y][_x] = _colorTable.index(_col.mod(_x,_y))
+
+    def fill(self, pos=(0,0), size=None, char=' ', color=TTkColor.RST):
+        w,h = self.size()
+        if not size:
+            size=(w,h)
+        fxa,fya = pos
+        fw,fh = size
+        fxb,fyb = fxa+fw, fya+fh
+        # the fill area is outside the boundaries
+        if ( fxa >= w or fya >= h or
+             fxb <= 0 or fyb <= 0): return
+
+        fxa = max(0,fxa)
+        fya = max(0,fya)
+        fxb = min(w,fxb)
+        fyb = min(h,fyb)
+
+        fillCh = array('I',[_glyphTable[char]])*(fxb-fxa)
+        for iy in range(fya,fyb):
+            self._data[iy][fxa:fxb] = fillCh
+        if color.colorType() & TTkK.ColorType.ColorModifier:
+            for iy in range(fya,fyb):
+                for ix in range(fxa,fxb):
+                    self._colors[iy][ix] = _colorTable.index(color.mod(fxa+ix,fya+iy))
+        else:
+            fillColor = array('I',[_colorTable.index(color)])*(fxb-fxa)
+            for iy in range(fya,fyb):
+                self._colors[iy][fxa:fxb] = fillColor
+
+    def _checkWideEdges(self, y, a, b):
+        # Check the full wide chars on the edge of the two canvasses
+        glyphs = _glyphTable._values
+        data, colors = self._data[y], self._colors[y]
+        cw = self._width
+        emptyCh  = _glyphTable['']
+        overflow = _colorTable.index(TTkString.unicodeWideOverflowColor)
+        if ((0 <= a < cw) and data[a]==emptyCh):
+            data[a]   = _glyphTable[TTkCfg.theme.unicodeWideOverflowCh[0]]
+            colors[a] = overflow
+        if ((0 < b <= cw) and glyphs[data[b-1]] and TTkString._isWideCharData(glyphs[data[b-1]])):
+            data[b-1]   = _glyphTable[TTkCfg.theme.unicodeWideOverflowCh[1]]
+            colors[b-1] = overflow
+        if ((0 < a <= cw) and glyphs[data[a-1]] and TTkString._isWideCharData(glyphs[data[a-1]])):
+            data[a-1]   = _glyphTable[TTkCfg.theme.unicodeWideOverflowCh[1]]
+            colors[a-1] = overflow
+        if ((0 <= b < cw) and data[b]==emptyCh):
+            data[b]   = _glyphTable[TTkCfg.theme.unicodeWideOverflowCh[0]]
+            colors[b] = overflow
+
+    def drawTTkString(self, pos, text, width=None, color=TTkColor.RST, alignment=TTkK.NONE, forceColor=False):
+        if not self._visible: return
+
+        # Check the size and bounds
+        x,y = pos
+        if y<0 or y>=self._height : return
+
+        lentxt = text.termWidth()
+        if width is None or width<0:
+            width = lentxt
+
+        if x+width<0 or x>=self._width : return
+
+        text = text.align(width=width, alignment=alignment, color=color)
+        txt, colors = text.tab2spaces().getData()
+        a,b = max(0,-x), min(len(txt),self._width-x)
+        self._data[y][x+a:x+b] = array('I',map(_glyphTable.__getitem__,txt[a:b]))
+        rowColors = self._colors[y]
+        if not forceColor:
+            if color != TTkColor.RST:
+                for i in range(a,b):
+                    rowColors[x+i] = _colorTable.index((colors[i] | color).mod(x+i,y))
+            else:
+                for i in range(a,b):
+                    rowColors[x+i] = _colorTable.index(colors[i].mod(x+i,y))
+        glyphs = _glyphTable._values
+        overflow = _colorTable.index(TTkString.unicodeWideOverflowColor)
+        data = self._data[y]
+        if ((0 <= (x+a) < self._width) and glyphs[data[x+a]] == ''):
+            data[x+a]      = _glyphTable[TTkCfg.theme.unicodeWideOverflowCh[0]]
+            rowColors[x+a] = overflow
+        if ((0 <= (x+b-1) < self._width) and TTkString._isWideCharData(glyphs[data[x+b-1]] or '')):
+            data[x+b-1]      = _glyphTable[TTkCfg.theme.unicodeWideOverflowCh[1]]
+            rowColors[x+b-1] = overflow
+
+    def paintCanvas(self, canvas, geom, _slice, bound):
+        x, y, w, h  = geom
+        bx,by,bw,bh = bound
+        cw,ch = self.size()
+        # out of bound
+        if not self._visible: return
+        if not canvas._visible: return
+        if canvas._width<=0 or canvas._height<=0: return
+        if bx+bw<0 or by+bh<0 or bx>=cw or by>=ch: return
+        if x+w<=bx or y+h<=by or bx+bw<=x or by+bh<=y: return
+
+        if canvas._arrayBacked:
+            srcData, srcColors = canvas._data, canvas._colors
+        else:
+            # Intern the list backed canvas rows
+            srcData   = [array('I',map(_glyphTable.__getitem__,row)) for row in canvas._data]
+            srcColors = [array('I',map(_colorTable.index,row))       for row in canvas._colors]
+
+        if (0,0,cw,ch)==geom==bound and (cw,ch)==canvas.size() and not canvas._transparent:
+            # fast Copy
+            for iy in range(h):
+                self._data[iy][:]   = srcData[iy]
+                self._colors[iy][:] = srcColors[iy]
+            return
+
+        x = min(x,cw-1)
+        y = min(y,ch-1)
+        w = min(w,cw-x)
+        h = min(h,ch-y)
+
+        xoffset = min(max(0,bx-x),canvas._width-1)
+        yoffset = min(max(0,by-y),canvas._height-1)
+        wslice = min(w if x+w < bx+bw else bx+bw-x,canvas._width)
+        hslice = min(h if y+h < by+bh else by+bh-y,canvas._height)
+
+        a, b = x+xoffset, x+wslice
+        if a >= b: return
+        if canvas._transparent:
+            for iy in range(yoffset,hslice):
+                src = srcData[iy][xoffset:wslice]
+                if 0 in src:
+                    dst = self._data[y+iy]
+                    for ix,cc in enumerate(src, a):
+                        if cc: dst[ix] = cc
+                else:
+                    self._data[y+iy][a:b] = src
+                src = srcColors[iy][xoffset:wslice]
+                if 0 in src:
+                    dst = self._colors[y+iy]
+                    for ix,cc in enumerate(src, a):
+                        if cc: dst[ix] = cc
+                else:
+                    self._colors[y+iy][a:b] = src
+        else:
+            for iy in range(yoffset,hslice):
+                self._data[y+iy][a:b]   = srcData[iy][xoffset:wslice]
+                self._colors[y+iy][a:b] = srcColors[iy][xoffset:wslice]
+
+        for iy in range(yoffset,hslice):
+            self._checkWideEdges(y+iy, a, b)
+
+    def toAnsi(self):
+        return self.toCanvas().toAnsi()
+
+    def pushToTerminal(self, x, y, w, h):
+        self.toCanvas().pushToTerminal(x, y, w, h)
+
+    def cleanBuffers(self):
+        if not self._visible: return
+        w,h = self._width, self._height
+        baseData   = array('I',[_glyphTable[' ']])*w
+        baseColors = array('I',[_colorTable.index(TTkColor.RST)])*w
+        self._bufferedData   = [array('I',baseData)   for _ in range(h)]
+        self._bufferedColors = [array('I',baseColors) for _ in range(h)]
+
+    def pushToTerminalDamage(self, damage=None):
+        data, colors = self._data, self._colors
+        oldData, oldColors = self._bufferedData, self._bufferedColors
+        glyphs, colorsTable = _glyphTable._values, _colorTable._colors
+        w,h = self._width, self._height
+        if damage is None:
+            rows = {iy:[(0,w)] for iy in range(h)}
+        else:
+            rows = TTkCanvas._damageSpans(damage, w, h)
+        lastcolor = TTkColor.RST
+        lastIdx = _colorTable.index(lastcolor)
+        emptyIdx = _glyphTable['']
+        cursor = _TTkCursorMotion()
+        for y in sorted(rows):
+            lda,ldb,lca,lcb = data[y],oldData[y],colors[y],oldColors[y]
+            for xa,xb in rows[y]:
+                if lda[xa:xb] == ldb[xa:xb] and lca[xa:xb] == lcb[xa:xb]:
+                    continue
+                ansi = []
+                for x in range(xa,xb):
+                    da,ca = lda[x],lca[x]
+                    if da==emptyIdx or (da==ldb[x] and ca==lcb[x]):
+                        continue
+                    if cursor.x != x or cursor.y != y:
+                        mv = cursor.motion(y,x)
+                        cx = cursor.x
+                        if ( cursor.y == y and cx is not None and 0 < x-cx < len(mv) and
+                             all(len(glyphs[g])==1 for g in lda[cx:x]) and
+                             all(c == lastIdx for c in lca[cx:x]) ):
+                            gap = ''.join([glyphs[g] for g in lda[cx:x]])
+                            if len(gap.encode()) < len(mv):
+                                mv = gap
+                        ansi.append(mv)
+                    if ca != lastIdx:
+                        color = colorsTable[ca]
+                        ansi.append(_TTkColor._transition(color, lastcolor))
+                        lastcolor, lastIdx = color, ca
+                    ansi.append(glyphs[da])
+                    nx = x+2 if x+1<w and lda[x+1]==emptyIdx else x+1
+                    cursor.y, cursor.x = y, (nx if nx<w else None)
+                if ansi:
+                    TTkTerm.push(''.join(ansi))
+                ldb[xa:xb] = lda[xa:xb]
+                lcb[xa:xb] = lca[xa:xb]
+        # Reset the color at the end
+        TTkTerm.push(_TTkColor._transition(TTkColor.RST, lastcolor))
+
+    def pushToTerminalBuffered(self, x, y, w, h):
+        self.pushToTerminalDamage()
+
+    def pushToTerminalBufferedNew(self, x, y, w, h):
+        self.pushToTerminalDamage()
@@ -35,6 +35,8 @@ class TTkCfg:
     maxFps:int = 65
     doubleBuffer:bool = True
     doubleBufferNew:bool = False
+    damageTracking:bool = True
+    arrayCanvas:bool = False
 
     scrollDelta:bool = 5
     theme = None
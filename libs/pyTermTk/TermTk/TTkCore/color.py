@@ -24,6 +24,9 @@ __all__ = ['TTkColor',
            'TTkColorModifier',
            'TTkColorGradient', 'TTkLinearGradient', 'TTkAlternateColor']
 
+from functools import lru_cache
+from threading import Lock
+
 from TermTk.TTkCore.TTkTerm.colors import TTkTermColor
 from TermTk.TTkCore.constant import TTkK
 from TermTk.TTkCore.helper import TTkHelper
@@ -63,10 +66,14 @@ from TermTk.TTkCore.helper import TTkHelper
 # [47m          --        set background color to white
 # [49m          2.53      set background color to default (black)
 
+# Guards the interned colors, the colors are created by any thread
+_internMutex = Lock()
+
 class _TTkColor:
-    __slots__ = ('_fg','_bg', '_colorMod', '_buffer', '_clean')
+    __slots__ = ('_fg','_bg', '_colorMod', '_buffer', '_clean', '_id')
     _fg: tuple[int]
     _bg: tuple[int]
+    _id: int
     def __init__(self,
                  fg:tuple[int]=None,
                  bg:tuple[int]=None,
@@ -77,16 +84,65 @@ class _TTkColor:
         self._clean = clean or not (fg or bg)
         self._colorMod = colorMod
         self._buffer = None
+        self._id = None
+
+    # Interned colors, {key:color} and the list indexed by the color "_id"
+    _internTable:dict = {}
+    _internList:list = []
+    _internMax:int = 0x10000
+
+    def _internKey(self) -> tuple:
+        return (_TTkColor, self._fg, self._bg, self._clean)
+
+    @staticmethod
+    def _intern(color):
+        '''
+        Return the shared instance equivalent to **color**
+
+        Interned colors are never modified and are identified by their "_id",
+        they can be compared by identity and their transitions are cached (:py:meth:`_transition`).
+        Colors with a modifier are stateful and are returned as they are.
+        '''
+        if color._id is not None or color._colorMod:
+            return color
+        key = color._internKey()
+        if (ret := _TTkColor._internTable.get(key)) is not None:
+            return ret
+        with _internMutex:
+            # Interned by another thread in the meantime
+            if (ret := _TTkColor._internTable.get(key)) is not None:
+                return ret
+            if len(_TTkColor._internList) >= _TTkColor._internMax:
+                return color
+            color._id = len(_TTkColor._internList)
+            _TTkColor._internList.append(color)
+            _TTkColor._internTable[key] = color
+        return color
+
+    @staticmethod
+    @lru_cache(maxsize=0x1000)
+    def _transitionId(idA:int, idB:int) -> str:
+        return _TTkColor._internList[idA] - _TTkColor._internList[idB]
+
+    @staticmethod
+    def _transition(color, prev) -> str:
+        '''
+        Return the escape sequence required to switch from **prev** to **color**,
+        same as (color - prev) but cached for the interned colors
+        '''
+        if (idA := color._id) is not None and (idB := prev._id) is not None:
+            return _TTkColor._transitionId(idA, idB)
+        return color - prev
 
     def foreground(self):
         if self._fg:
-            return _TTkColor(fg=self._fg)
+            return _TTkColor._intern(_TTkColor(fg=self._fg))
         else:
             return TTkColor.RST
 
     def background(self):
         if self._bg:
-            return _TTkColor(bg=self._bg)
+            return _TTkColor._intern(_TTkColor(bg=self._bg))
         else:
             return TTkColor.RST
 
@@ -220,10 +276,10 @@ class _TTkColor:
         fg:  str = other._fg or self._fg
         bg:  str = other._bg or self._bg
         colorMod = other._colorMod or self._colorMod
-        return _TTkColor(
+        return _TTkColor._intern(_TTkColor(
                     fg=fg, bg=bg,
                     colorMod=colorMod,
-                    clean=clean)
+                    clean=clean))
 
     def __sub__(self, other) -> str:
         '''
@@ -266,6 +322,9 @@ class _TTkColor_mod(_TTkColor):
         super().__init__(**kwargs)
         self._clean = self._clean and not mod
 
+    def _internKey(self) -> tuple:
+        return (_TTkColor_mod, self._fg, self._bg, self._clean, self._mod)
+
     def bold(self) -> bool:
         return  self._mod & TTkTermColor.BOLD
 
@@ -316,10 +375,10 @@ class _TTkColor_mod(_TTkColor):
         bg:  str = other._bg or self._bg
         mod: str = self._mod + otherMod
         colorMod = other._colorMod or self._colorMod
-        return _TTkColor_mod(
+        return _TTkColor._intern(_TTkColor_mod(
                     fg=fg, bg=bg, mod=mod,
                     colorMod=colorMod,
-                    clean=clean)
+                    clean=clean))
 
     # self + other
     def __radd__(self, other):
@@ -331,10 +390,10 @@ class _TTkColor_mod(_TTkColor):
         bg:  str = self._bg or other._bg
         mod: str = self._mod
         colorMod = self._colorMod or other._colorMod
-        return _TTkColor_mod(
+        return _TTkColor._intern(_TTkColor_mod(
                     fg=fg, bg=bg, mod=mod,
                     colorMod=colorMod,
-                    clean=clean)
+                    clean=clean))
 
     def __sub__(self, other) -> str:
         otherMod = other._mod if isinstance(other,_TTkColor_mod) else 0
@@ -371,6 +430,9 @@ class _TTkColor_mod_link(_TTkColor_mod):
         super().__init__(**kwargs)
         self._clean = self._clean and not link
 
+    def _internKey(self) -> tuple:
+        return (_TTkColor_mod_link, self._fg, self._bg, self._clean, self._mod, self._link)
+
     def colorType(self):
         return (
             super().colorType() |
@@ -408,10 +470,10 @@ class _TTkColor_mod_link(_TTkColor_mod):
         mod: str = self._mod + otherMod
         link:str = self._link or otherLink
         colorMod = other._colorMod or self._colorMod
-        return _TTkColor_mod_link(
+        return _TTkColor._intern(_TTkColor_mod_link(
                     fg=fg, bg=bg, mod=mod,
                     colorMod=colorMod, link=link,
-                    clean=clean)
+                    clean=clean))
 
     def __radd__(self, other):
         # TTkLog.debug("__add__")
@@ -424,10 +486,10 @@ class _TTkColor_mod_link(_TTkColor_mod):
         mod: str = self._mod + otherMod
         link:str = self._link
         colorMod = self._colorMod or other._colorMod
-        return _TTkColor_mod_link(
+        return _TTkColor._intern(_TTkColor_mod_link(
                     fg=fg, bg=bg, mod=mod,
                     colorMod=colorMod, link=link,
-                    clean=clean)
+                    clean=clean))
 
     def __sub__(self, other):
         # TTkLog.debug("__sub__")
@@ -600,24 +662,24 @@ class TTkColor(_TTkColor):
         color_6 = color_5 + TTkColor.UNDERLINE + TTkColor.BOLD
 
     '''
-    RST = _TTkColor()
+    RST = _TTkColor._intern(_TTkColor())
     '''Reset to the default terminal color and modifiers'''
 
-    BLACK   = _TTkColor(fg=(  0,  0,  0))
+    BLACK   = _TTkColor._intern(_TTkColor(fg=(  0,  0,  0)))
     '''(fg) #000000 - Black'''
-    WHITE   = _TTkColor(fg=(255,255,255))
+    WHITE   = _TTkColor._intern(_TTkColor(fg=(255,255,255)))
     '''(fg) #FFFFFF - White'''
-    RED     = _TTkColor(fg=(255,  0,  0))
+    RED     = _TTkColor._intern(_TTkColor(fg=(255,  0,  0)))
     '''(fg) #FF0000 - Red'''
-    GREEN   = _TTkColor(fg=(  0,255,  0))
+    GREEN   = _TTkColor._intern(_TTkColor(fg=(  0,255,  0)))
     '''(fg) #00FF00 - Green'''
-    BLUE    = _TTkColor(fg=(  0,  0,255))
+    BLUE    = _TTkColor._intern(_TTkColor(fg=(  0,  0,255)))
     '''(fg) #0000FF - Blue'''
-    CYAN    = _TTkColor(fg=(  0,255,255))
+    CYAN    = _TTkColor._intern(_TTkColor(fg=(  0,255,255)))
     '''(fg) #00FFFF - Cyan'''
-    MAGENTA = _TTkColor(fg=(255,  0,255))
+    MAGENTA = _TTkColor._intern(_TTkColor(fg=(255,  0,255)))
     '''(fg) #FF00FF - Magenta'''
-    YELLOW  = _TTkColor(fg=(255,255,  0))
+    YELLOW  = _TTkColor._intern(_TTkColor(fg=(255,255,  0)))
     '''(fg) #FFFF00 - Yellow'''
 
     FG_BLACK   = BLACK
@@ -637,37 +699,38 @@ class TTkColor(_TTkColor):
     FG_YELLOW  = YELLOW
     '''(fg) #FFFF00 - Yellow'''
 
-    BG_BLACK   = BLACK.invertFgBg()
+    BG_BLACK   = _TTkColor._intern(BLACK.invertFgBg())
     '''(bg) #000000 - Black'''
-    BG_WHITE   = WHITE.invertFgBg()
+    BG_WHITE   = _TTkColor._intern(WHITE.invertFgBg())
     '''(bg) #FFFFFF - White'''
-    BG_RED     = RED.invertFgBg()
+    BG_RED     = _TTkColor._intern(RED.invertFgBg())
     '''(bg) #FF0000 - Red'''
-    BG_GREEN   = GREEN.invertFgBg()
+    BG_GREEN   = _TTkColor._intern(GREEN.invertFgBg())
     '''(bg) #00FF00 - Green'''
-    BG_BLUE    = BLUE.invertFgBg()
+    BG_BLUE    = _TTkColor._intern(BLUE.invertFgBg())
     '''(bg) #0000FF - Blue'''
-    BG_CYAN    = CYAN.invertFgBg()
+    BG_CYAN    = _TTkColor._intern(CYAN.invertFgBg())
     '''(bg) #00FFFF - Cyan'''
-    BG_MAGENTA = MAGENTA.invertFgBg()
+    BG_MAGENTA = _TTkColor._intern(MAGENTA.invertFgBg())
     '''(bg) #FF00FF - Magenta'''
-    BG_YELLOW  = YELLOW.invertFgBg()
+    BG_YELLOW  = _TTkColor._intern(YELLOW.invertFgBg())
     '''(bg) #FFFF00 - Yellow'''
 
     # Modifiers:
-    BOLD         = _TTkColor_mod(mod=TTkTermColor.BOLD)
+    BOLD         = _TTkColor._intern(_TTkColor_mod(mod=TTkTermColor.BOLD))
     '''**Bold** modifier'''
-    ITALIC       = _TTkColor_mod(mod=TTkTermColor.ITALIC)
+    ITALIC       = _TTkColor._intern(_TTkColor_mod(mod=TTkTermColor.ITALIC))
     '''*Italic* modifier'''
-    UNDERLINE    = _TTkColor_mod(mod=TTkTermColor.UNDERLINE)
+    UNDERLINE    = _TTkColor._intern(_TTkColor_mod(mod=TTkTermColor.UNDERLINE))
     ''':underline:`Underline` modifier'''
-    STRIKETROUGH = _TTkColor_mod(mod=TTkTermColor.STRIKETROUGH)
+    STRIKETROUGH = _TTkColor._intern(_TTkColor_mod(mod=TTkTermColor.STRIKETROUGH))
     ''':strike:`Striketrough` modifier'''
 
-    BLINKING     = _TTkColor_mod(mod=TTkTermColor.BLINKING)
+    BLINKING     = _TTkColor._intern(_TTkColor_mod(mod=TTkTermColor.BLINKING))
     '''"Blinking" modifier'''
 
     @staticmethod
+    @lru_cache(maxsize=0x400)
     def hexToRGB(val):
         r = int(val[1:3],base=16)
         g = int(val[3:5],base=16)
@@ -678,9 +741,9 @@ class TTkColor(_TTkColor):
     def ansi(ansi):
         fg,bg,mod,clean = TTkTermColor.ansi2rgb(ansi)
         if mod:
-            return _TTkColor_mod(fg=fg, bg=bg, mod=mod, clean=clean)
+            return _TTkColor._intern(_TTkColor_mod(fg=fg, bg=bg, mod=mod, clean=clean))
         else:
-            return _TTkColor(fg=fg, bg=bg, clean=clean)
+            return _TTkColor._intern(_TTkColor(fg=fg, bg=bg, clean=clean))
 
     @staticmethod
     def fg(*args, **kwargs) -> None:
@@ -708,9 +771,9 @@ class TTkColor(_TTkColor):
         else:
             color = kwargs.get('color', "" )
         if link:
-            return _TTkColor_mod_link(fg=TTkColor.hexToRGB(color), colorMod=mod, link=link)
+            return _TTkColor._intern(_TTkColor_mod_link(fg=TTkColor.hexToRGB(color), colorMod=mod, link=link))
         else:
-            return _TTkColor(fg=TTkColor.hexToRGB(color), colorMod=mod)
+            return _TTkColor._intern(_TTkColor(fg=TTkColor.hexToRGB(color), colorMod=mod))
 
     @staticmethod
     def bg(*args, **kwargs) -> None:
@@ -738,9 +801,9 @@ class TTkColor(_TTkColor):
         else:
             color = kwargs.get('color', "" )
         if link:
-            return _TTkColor_mod_link(bg=TTkColor.hexToRGB(color), colorMod=mod, link=link)
+            return _TTkColor._intern(_TTkColor_mod_link(bg=TTkColor.hexToRGB(color), colorMod=mod, link=link))
         else:
-            return _TTkColor(bg=TTkColor.hexToRGB(color), colorMod=mod)
+            return _TTkColor._intern(_TTkColor(bg=TTkColor.hexToRGB(color), colorMod=mod))
 
     @staticmethod
     def fgbg(fg:str='', bg:str='', link:str='', modifier:TTkColorModifier=None):
@@ -764,9 +827,9 @@ class TTkColor(_TTkColor):
         :return: :py:class:`TTkColor`
         '''
         if link:
-            return _TTkColor_mod_link(fg=TTkColor.hexToRGB(fg), bg=TTkColor.hexToRGB(bg), colorMod=modifier, link=link)
+            return _TTkColor._intern(_TTkColor_mod_link(fg=TTkColor.hexToRGB(fg), bg=TTkColor.hexToRGB(bg), colorMod=modifier, link=link))
         else:
-            return _TTkColor(fg=TTkColor.hexToRGB(fg), bg=TTkColor.hexToRGB(bg), colorMod=modifier)
+            return _TTkColor._intern(_TTkColor(fg=TTkColor.hexToRGB(fg), bg=TTkColor.hexToRGB(bg), colorMod=modifier))
 
 class TTkAlternateColor(TTkColorModifier):
     '''TTkAlternateColor'''
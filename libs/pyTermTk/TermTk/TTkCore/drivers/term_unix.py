@@ -97,6 +97,26 @@ class TTkTerm(TTkTermBase):
             TTkLog.fatal(e)
     TTkTermBase.push = _push
 
+    @staticmethod
+    def _pushFrame(data:str):
+        # The whole frame is written with the minimum number of syscalls
+        try:
+            sys.stdout.flush()
+            fd = sys.stdout.fileno()
+            blocking = os.get_blocking(fd)
+            if not blocking:
+                os.set_blocking(fd, True)
+            try:
+                buffer = memoryview(data.encode())
+                while buffer:
+                    buffer = buffer[os.write(fd, buffer):]
+            finally:
+                if not blocking:
+                    os.set_blocking(fd, False)
+        except Exception as e:
+            TTkLog.fatal(e)
+    TTkTermBase.pushFrame = _pushFrame
+
     @staticmethod
     def _flush():
         sys.stdout.flush()
@@ -24,9 +24,12 @@ __all__ = ['TTkFileBuffer']
 
 import os
 import re
+import mmap
 import threading
+from array import array
 from TermTk.TTkCore.log import TTkLog
 from TermTk.TTkCore.signal import pyTTkSignal
+from TermTk.TTkCore.timer import TTkTimer
 
 #              w1   w3   w2   w5
 #     Buffer |----|----|----|----|            cache buffer
@@ -37,6 +40,8 @@ from TermTk.TTkCore.signal import pyTTkSignal
 #     File   |----|----|----|----|----|----|  view as list of windows
 #              w1   w2   w3   w4   w5   w6
 
+_newLineRe = re.compile(b'\n')
+
 class TTkFileBuffer():
     class _Page:
         __slots__ = ('_page', '_size', '_buffer')
@@ -54,31 +59,79 @@ class TTkFileBuffer():
 
     __slots__ = (
         '_indexes', '_indexesMutex',
-        '_filename', '_fd',
+        '_filename', '_fd', '_mmap', '_stat',
         '_pages', '_buffer',
         '_window', '_numW',
-        '_width',
+        '_width', '_indexedSize', '_indexedEvent',
+        '_searchId',
+        '_followTimer', '_followInterval',
         #Signals
-        'indexUpdated', 'indexed')
+        'indexUpdated', 'indexed',
+        'searchUpdated', 'searched',
+        'appended', 'reloaded')
     def __init__(self, filename, window, numWindows):
         # Signals
         self.indexUpdated = pyTTkSignal(float)
         self.indexed = pyTTkSignal()
+        self.searchUpdated = pyTTkSignal(int, list, float)
+        self.searched = pyTTkSignal(int)
+        self.appended = pyTTkSignal(int)
+        self.reloaded = pyTTkSignal()
+
+        self._searchId = 0
+        self._followTimer = None
+        self._followInterval = 1.0
 
         self._window = window
         self._numW = numWindows
         self._filename = filename
-        self._indexes = [0]
+        # Start offset of each line
+        self._indexes = array('Q',[0])
         self._indexesMutex = threading.Lock()
         self._width=0
+        self._indexedSize = 0
         self._buffer = [None]*self._numW
         self._pages = [None]
-        self._fd = open(self._filename, 'r', errors='replace', newline='\n')
+        self._fd = open(self._filename, 'rb')
+        self._stat = os.fstat(self._fd.fileno())
+        self._mmap = self._mapFile()
+        self._indexedEvent = threading.Event()
         threading.Thread(target=self.createIndex).start()
 
     def __del__(self):
+        if self._followTimer:
+            self._followTimer.quit()
+        if isinstance(self._mmap, mmap.mmap):
+            self._mmap.close()
         self._fd.close()
 
+    def _mapFile(self):
+        # The pages are sliced from the mapped file and decoded on demand
+        # (an empty file can not be mapped)
+        if os.fstat(self._fd.fileno()).st_size:
+            return mmap.mmap(self._fd.fileno(), 0, access=mmap.ACCESS_READ)
+        return b''
+
+    def _checkMapping(self):
+        '''
+        Reload the file if it has been truncated, return False in this case
+
+        (reading the pages of a mapping beyond the end of the file raises SIGBUS,
+        the follow mode may notice the truncation only later)
+        '''
+        if len(self._mmap) <= os.fstat(self._fd.fileno()).st_size:
+            return True
+        self._reload()
+        return False
+
+    def _readLine(self, pos):
+        '''Return the line starting at pos and the position of the next one'''
+        mm = self._mmap
+        if pos >= len(mm):
+            return "", pos
+        end = mm.find(b'\n', pos)+1 or len(mm)
+        return mm[pos:end].decode('utf-8', errors='replace'), end
+
     def filename(self):
         return self._filename
 
@@ -89,12 +142,12 @@ class TTkFileBuffer():
        return self._width
 
     def getLineDirect(self, line):
-        if line >= self.getLen():
+        if line >= self.getLen() or not self._checkMapping():
             return ""
         self._indexesMutex.acquire()
-        self._fd.seek(self._indexes[line])
+        pos = self._indexes[line]
         self._indexesMutex.release()
-        return self._fd.readline()
+        return self._readLine(pos)[0]
 
     def getLine(self, line):
         if line >= self.getLen():
@@ -102,6 +155,8 @@ class TTkFileBuffer():
         page = line//self._window
         offset = line%self._window
         if self._pages[page] == None:
+            if not self._checkMapping():
+                return ""
             # Dispose of the pages to the bottom
             dispose = self._buffer.pop(0)
             if dispose is not None:
@@ -109,11 +164,12 @@ class TTkFileBuffer():
             self._pages[page] = self._Page(page, self._window)
             self._buffer.append(self._pages[page])
             self._indexesMutex.acquire()
-            self._fd.seek(self._indexes[line-offset])
+            pos = self._indexes[line-offset]
             self._indexesMutex.release()
             buffer = self._pages[page].buffer
             for i in range(self._window):
-                buffer[i] = self._fd.readline().replace('\r','')
+                txt, pos = self._readLine(pos)
+                buffer[i] = txt.replace('\r','')
                 #self._width = max(self._width,len(buffer[i]))
         else:
             # Push the page to the top of the buffer
@@ -130,29 +186,129 @@ class TTkFileBuffer():
 
     def createIndex(self):
         # TTkLog.debug(f"Start Indexing {self._filename}")
-        indexes = []
-        offset = 0
-        fileSize = os.stat(self._filename).st_size
-        chunkSize = 0x1000000 # ~16M
-        with open(self._filename,'rb') as infile:
-            while (chunk:=infile.read(chunkSize)):
-                start = 0
-                while (index:=chunk.find(0x0A,start))!=-1:
-                    indexes.append(index+offset+1)
-                    start = index+1
-                self._indexesMutex.acquire()
-                self._indexes += indexes
-                self._pages += [None]*(1+(self.getLen()//self._window)-(len(self._pages)))
-                self._indexesMutex.release()
-                indexes = []
-                offset+=len(chunk)
-                self.indexUpdated.emit(offset/fileSize)
-                # TTkLog.debug(f"{self._filename} {offset/fileSize} ...")
-        self._width = max( (self._indexes[i+1]-self._indexes[i]) for i in range(len(self._indexes)-1) )
+        mm = self._mmap
+        fileSize = len(mm)
+        for offset in self._indexRange(0, fileSize):
+            self.indexUpdated.emit(offset/fileSize)
+            # TTkLog.debug(f"{self._filename} {offset/fileSize} ...")
+        if mm is not self._mmap:
+            # The file has been reloaded, the new index is created by another thread
+            return
         self.indexUpdated.emit(1.0)
+        self._indexedEvent.set()
         self.indexed.emit()
         # TTkLog.debug(f"{self._filename} {offset/fileSize} END")
 
+    def waitIndexed(self, timeout:float=None) -> bool:
+        '''
+        Block until the file is indexed or the timeout (in seconds) expires.
+
+        :return: True if the file is indexed
+        '''
+        return self._indexedEvent.wait(timeout)
+
+    def _indexRange(self, offset, fileSize):
+        '''Index the lines between offset and fileSize, yield the offset reached after each chunk'''
+        mm = self._mmap
+        chunkSize = 0x1000000 # ~16M
+        while offset < fileSize:
+            end = min(offset+chunkSize, fileSize)
+            if os.fstat(self._fd.fileno()).st_size < end:
+                # Truncated while indexing
+                break
+            indexes = array('Q', [_m.end() for _m in _newLineRe.finditer(mm, offset, end)])
+            self._indexesMutex.acquire()
+            if mm is not self._mmap:
+                # Reloaded while indexing
+                self._indexesMutex.release()
+                return
+            if indexes:
+                # Track the longest line (the next one is not delimited yet)
+                prev = self._indexes[-1]
+                self._width = max(self._width, indexes[0]-prev, max(map(int.__sub__, indexes[1:], indexes[:-1]), default=0))
+            self._indexes += indexes
+            self._pages += [None]*(1+(self.getLen()//self._window)-(len(self._pages)))
+            self._indexesMutex.release()
+            offset = self._indexedSize = end
+            yield offset
+
+    def setFollow(self, follow:bool, interval:float=1.0) -> None:
+        '''
+        Enable/Disable the follow (tail) mode.
+
+        The file is checked every interval seconds,
+        the appended lines are indexed and reported through :py:attr:`appended` (firstLine),
+        a truncated or rotated file is reloaded and reported through :py:attr:`reloaded`.
+        '''
+        self._followInterval = interval
+        if follow and not self._followTimer:
+            self._followTimer = TTkTimer()
+            self._followTimer.timeout.connect(self._followTimeout)
+            self._followTimer.start(interval)
+        elif not follow and self._followTimer:
+            self._followTimer.quit()
+            self._followTimer = None
+
+    def isFollowing(self) -> bool:
+        return self._followTimer is not None
+
+    def _followTimeout(self):
+        self.checkFile()
+        if timer := self._followTimer:
+            timer.start(self._followInterval)
+
+    def checkFile(self) -> None:
+        '''Look for changes in the file, used by the follow mode'''
+        try:
+            st = os.stat(self._filename)
+        except OSError:
+            # The file has been rotated, wait for the new one
+            return
+        if not self._indexedEvent.is_set():
+            # Still indexing
+            return
+        if (st.st_ino, st.st_dev) != (self._stat.st_ino, self._stat.st_dev) or st.st_size < self._stat.st_size:
+            self._reload()
+        elif st.st_size > self._stat.st_size:
+            self._append()
+
+    def _invalidatePages(self, page):
+        for i,p in enumerate(self._buffer):
+            if p is not None and p.page >= page:
+                self._pages[p.page] = None
+                self._buffer[i] = None
+
+    def _append(self):
+        self._stat = os.fstat(self._fd.fileno())
+        # The previous mapping is released by the garbage collector
+        # once the pages still reading from it are done
+        oldSize = len(self._mmap)
+        self._mmap = self._mapFile()
+        fileSize = len(self._mmap)
+        # The last line may be completed by the appended data
+        firstLine = self.getLen()-1
+        self._indexesMutex.acquire()
+        self._invalidatePages(firstLine//self._window)
+        self._indexesMutex.release()
+        for _ in self._indexRange(oldSize, fileSize): pass
+        self.appended.emit(firstLine)
+
+    def _reload(self):
+        self._fd.close()
+        self._fd = open(self._filename, 'rb')
+        self._stat = os.fstat(self._fd.fileno())
+        self._indexesMutex.acquire()
+        self._mmap = self._mapFile()
+        self._indexes = array('Q',[0])
+        self._indexedSize = 0
+        self._width = 0
+        self._buffer = [None]*self._numW
+        self._pages = [None]
+        self._indexedEvent.clear()
+        self._indexesMutex.release()
+        self.reloaded.emit()
+        threading.Thread(target=self.createIndex).start()
+
     def searchRe(self, regex, ignoreCase=False):
         indexes = []
         rr = re.compile(regex, re.IGNORECASE if ignoreCase else 0)
@@ -183,6 +339,73 @@ class TTkFileBuffer():
         # TTkLog.debug(f"Diff: {datetime.now() - now}")
         return indexes
 
+    def searchReAsync(self, regex, ignoreCase=False, fromLine=0) -> int:
+        '''
+        Start a regex search in a background thread, cancelling the previous one.
+
+        The search starts from the line fromLine, i.e. to search only the appended lines.
+
+        The matching lines are reported progressively through
+        :py:attr:`searchUpdated` (searchId, lines, progress) and the end of
+        the search through :py:attr:`searched` (searchId).
+
+        :return: the searchId used by the signals
+        '''
+        rr = re.compile(regex, re.MULTILINE | (re.IGNORECASE if ignoreCase else 0))
+        self._searchId += 1
+        threading.Thread(target=self._searchThread, args=(self._searchId, rr, fromLine), daemon=True).start()
+        return self._searchId
+
+    def searchId(self) -> int:
+        '''Return the id of the latest search, the results of the previous ones are stale'''
+        return self._searchId
+
+    def cancelSearch(self) -> None:
+        '''Cancel the running search (if any)'''
+        self._searchId += 1
+
+    def _searchThread(self, searchId, rr, fromLine):
+        self._indexesMutex.acquire()
+        startPos = self._indexes[fromLine] if fromLine < len(self._indexes) else self._indexedSize
+        self._indexesMutex.release()
+        fileSize = max(1,os.stat(self._filename).st_size-startPos)
+        chunkSize = 0x100000 # ~1M
+        lineNum = fromLine
+        offset = 0
+        rest = ''
+        with open(self._filename, 'r', errors='replace', newline='\n') as infile:
+            infile.seek(startPos)
+            while searchId == self._searchId:
+                chunk = infile.read(chunkSize)
+                # Process only complete lines, the last one is kept for the next round
+                text = rest + chunk
+                end = len(text) if not chunk else text.rfind('\n')+1
+                text, rest = text[:end], text[end:]
+                indexes = []
+                pos = 0
+                # Search the whole chunk at once,
+                # each candidate line is validated with the line search
+                # to avoid matches spanning multiple lines
+                while text and (m := rr.search(text, pos)):
+                    start = text.rfind('\n', 0, m.start())+1
+                    # i.e. '^' matches after the last newline
+                    if start == len(text): break
+                    stop  = text.find('\n', m.start())+1 or len(text)
+                    lineNum += text.count('\n', pos, start)
+                    if m.end() <= stop or rr.search(text[start:stop]):
+                        indexes.append(lineNum)
+                    lineNum += 1
+                    pos = stop
+                    if pos >= len(text): break
+                lineNum += text.count('\n', pos)
+                offset += len(chunk)
+                if searchId != self._searchId: return
+                # The offset is in chars, an approximation of the file position
+                self.searchUpdated.emit(searchId, indexes, min(0.99, offset/fileSize) if chunk else 1.0)
+                if not chunk: break
+        if searchId == self._searchId:
+            self.searched.emit(searchId)
+
     def search(self, txt):
         indexes = []
         with open(self._filename, 'r', errors='replace', newline='\n') as infile:
@@ -20,8 +20,9 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-__all__ = ['TTkHelper']
+__all__ = ['TTkHelper', 'TTkFrameProfile']
 
+from time import perf_counter
 from typing import TYPE_CHECKING
 from dataclasses import dataclass
 
@@ -39,6 +40,34 @@ else:
     class TTkDnDEvent(): ...
     class TTkWidget(): ...
 
+class TTkFrameProfile():
+    '''TTkFrameProfile
+
+    The timings (in seconds) and the counters of a single frame,
+    emitted by :py:attr:`TTkHelper.frameProfiled` when the profiling is enabled
+    '''
+    __slots__ = ('frame', 'paintTimes',
+                 'totalTime', 'paintTime', 'composeTime', 'pushTime',
+                 'updatedBuffers', 'updatedWidgets', 'pushed')
+    def __init__(self, *,
+                 frame:int, paintTimes:dict,
+                 totalTime:float, composeTime:float, pushTime:float,
+                 updatedWidgets:int, pushed:int) -> None:
+        #: The frame number since the profiling has been enabled
+        self.frame = frame
+        #: The time spent in the paintEvent of each repainted widget
+        self.paintTimes = paintTimes
+        self.totalTime = totalTime
+        self.paintTime = sum(paintTimes.values())
+        #: The time spent composing the canvases (paintChildCanvas)
+        self.composeTime = composeTime
+        #: The time spent diffing and pushing the root canvas to the terminal
+        self.pushTime = pushTime
+        self.updatedBuffers = len(paintTimes)
+        self.updatedWidgets = updatedWidgets
+        #: The number of bytes pushed to the terminal
+        self.pushed = pushed
+
 class TTkHelper:
     '''TTkHelper
 
@@ -63,6 +92,23 @@ class TTkHelper:
             self._modal = modal
             widget.move(x,y)
     _overlay = []
+    _frameProfiling = False
+    _frameCount = 0
+
+    frameProfiled = pyTTkSignal(TTkFrameProfile)
+
+    @staticmethod
+    def setFrameProfiling(enabled:bool) -> None:
+        '''
+        Enable the per frame instrumentation of :py:meth:`paintAll`,
+        the results are emitted through :py:attr:`frameProfiled`
+        '''
+        TTkHelper._frameProfiling = enabled
+        TTkHelper._frameCount = 0
+
+    @staticmethod
+    def frameProfiling() -> bool:
+        return TTkHelper._frameProfiling
 
     @staticmethod
     def updateAll():
@@ -74,7 +120,7 @@ class TTkHelper:
     @staticmethod
     def unlockPaint():
         if rw := TTkHelper._rootWidget:
-            rw._paintEvent.set()
+            rw._unlockPaint()
 
     @staticmethod
     def addUpdateWidget(widget):
@@ -290,16 +336,28 @@ class TTkHelper:
         '''
             _updateBuffer = list widgets that require a repaint [paintEvent]
             _updateWidget = list widgets that need to be pushed below
+
+            If :py:class:`TTkCfg`.damageTracking is enabled,
+            the parents of the updated widgets are not repainted,
+            only the damaged areas are composed again and pushed to the terminal
         '''
         if TTkHelper._rootCanvas is None:
             return
 
+        if profiling := TTkHelper._frameProfiling:
+            frameStart = perf_counter()
+            paintTimes = {}
+
+        damageTracking = TTkCfg.damageTracking and TTkCfg.doubleBuffer
+
         # Build a list of buffers to be repainted
         updateWidgetsBk = TTkHelper._updateWidget.copy()
         updateBuffers = TTkHelper._updateBuffer.copy()
         TTkHelper._updateWidget.clear()
         TTkHelper._updateBuffer.clear()
         updateWidgets = set()
+        # Parent -> Updated Children
+        updateChildren = {}
 
         # TTkLog.debug(f"{len(TTkHelper._updateBuffer)} {len(TTkHelper._updateWidget)}")
         for widget in updateWidgetsBk:
@@ -308,9 +366,19 @@ class TTkHelper:
             updateWidgets.add(widget)
             parent = widget.parentWidget()
             while parent is not None:
-                updateBuffers.add(parent)
+                updateChildren.setdefault(parent,set()).add(widget)
+                if not damageTracking:
+                    updateBuffers.add(parent)
                 updateWidgets.add(parent)
-                parent = parent.parentWidget()
+                widget, parent = parent, parent.parentWidget()
+
+        # The parents not explicitly updated are repainted
+        # only if the partial composition is not possible
+        if damageTracking:
+            for widget in updateWidgets:
+                if widget in updateBuffers: continue
+                if not widget._canComposePartially(updateChildren.get(widget,[])):
+                    updateBuffers.add(widget)
 
         # Paint all the canvas
         for widget in updateBuffers:
@@ -320,30 +388,77 @@ class TTkHelper:
             canvas = widget.getCanvas()
             canvas.updateSize()
             canvas.clean()
-            widget.paintEvent(canvas)
+            if profiling:
+                paintStart = perf_counter()
+                widget.paintEvent(canvas)
+                paintTimes[widget] = perf_counter() - paintStart
+            else:
+                widget.paintEvent(canvas)
+
+        if profiling:
+            composeStart = perf_counter()
 
         # Compose all the canvas to the parents
         # From the deepest children to the bottom
         pushToTerminal = False
+        # Widget -> damaged areas, None if the whole widget is damaged
+        damage = {}
         sortedUpdateWidget = sorted(updateWidgets, key=lambda w: -TTkHelper.widgetDepth(w))
         for widget in sortedUpdateWidget:
             if not widget.isVisibleAndParent(): continue
             pushToTerminal = True
-            widget.paintChildCanvas()
-
-        if pushToTerminal:
-            if TTkHelper._cursor:
-                TTkTerm.Cursor.hide()
-            if TTkCfg.doubleBuffer:
-                TTkHelper._rootCanvas.pushToTerminalBuffered(0, 0, TTkGlbl.term_w, TTkGlbl.term_h)
-            elif TTkCfg.doubleBufferNew:
-                TTkHelper._rootCanvas.pushToTerminalBufferedNew(0, 0, TTkGlbl.term_w, TTkGlbl.term_h)
+            if not damageTracking:
+                widget.paintChildCanvas()
+            elif widget in updateBuffers:
+                widget.paintChildCanvas()
+                if hasattr(widget,'rootLayout'):
+                    widget._childPlacements = widget._canvasPlacements()
+                damage[widget] = None
             else:
-                TTkHelper._rootCanvas.pushToTerminal(0, 0, TTkGlbl.term_w, TTkGlbl.term_h)
-            if TTkHelper._cursor:
-                x,y = TTkHelper._cursorPos
-                TTkTerm.push(TTkTerm.Cursor.moveTo(y+1,x+1))
-                TTkTerm.Cursor.show(TTkHelper._cursorType)
+                areas = []
+                for child in updateChildren.get(widget,[]):
+                    if child not in damage: continue
+                    areas += widget._childDamage(child, damage[child])
+                for area in areas:
+                    widget._paintChildCanvasArea(area)
+                damage[widget] = areas
+
+        if profiling:
+            pushStart = perf_counter()
+
+        pushed = 0
+        if pushToTerminal:
+            TTkTerm.beginFrame()
+            # endFrame restores the terminal push even if the frame fails
+            try:
+                if TTkHelper._cursor:
+                    TTkTerm.Cursor.hide()
+                if damageTracking:
+                    TTkHelper._rootCanvas.pushToTerminalDamage(damage.get(TTkHelper._rootWidget))
+                elif TTkCfg.doubleBuffer:
+                    TTkHelper._rootCanvas.pushToTerminalBuffered(0, 0, TTkGlbl.term_w, TTkGlbl.term_h)
+                elif TTkCfg.doubleBufferNew:
+                    TTkHelper._rootCanvas.pushToTerminalBufferedNew(0, 0, TTkGlbl.term_w, TTkGlbl.term_h)
+                else:
+                    TTkHelper._rootCanvas.pushToTerminal(0, 0, TTkGlbl.term_w, TTkGlbl.term_h)
+                if TTkHelper._cursor:
+                    x,y = TTkHelper._cursorPos
+                    TTkTerm.push(TTkTerm.Cursor.moveTo(y+1,x+1))
+                    TTkTerm.Cursor.show(TTkHelper._cursorType)
+            finally:
+                pushed = TTkTerm.endFrame()
+
+        if profiling:
+            frameEnd = perf_counter()
+            TTkHelper._frameCount += 1
+            TTkHelper.frameProfiled.emit(TTkFrameProfile(
+                frame          = TTkHelper._frameCount,
+                paintTimes     = paintTimes,
+                totalTime      = frameEnd - frameStart,
+                composeTime    = pushStart - composeStart,
+                pushTime       = frameEnd - pushStart,
+                updatedWidgets = len(updateWidgets),
+                pushed         = pushed))
 
     @staticmethod
     def rePaintAll():
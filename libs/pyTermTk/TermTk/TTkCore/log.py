@@ -25,20 +25,42 @@ __all__ = ['TTkLog']
 # This code is inspired by
 # https://github.com/ceccopierangiolieugenio/pyCuT/blob/master/cupy/CuTCore/CuDebug.py
 
-import inspect
+import sys
+import atexit
 import logging
+import logging.handlers
+from queue import Queue
 from collections.abc import Callable, Set
 
 class _TTkContext:
     __slots__ = ['file', 'line', 'function']
-    def __init__(self, cf):
-        self.file = cf[1]
-        self.line = cf[2]
-        self.function = cf[3]
+    def __init__(self, frame):
+        self.file = frame.f_code.co_filename
+        self.line = frame.f_lineno
+        self.function = frame.f_code.co_name
     def __str__(self):
         return f"{self.file}:{self.line} [{self.function}]"
 
+class _TTkQueueHandler(logging.handlers.QueueHandler):
+    def enqueue(self, record):
+        # Block if the writer thread is lagging behind
+        # instead of growing the queue without limits
+        self.queue.put(record)
+
 class TTkLog:
+    '''
+    TTkLog
+
+    The messages are forwarded to the handlers installed with :py:meth:`installMessageHandler`,
+    the ones less severe than the :py:meth:`setLevel` are discarded.
+
+    Each message is formatted only if its level is enabled:
+
+    * ``msg % args`` if **args** are provided, i.e. ``TTkLog.debug("Value: %d", value)``
+    * ``msg()`` if **msg** is callable, i.e. ``TTkLog.debug(lambda: f"Dump: {expensive()}")``
+
+    .. note:: A callable **msg** is invoked and its result is logged, it is no longer logged as it is (i.e. ``<function <lambda> at 0x...>``)
+    '''
     DebugMsg    = 0x0001
     InfoMsg     = 0x0002
     ErrorMsg    = 0x0004
@@ -47,6 +69,12 @@ class TTkLog:
     FatalMsg    = 0x0020
     SystemMsg   = CriticalMsg
 
+    _severity = (DebugMsg, InfoMsg, WarningMsg, ErrorMsg, CriticalMsg, FatalMsg)
+    _levelMask:int = sum(_severity)
+    # Modes processed, no one if there are no handlers
+    _enabled:int = 0
+    _queueSize:int = 10000
+
     # TypeHandlers = list[Callable]
     _messageHandler: Set = []
 
@@ -62,9 +90,18 @@ class TTkLog:
 
     @staticmethod
     def use_default_file_logging(file="session.log"):
-        logging.basicConfig(level=logging.DEBUG,
-                    filename=file,
-                    format='%(levelname)s:(%(threadName)-9s) %(message)s',)
+        if not logging.root.handlers:
+            # The file is written by a background thread,
+            # the callers only push the records in a bounded queue
+            logQueue = Queue(maxsize=TTkLog._queueSize)
+            fileHandler = logging.FileHandler(file)
+            fileHandler.setFormatter(logging.Formatter('%(levelname)s:(%(threadName)-9s) %(message)s'))
+            queueHandler = _TTkQueueHandler(logQueue)
+            queueHandler.setFormatter(logging.Formatter('%(message)s'))
+            listener = logging.handlers.QueueListener(logQueue, fileHandler)
+            logging.basicConfig(level=logging.DEBUG, handlers=[queueHandler])
+            listener.start()
+            atexit.register(listener.stop)
         TTkLog.installMessageHandler(TTkLog._logging_message_handler)
 
     @staticmethod
@@ -73,41 +110,69 @@ class TTkLog:
                     format='%(levelname)s:(%(threadName)-9s) %(message)s',)
         TTkLog.installMessageHandler(TTkLog._logging_message_handler)
 
+    @staticmethod
+    def setLevel(level:int) -> None:
+        ''' Discard the messages less severe than level
+
+        (Debug < Info < Warning < Error < Critical < Fatal)
+        '''
+        sev = TTkLog._severity
+        TTkLog._levelMask = sum(sev[sev.index(level):])
+        TTkLog._updateEnabled()
+
+    @staticmethod
+    def isEnabled(mode:int) -> bool:
+        return bool(TTkLog._enabled & mode)
+
+    @staticmethod
+    def _updateEnabled():
+        TTkLog._enabled = TTkLog._levelMask if TTkLog._messageHandler else 0
 
     @staticmethod
-    def _process_msg(mode: int, msg: str):
+    def _process_msg(mode: int, msg, args):
+        # The caller of debug/info/... is two frames above
+        ctx = _TTkContext(sys._getframe(2))
+        # Lazy formatting, only the enabled messages are evaluated
+        if callable(msg):
+            msg = msg()
+        elif args:
+            msg = str(msg) % args
+        lines = str(msg).split('\n')
         for cb in TTkLog._messageHandler:
-            curframe = inspect.currentframe()
-            calframe = inspect.getouterframes(curframe,1)
-            if len(calframe) > 2:
-                ctx = _TTkContext(calframe[2])
-                for txt in str(msg).split('\n'):
-                    cb(mode, ctx, txt)
+            for txt in lines:
+                cb(mode, ctx, txt)
 
     @staticmethod
-    def debug(msg):
-        TTkLog._process_msg(TTkLog.DebugMsg, msg)
+    def debug(msg, *args):
+        if TTkLog._enabled & TTkLog.DebugMsg:
+            TTkLog._process_msg(TTkLog.DebugMsg, msg, args)
 
     @staticmethod
-    def info(msg):
-        TTkLog._process_msg(TTkLog.InfoMsg, msg)
+    def info(msg, *args):
+        if TTkLog._enabled & TTkLog.InfoMsg:
+            TTkLog._process_msg(TTkLog.InfoMsg, msg, args)
 
     @staticmethod
-    def error(msg):
-        TTkLog._process_msg(TTkLog.ErrorMsg, msg)
+    def error(msg, *args):
+        if TTkLog._enabled & TTkLog.ErrorMsg:
+            TTkLog._process_msg(TTkLog.ErrorMsg, msg, args)
 
     @staticmethod
-    def warn(msg):
-        TTkLog._process_msg(TTkLog.WarningMsg, msg)
+    def warn(msg, *args):
+        if TTkLog._enabled & TTkLog.WarningMsg:
+            TTkLog._process_msg(TTkLog.WarningMsg, msg, args)
 
     @staticmethod
-    def critical(msg):
-        TTkLog._process_msg(TTkLog.CriticalMsg, msg)
+    def critical(msg, *args):
+        if TTkLog._enabled & TTkLog.CriticalMsg:
+            TTkLog._process_msg(TTkLog.CriticalMsg, msg, args)
 
     @staticmethod
-    def fatal(msg):
-        TTkLog._process_msg(TTkLog.FatalMsg, msg)
+    def fatal(msg, *args):
+        if TTkLog._enabled & TTkLog.FatalMsg:
+            TTkLog._process_msg(TTkLog.FatalMsg, msg, args)
 
     @staticmethod
     def installMessageHandler(mh: Callable):
         TTkLog._messageHandler.append(mh)
+        TTkLog._updateEnabled()
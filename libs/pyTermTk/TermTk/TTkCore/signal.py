@@ -61,6 +61,7 @@ __all__ = ['pyTTkSlot', 'pyTTkSignal']
 from inspect import getfullargspec, iscoroutinefunction
 from types import LambdaType
 from threading import Lock
+from weakref import WeakSet, WeakKeyDictionary, ref
 import asyncio
 
 import importlib.util
@@ -82,6 +83,38 @@ else:
     def _run_coroutines(coros):
         Thread(target=_async_runner, args=(coros,)).start()
 
+# The argspec is evaluated once for each function
+_argspecCache = WeakKeyDictionary()
+
+def _getArgspec(slot):
+    func = getattr(slot, '__func__', slot)
+    try:
+        return _argspecCache[func]
+    except KeyError:
+        spec = _argspecCache[func] = getfullargspec(slot)
+        return spec
+    except TypeError:
+        # i.e. builtins or callable objects, not weak referenceable
+        return getfullargspec(slot)
+
+_TTkWidget = None
+
+def _slotKey(slot):
+    '''
+    Return the key used to store the slot,
+    (weakref(widget), function) for the methods of the widgets, the slot itself otherwise.
+
+    The widgets are owned by their parent, the signal does not keep them alive.
+    '''
+    global _TTkWidget
+    if (obj := getattr(slot, '__self__', None)) is None:
+        return slot
+    if _TTkWidget is None:
+        from TermTk.TTkWidgets.widget import TTkWidget as _TTkWidget
+    if isinstance(obj, _TTkWidget):
+        return (ref(obj), slot.__func__)
+    return slot
+
 def pyTTkSlot(*args):
     def pyTTkSlot_d(func):
         # Add signature attributes to the function
@@ -92,8 +125,15 @@ def pyTTkSlot(*args):
 # Ts = TypeVarTuple("Ts")
 # class pyTTkSignal(Generic[*Ts]):
 class pyTTkSignal():
-    _signals = []
-    __slots__ = ('_types', '_connected_slots', '_connected_async_slots', '_mutex')
+    _signals = WeakSet()
+    # Guards the connected slots and their snapshot,
+    # a snapshot built before a connect/disconnect must not replace the invalidation
+    _slotsMutex = Lock()
+    __slots__ = (
+        '_types',
+        '_connected_slots', '_connected_async_slots',
+        '_slots',
+        '_mutex', '__weakref__')
     def __init__(self, *args, **kwargs) -> None:
         # ref: http://pyqt.sourceforge.net/Docs/PyQt5/signals_slots.html#PyQt5.QtCore.pyqtSignal
 
@@ -108,8 +148,27 @@ class pyTTkSignal():
         self._types = args
         self._connected_slots = {}
         self._connected_async_slots = {}
+        # Snapshot of the connected slots used by emit,
+        # (slot, weakref(widget) or None, args slice)
+        # invalidated when a slot is connected/disconnected
+        self._slots = None
         self._mutex = Lock()
-        pyTTkSignal._signals.append(self)
+        pyTTkSignal._signals.add(self)
+
+    @staticmethod
+    def _snapshot(slots):
+        # Called holding _slotsMutex
+        return tuple(
+            (k[1], k[0], sl) if type(k) is tuple else (k, None, sl)
+            for k,sl in list(slots.items()))
+
+    def _prune(self):
+        # Remove the slots of the deleted widgets
+        with pyTTkSignal._slotsMutex:
+            for slots in (self._connected_slots, self._connected_async_slots):
+                for k in [k for k in list(slots) if type(k) is tuple and k[0]() is None]:
+                    slots.pop(k, None)
+            self._slots = None
 
     def connect(self, slot):
         # ref: http://pyqt.sourceforge.net/Docs/PyQt5/signals_slots.html#connect
@@ -123,7 +182,7 @@ class pyTTkSignal():
         #    no_receiver_check - suppress the check that the underlying C++ receiver instance still exists and deliver the signal anyway.
         #    Returns:
         #        a Connection object which can be passed to disconnect(). This is the only way to disconnect a connection to a lambda function.
-        spec = getfullargspec(slot)
+        spec = _getArgspec(slot)
         if isinstance(slot, LambdaType) and slot.__name__ == "<lambda>":
             nargs = len(spec.args)
         elif spec.varargs:
@@ -143,36 +202,65 @@ class pyTTkSignal():
                 if a!=b and not issubclass(a,b):
                     error = "Decorated slot has no signature compatible: "+slot.__name__+str(slot._TTkslot_attr)+" != signal"+str(self._types)
                     raise TypeError(error)
-        if iscoroutinefunction(slot):
-            if slot not in self._connected_async_slots:
-                self._connected_async_slots[slot]=slice(nargs)
-        else:
-            if slot not in self._connected_slots:
-                self._connected_slots[slot]=slice(nargs)
+        key = _slotKey(slot)
+        with pyTTkSignal._slotsMutex:
+            if iscoroutinefunction(slot):
+                if key not in self._connected_async_slots:
+                    self._connected_async_slots[key]=slice(nargs)
+            else:
+                if key not in self._connected_slots:
+                    self._connected_slots[key]=slice(nargs)
+                    self._slots = None
 
     def disconnect(self, *args, **kwargs) -> None:
         for slot in args:
-            if slot in self._connected_slots:
-                del self._connected_slots[slot]
+            key = _slotKey(slot)
+            with pyTTkSignal._slotsMutex:
+                if key in self._connected_slots:
+                    del self._connected_slots[key]
+                    self._slots = None
 
     def emit(self, *args, **kwargs) -> None:
         if not self._mutex.acquire(False): return
         if len(args) != len(self._types):
             error = "func"+str(self._types)+" signal has "+str(len(self._types))+" argument(s) but "+str(len(args))+" provided"
             raise TypeError(error)
-        for slot,sl in self._connected_slots.copy().items():
-            slot(*args[sl], **kwargs)
+        if (slots := self._slots) is None:
+            with pyTTkSignal._slotsMutex:
+                if (slots := self._slots) is None:
+                    slots = self._slots = pyTTkSignal._snapshot(self._connected_slots)
+        pruned = False
+        for slot,obj,sl in slots:
+            if obj is None:
+                slot(*args[sl], **kwargs)
+            elif (obj := obj()) is not None:
+                slot(obj, *args[sl], **kwargs)
+            else:
+                pruned = True
         if self._connected_async_slots:
-            coros = [slot(*args[sl], **kwargs) for slot,sl in self._connected_async_slots.copy().items()]
+            coros = []
+            with pyTTkSignal._slotsMutex:
+                asyncSlots = pyTTkSignal._snapshot(self._connected_async_slots)
+            for slot,obj,sl in asyncSlots:
+                if obj is None:
+                    coros.append(slot(*args[sl], **kwargs))
+                elif (obj := obj()) is not None:
+                    coros.append(slot(obj, *args[sl], **kwargs))
+                else:
+                    pruned = True
             _run_coroutines(coros)
+        if pruned:
+            self._prune()
         self._mutex.release()
 
     def clear(self):
-        self._connected_slots = {}
+        with pyTTkSignal._slotsMutex:
+            self._connected_slots = {}
+            self._slots = None
 
     @staticmethod
     def clearAll():
-        for s in pyTTkSignal._signals:
+        for s in list(pyTTkSignal._signals):
             s.clear()
 
     def forward(self):
@@ -24,7 +24,7 @@ __all__ = ['TTkString']
 
 import os
 import re
-import unicodedata
+from bisect import bisect_right
 from types import GeneratorType
 from typing import Any
 
@@ -36,6 +36,27 @@ except:
 from TermTk.TTkCore.cfg import TTkCfg
 from TermTk.TTkCore.constant import TTkK
 from TermTk.TTkCore.color import TTkColor, _TTkColor
+from TermTk.TTkCore.utf8_sizemap import wideRanges, zeroRanges
+
+# Displayed width of the unicode chars:
+#   _widthBmp  - lookup table for the Basic Multilingual Plane,
+#                used also as translation table to map a whole string to its chars width
+#   _widthHigh - (start,width) sorted boundaries for the other planes
+def _buildWidthMap():
+    bmp = bytearray(b'\x01')*0x10000
+    high = [(0x10000,1)]
+    for width,ranges in ((2,wideRanges),(0,zeroRanges)):
+        for a,b in ranges:
+            if a < 0x10000:
+                bmp[a:min(b,0xFFFF)+1] = bytes([width])*(min(b,0xFFFF)+1-a)
+            if b >= 0x10000:
+                # -1 = back to the default width after the range
+                high += [(max(a,0x10000),width),(b+1,-1)]
+    high.sort()
+    return bytes(bmp), [a for a,_ in high], [1 if w<0 else w for _,w in high]
+
+_widthBmp, _widthHighStarts, _widthHighWidths = _buildWidthMap()
+_highRe = re.compile('[\U00010000-\U0010FFFF]')
 
 class TTkString():
     ''' TermTk String Helper
@@ -288,12 +309,8 @@ class TTkString():
         for i,ch in enumerate(self._text):
             if ch=='\t':
                 pp += tabSpaces - (pp+tabSpaces)%tabSpaces
-            elif unicodedata.east_asian_width(ch) == 'W':
-                pp += 2
-            elif unicodedata.category(ch) in ('Me','Mn'):
-                pass
             else:
-                pp += 1
+                pp += TTkString._getWidthChar(ch)
             if dx < pp:
                 return i
         return len(self._text)
@@ -363,10 +380,10 @@ class TTkString():
             sz = 0
             for ch in self._text:
                 rt += ch
-                if unicodedata.category(ch) in ('Me','Mn'):
+                if not (chw := TTkString._getWidthChar(ch)):
                     continue
 
-                sz += 2 if unicodedata.east_asian_width(ch) == 'W' else 1
+                sz += chw
 
                 if sz == width:
                     ret._text   =  rt
@@ -613,34 +630,48 @@ class TTkString():
         return ret
 
     # Unicode Zero/Half/Normal sized chars helpers:
+    # (based on the table generated by tools/gen.utf8.sizeMap.py)
+    @staticmethod
+    def _getWidthChar(ch:str) -> int:
+        ''' Return the displayed width (0, 1 or 2) of a single char '''
+        if (cp := ord(ch)) < 0x10000:
+            return _widthBmp[cp]
+        return _widthHighWidths[bisect_right(_widthHighStarts, cp)-1]
+
     @staticmethod
     def _isWideCharData(ch:str):
-        if len(ch) == 1:
-            return unicodedata.east_asian_width(ch)=='W'
-        if len(ch) > 1:
-            return unicodedata.east_asian_width(ch[0])=='W'
-        return False
+        return bool(ch) and TTkString._getWidthChar(ch[0]) == 2
 
     @staticmethod
     def _isSpecialWidthChar(ch):
-        return ( unicodedata.east_asian_width(ch) == 'W' or
-                 unicodedata.category(ch) in ('Me','Mn') )
+        return TTkString._getWidthChar(ch) != 1
+
+    @staticmethod
+    def _getWidthsText(txt:str) -> str:
+        ''' Return a string with the displayed width (\\x00, \\x01, \\x02) of each char of **txt** '''
+        widths = txt.translate(_widthBmp)
+        if widths.isascii():
+            return widths
+        # The chars outside the BMP are not translated
+        return _highRe.sub(lambda m: chr(TTkString._getWidthChar(m.group())), widths)
 
     @staticmethod
     def _getWidthText(txt):
-        return ( len(txt) +
-            sum(unicodedata.east_asian_width(ch) == 'W' for ch in txt) -
-            sum(unicodedata.category(ch) in ('Me','Mn') for ch in txt) )
+        if txt.isascii():
+            return len(txt)
+        widths = TTkString._getWidthsText(txt)
+        return len(txt) + widths.count('\x02') - widths.count('\x00')
 
     @staticmethod
     def _getLenTextWoZero(txt):
-        return ( len(txt) -
-            sum(unicodedata.category(ch) in ('Me','Mn') for ch in txt) )
+        if txt.isascii():
+            return len(txt)
+        return len(txt) - TTkString._getWidthsText(txt).count('\x00')
 
     def nextPos(self, pos):
         pos += 1
         for i,ch in enumerate(self._text[pos:]):
-            if unicodedata.category(ch) not in ('Me','Mn'):
+            if TTkString._getWidthChar(ch):
                 return pos+i
         return len(self._text)
 
@@ -650,7 +681,7 @@ class TTkString():
         # TTkLog.debug(f"{str(reversed(self._text[:pos]))} {pos=}")
         for i,ch in enumerate(reversed(self._text[:pos])):
             # TTkLog.debug(f"{i}---> {ch}    ")
-            if unicodedata.category(ch) not in ('Me','Mn'):
+            if TTkString._getWidthChar(ch):
                 return pos-i-1
         return 0
 
@@ -659,11 +690,8 @@ class TTkString():
                 a is None and b is None ) else self._termWidthW()
 
     def _checkWidth(self):
-        # from: tests/timeit/09.widechar.check.py
-        # the first not halfsize char is 0x300
-        # this check is ~3 times faster than the 2 combined unicode checks
-        # and will quickly filter out the (more common) simple ascii text
-        tw = self._termWidthW() if any(ord(ch)>=0x300 for ch in self._text) else None
+        # Quickly filter out the (more common) simple ascii text
+        tw = None if self._text.isascii() else self._termWidthW()
         self._hasSpecialWidth = tw if tw != len(self._text) else None
 
     def _termWidthW(self):
@@ -671,18 +699,16 @@ class TTkString():
 
         This value consider the displayed size (Zero, Half, Full) of each character.
         '''
-        return ( len(self._text) +
-             sum(unicodedata.east_asian_width(ch) == 'W' for ch in self._text) -
-             sum(unicodedata.category(ch) in ('Me','Mn') for ch in self._text) )
+        return TTkString._getWidthText(self._text)
 
     def _getDataW_pts(self):
         retTxt = []
         retCol = []
-        for ch,color in zip(self._text,self._colors):
-            if unicodedata.east_asian_width(ch) == 'W':
+        for ch,chw,color in zip(self._text,TTkString._getWidthsText(self._text),self._colors):
+            if chw == '\x02':
                 retTxt += (ch,'')
                 retCol += (color,color)
-            elif unicodedata.category(ch) in ('Me','Mn'):
+            elif chw == '\x00':
                 if retTxt:
                     if len(retTxt)>1 and retTxt[-1] == '':
                         retTxt[-2]+=ch
@@ -699,11 +725,11 @@ class TTkString():
     def _getDataW_tty(self):
         retTxt = []
         retCol = []
-        for ch,color in zip(self._text,self._colors):
-            if unicodedata.east_asian_width(ch) == 'W':
+        for ch,chw,color in zip(self._text,TTkString._getWidthsText(self._text),self._colors):
+            if chw == '\x02':
                 retTxt += ('■','■')
                 retCol += (color,color)
-            elif unicodedata.category(ch) not in ('Me','Mn'):
+            elif chw != '\x00':
                 retTxt.append(ch)
                 retCol.append(color)
         return (retTxt, retCol)
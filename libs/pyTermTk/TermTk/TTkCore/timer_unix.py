@@ -22,48 +22,111 @@
 
 __all__ = ['TTkTimer']
 
+import time
 import threading
+import traceback
+from heapq import heappush, heappop
 
+from TermTk.TTkCore.log import TTkLog
 from TermTk.TTkCore.signal import pyTTkSlot, pyTTkSignal
 from TermTk.TTkCore.helper import TTkHelper
 
-class TTkTimer(threading.Thread):
+class _TTkTimerScheduler():
+    '''
+    Single thread driving all the :py:class:`TTkTimer`
+
+    The pending timeouts are kept in a heap ordered by deadline,
+    a restarted or stopped timer leaves its stale entry in the heap,
+    it is discarded when it reaches the top.
+    The thread ends when there are no pending timeouts.
+    '''
+    __slots__ = ('_heap', '_seq', '_cond', '_thread', '_emitting')
+    def __init__(self):
+        self._heap = []
+        self._seq = 0
+        self._cond = threading.Condition()
+        self._thread = None
+        self._emitting = None
+
+    def schedule(self, timer, sec):
+        with self._cond:
+            timer._gen += 1
+            self._seq += 1
+            heappush(self._heap, (time.monotonic()+sec, self._seq, timer, timer._gen))
+            if not self._thread:
+                self._thread = threading.Thread(target=self._run, name='TTkTimer', daemon=False)
+                self._thread.start()
+            self._cond.notify()
+
+    def cancel(self, timer):
+        with self._cond:
+            timer._gen += 1
+
+    def join(self, timer):
+        '''Wait the end of the timeout emitted by the timer (if any)'''
+        if threading.current_thread() is self._thread: return
+        with self._cond:
+            while self._emitting is timer:
+                self._cond.wait()
+
+    def _run(self):
+        heap = self._heap
+        with self._cond:
+            while True:
+                # Discard the stopped/restarted timeouts
+                while heap and heap[0][3] != heap[0][2]._gen:
+                    heappop(heap)
+                if not heap:
+                    self._thread = None
+                    return
+                delay = heap[0][0] - time.monotonic()
+                if delay > 0:
+                    self._cond.wait(delay)
+                    continue
+                _, _, timer, _ = heappop(heap)
+                timer._gen += 1
+                self._emitting = timer
+                self._cond.release()
+                try:
+                    timer.timeout.emit()
+                except Exception:
+                    TTkLog.critical(traceback.format_exc())
+                finally:
+                    self._cond.acquire()
+                    self._emitting = None
+                    self._cond.notify_all()
+
+_scheduler = _TTkTimerScheduler()
+
+class TTkTimer():
+    '''
+    Single shot timer, the :py:attr:`timeout` is emitted once the delay is expired.
+
+    All the timers are driven by the same thread,
+    the timeout slots should not block.
+    '''
     __slots__ = (
-        'timeout', '_delay',
-        '_timer', '_quit', '_start')
+        'timeout', '_gen', '_quit')
     def __init__(self):
         self.timeout = pyTTkSignal()
-        self._delay = 0
-        self._quit  = threading.Event()
-        self._start = threading.Event()
-        self._timer = threading.Event()
-        super().__init__()
+        self._gen = 0
+        self._quit = False
         TTkHelper.quitEvent.connect(self.quit)
 
     def quit(self):
         TTkHelper.quitEvent.disconnect(self.quit)
         self.timeout.clear()
-        self._quit.set()
-        self._timer.set()
-        self._start.set()
+        self._quit = True
+        _scheduler.cancel(self)
 
-    def run(self):
-        while not self._quit.is_set():
-            self._start.wait()
-            self._start.clear()
-            if not self._timer.wait(self._delay):
-                self.timeout.emit()
+    def join(self):
+        _scheduler.join(self)
 
     @pyTTkSlot(float)
     def start(self, sec=0.0):
-        self._delay = sec
-        self._timer.set()
-        self._timer.clear()
-        self._start.set()
-        if not self.native_id:
-            super().start()
+        if not self._quit:
+            _scheduler.schedule(self, sec)
 
     @pyTTkSlot()
     def stop(self):
-        self._timer.set()
-
+        _scheduler.cancel(self)
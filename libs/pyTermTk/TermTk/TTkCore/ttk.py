@@ -126,6 +126,12 @@ class TTk(TTkContainer):
             TTkCfg.doubleBuffer = False
             TTkCfg.doubleBufferNew = True
 
+        if 'TERMTK_FULLREPAINT' in os.environ:
+            TTkCfg.damageTracking = False
+
+        if 'TERMTK_SYNC_OUTPUT' in os.environ:
+            TTkTerm.setSyncOutput(True)
+
         if os.environ.get("TERMTK_GPM",False):
             self._showMouseCursor = True
 
@@ -293,18 +299,29 @@ class TTk(TTkContainer):
            ( kevt.key == TTkK.Key_Left or kevt.key == TTkK.Key_Up)):
                 TTkHelper.prevFocus(focusWidget if focusWidget else self)
 
+    def _unlockPaint(self):
+        # The paint timer is idle if there was nothing to paint,
+        # wake it up on the first update
+        if not self._paintEvent.is_set():
+            self._paintEvent.set()
+            if self._timer:
+                self._timer.start(1/TTkCfg.maxFps)
+
     def _time_event(self):
-        # Event.{wait and clear} should be atomic,
+        # The timers share the same thread, the paint routine can not block
+        # waiting for an update, the timer is restarted by _unlockPaint
+        if not self._paintEvent.is_set():
+            return
+        # Event.{check and clear} should be atomic,
         # BUTt: ( y )
-        #   if an update event (set) happen in between the wait and clear
+        #   if an update event (set) happen in between the check and clear
         #      the widget is still processed in the current paint routine
-        #   if an update event (set) happen after the wait and clear
+        #   if an update event (set) happen after the check and clear
         #      the widget is processed in the current paint routine
         #      an extra paint routine is triggered which return immediately due to
         #      the empty list of widgets to be processed - Not a big deal
-        #   if an update event (set) happen after the wait and clear and the paintAll Routine
+        #   if an update event (set) happen after the check and clear and the paintAll Routine
         #      well, it works as it is supposed to be
-        self._paintEvent.wait()
         self._paintEvent.clear()
 
         w,h = TTkTerm.getTerminalSize()
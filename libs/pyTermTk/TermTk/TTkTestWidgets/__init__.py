@@ -3,4 +3,5 @@ from .testwidget         import *
 from .testwidgetsizes    import *
 from .testabstractscroll import *
 from .keypressview       import *
+from .frameinspector     import *
 # from .tominspector import *
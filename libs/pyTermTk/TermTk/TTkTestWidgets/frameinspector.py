@@ -0,0 +1,112 @@
+# MIT License
+#
+# Copyright (c) 2025 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+__all__ = ['TTkFrameInspector']
+
+from weakref import WeakKeyDictionary
+
+from TermTk.TTkCore.helper import TTkHelper, TTkFrameProfile
+from TermTk.TTkCore.signal import pyTTkSlot
+from TermTk.TTkLayouts.gridlayout import TTkGridLayout
+from TermTk.TTkWidgets.label import TTkLabel
+from TermTk.TTkWidgets.checkbox import TTkCheckbox
+from TermTk.TTkWidgets.button import TTkButton
+from TermTk.TTkWidgets.container import TTkContainer
+from TermTk.TTkWidgets.TTkModelView.tree import TTkTree
+from TermTk.TTkWidgets.TTkModelView.treewidgetitem import TTkTreeWidgetItem
+
+class TTkFrameInspector(TTkContainer):
+    '''TTkFrameInspector
+
+    Display the per frame profiling (:py:meth:`~TermTk.TTkCore.helper.TTkHelper.setFrameProfiling`),
+    the timings of the last frame and the widgets sorted by the time spent in their paintEvent
+
+    ::
+
+        win = ttk.TTkWindow(parent=root, title="Frames", size=(80,20), layout=ttk.TTkGridLayout())
+        ttk.TTkFrameInspector(parent=win)
+    '''
+    __slots__ = ('_stats', '_maxItems', '_summary', '_tree')
+    def __init__(self, *,
+                 profile:bool=True,
+                 maxItems:int=30,
+                 **kwargs) -> None:
+        # widget -> [paints, total, max, last]
+        self._stats = WeakKeyDictionary()
+        self._maxItems = maxItems
+        super().__init__(**kwargs)
+        self.setLayout(layout := TTkGridLayout())
+
+        cbProfile = TTkCheckbox(text="Profile", checked=profile, maxWidth=11)
+        btnReset = TTkButton(text="Reset", maxWidth=7)
+        self._summary = TTkLabel(text="\n", minHeight=2, maxHeight=2)
+        self._tree = TTkTree()
+        self._tree.setHeaderLabels(["Widget", "Class", "Last ms", "Avg ms", "Max ms", "Paints"])
+
+        layout.addWidget(cbProfile,     0,0)
+        layout.addWidget(btnReset,      0,1)
+        layout.addWidget(self._summary, 1,0,1,3)
+        layout.addWidget(self._tree,    2,0,1,3)
+
+        cbProfile.toggled.connect(TTkHelper.setFrameProfiling)
+        btnReset.clicked.connect(self._reset)
+        TTkHelper.frameProfiled.connect(self._frameProfiled)
+        TTkHelper.setFrameProfiling(profile)
+
+    @pyTTkSlot()
+    def _reset(self):
+        self._stats.clear()
+        self._tree.clear()
+
+    @pyTTkSlot(TTkFrameProfile)
+    def _frameProfiled(self, profile:TTkFrameProfile):
+        paintTimes = profile.paintTimes
+        if not (paintTimes or profile.pushed): return
+        # Ignore the frames triggered only by the refresh of the inspector,
+        # they would keep the repaint going forever
+        if paintTimes and all(w is self or TTkHelper.isParent(w,self) for w in paintTimes): return
+
+        stats = self._stats
+        for widget,t in paintTimes.items():
+            if st := stats.get(widget):
+                st[0] += 1
+                st[1] += t
+                st[2] = max(st[2],t)
+                st[3] = t
+            else:
+                stats[widget] = [1,t,t,t]
+
+        if not self.isVisible(): return
+
+        self._summary.setText(
+            f"Frame {profile.frame}: {profile.totalTime*1000:.2f} ms - "
+            f"paint {profile.paintTime*1000:.2f} ms, "
+            f"compose {profile.composeTime*1000:.2f} ms, "
+            f"push {profile.pushTime*1000:.2f} ms\n"
+            f"Buffers: {profile.updatedBuffers}, Widgets: {profile.updatedWidgets}, Pushed: {profile.pushed} bytes")
+
+        slowest = sorted(stats.items(), key=lambda i: -i[1][1])[:self._maxItems]
+        self._tree.clear()
+        for widget,(paints,total,maxTime,last) in slowest:
+            self._tree.addTopLevelItem(TTkTreeWidgetItem([
+                widget._name, widget.__class__.__name__,
+                f"{last*1000:.3f}", f"{total/paints*1000:.3f}", f"{maxTime*1000:.3f}", str(paints)]))
@@ -23,23 +23,40 @@
 __all__ = ['TTkLogViewer']
 
 import os
+from collections import deque
+from itertools import islice
+from threading import Lock
+
+from TermTk.TTkCore.cfg import TTkCfg
 from TermTk.TTkCore.constant import TTkK
 from TermTk.TTkCore.log import TTkLog
 from TermTk.TTkCore.color import TTkColor
 from TermTk.TTkCore.string import TTkString
 from TermTk.TTkCore.signal import pyTTkSlot
+from TermTk.TTkCore.timer import TTkTimer
 from TermTk.TTkWidgets.widget import TTkWidget
 from TermTk.TTkAbstract.abstractscrollarea import TTkAbstractScrollArea
 from TermTk.TTkAbstract.abstractscrollview import TTkAbstractScrollView
 
 class _TTkLogViewer(TTkAbstractScrollView):
-    __slots__ = ('_messages', '_cwd', '_follow')
+    __slots__ = ('_messages', '_widths', '_maxWidth', '_mutex',
+                 '_cwd', '_follow',
+                 '_pendingLen', '_dropped', '_refreshTimer')
     def __init__(self, *,
                  follow:bool=False,
+                 maxMessages:int=10000,
                  **kwargs) -> None:
         self._cwd = os.getcwd()
-        self._messages = [TTkString()]
+        self._messages = deque([TTkString()], maxlen=max(1,maxMessages))
+        # Number of messages for each width, used to track the max width
+        self._widths = {0:1}
+        self._maxWidth = 0
+        self._mutex = Lock()
         self._follow = follow
+        self._pendingLen = None
+        self._dropped = 0
+        self._refreshTimer = TTkTimer()
+        self._refreshTimer.timeout.connect(self._refresh)
         super().__init__(**kwargs)
         TTkLog.installMessageHandler(self.loggingCallback)
         self.viewChanged.connect(self._viewChangedHandler)
@@ -48,10 +65,29 @@ class _TTkLogViewer(TTkAbstractScrollView):
     def _viewChangedHandler(self):
         self.update()
 
+    def maxMessages(self) -> int:
+        return self._messages.maxlen
+
     def viewFullAreaSize(self) -> tuple[int,int]:
-        w = max( m.termWidth() for m in self._messages)
-        h = len(self._messages)
-        return w , h
+        with self._mutex:
+            return self._maxWidth, len(self._messages)
+
+    def _appendMessage(self, message:TTkString) -> None:
+        messages = self._messages
+        widths = self._widths
+        if len(messages) == messages.maxlen:
+            w = messages[0].termWidth()
+            if widths[w] == 1:
+                del widths[w]
+                if w == self._maxWidth:
+                    self._maxWidth = max(widths, default=0)
+            else:
+                widths[w] -= 1
+            self._dropped += 1
+        messages.append(message)
+        w = message.termWidth()
+        widths[w] = widths.get(w,0) + 1
+        self._maxWidth = max(self._maxWidth, w)
 
     def loggingCallback(self, mode, context, message):
         logType = "NONE"
@@ -61,11 +97,29 @@ class _TTkLogViewer(TTkAbstractScrollView):
         elif mode == TTkLog.FatalMsg:    logType = TTkString("FATAL"   ,TTkColor.fg("#ff0000"))
         elif mode == TTkLog.WarningMsg:  logType = TTkString("WARNING ",TTkColor.fg("#ff0000"))
         elif mode == TTkLog.CriticalMsg: logType = TTkString("CRITICAL",TTkColor.fg("#ff0000"))
-        self._messages.append(logType+TTkString(f": {context.file}:{context.line} {message}".replace(self._cwd,"_")))
+        message = logType+TTkString(f": {context.file}:{context.line} {message}".replace(self._cwd,"_"))
+        with self._mutex:
+            # The view is refreshed once per frame regardless
+            # of the number of messages received in between
+            if self._pendingLen is None:
+                self._pendingLen = len(self._messages)
+                self._refreshTimer.start(1/TTkCfg.maxFps)
+            self._appendMessage(message)
+
+    @pyTTkSlot()
+    def _refresh(self):
+        with self._mutex:
+            if self._pendingLen is None: return
+            pendingLen, dropped = self._pendingLen, self._dropped
+            self._pendingLen, self._dropped = None, 0
+            size = len(self._messages)
         offx, offy = self.getViewOffsets()
         _,h = self.size()
-        if self._follow or offy == len(self._messages)-h-1:
-            offy = len(self._messages)-h
+        if self._follow or offy == pendingLen-h:
+            offy = size-h
+        else:
+            # Keep the same messages in view if the oldest ones has been dropped
+            offy = max(0, offy-dropped)
         self.viewMoveTo(offx, offy)
         self.viewChanged.emit()
         self.update()
@@ -73,7 +127,9 @@ class _TTkLogViewer(TTkAbstractScrollView):
     def paintEvent(self, canvas):
         ox,oy = self.getViewOffsets()
         _,h = self.size()
-        for y, message in enumerate(self._messages[oy:oy+h]):
+        with self._mutex:
+            messages = list(islice(self._messages, oy, oy+h))
+        for y, message in enumerate(messages):
             canvas.drawTTkString(pos=(-ox,y),text=message)
 
 class TTkLogViewer(TTkAbstractScrollArea):
@@ -84,8 +140,9 @@ class TTkLogViewer(TTkAbstractScrollArea):
                  visible:bool=True,
                  # TTkLogViewer init
                  follow:bool=False,
+                 maxMessages:int=10000,
                  **kwargs) -> None:
-        self._logView = _TTkLogViewer(follow=follow)
+        self._logView = _TTkLogViewer(follow=follow, maxMessages=maxMessages)
         super().__init__(parent=parent, visible=visible, **kwargs)
         self.setFocusPolicy(TTkK.ClickFocus)
         self.setViewport(self._logView)
@@ -20,11 +20,19 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-__all__=['TTkTableModelCSV']
+__all__=['TTkTableModelCSV', 'TTkTableModelCSVStream']
 
+import os
+import io
 import csv
+import threading
+from array import array
 
 from TermTk.TTkCore.constant import TTkK
+from TermTk.TTkCore.helper import TTkHelper
+from TermTk.TTkCore.signal import pyTTkSignal, pyTTkSlot
+from TermTk.TTkCore.timer import TTkTimer
+from TermTk.TTkAbstract.abstracttablemodel import TTkAbstractTableModel
 from TermTk.TTkWidgets.TTkModelView.tablemodellist import TTkTableModelList
 
 class TTkTableModelCSV(TTkTableModelList):
@@ -86,3 +94,240 @@ class TTkTableModelCSV(TTkTableModelList):
             num = int(data[0][0])
             return all(num+i==int(l[0]) for i,l in enumerate(data))
         return False
+
+class TTkTableModelCSVStream(TTkAbstractTableModel):
+    '''
+    :py:class:`TTkTableModelCSVStream` extends :py:class:`TTkAbstractTableModel`
+    mapping a (huge) csv file without loading it in memory.
+
+    The byte offset of each record is indexed in a background thread
+    (the first chunk is indexed before returning, to allow an immediate paint),
+    the records are parsed on demand a page at a time and the most recent pages
+    are kept in an LRU cache.
+
+    The rows indexed in the background are published by :py:meth:`updateRows`,
+    called after each paint of the :py:class:`TTk` instance, also if it is created after the model
+    (without a running instance it has to be called explicitly),
+    each update emits the :py:class:`TTkAbstractTableModel` -> :py:attr:`rowsInserted` signal.
+
+    The edits are kept in memory and the sorting is not supported.
+
+    ::
+
+        import TermTk as ttk
+
+        tm = ttk.TTkTableModelCSVStream(filename='path/huge.file.csv')
+        tm.indexed.connect(lambda: ttk.TTkLog.debug(f"Rows: {tm.rowCount()}"))
+
+    '''
+
+    __slots__ = (
+        '_filename', '_fd', '_fileSize',
+        '_offsets', '_offsetsMutex', '_rows', '_first', '_indexing', '_indexedEvent', '_rootTimer',
+        '_header', '_columns',
+        '_pageSize', '_cacheSize', '_pages', '_edits',
+        # Signals
+        'indexUpdated', 'indexed')
+
+    def __init__(self, *,
+                 filename:str,
+                 pageSize:int=256,
+                 cacheSize:int=64) -> None:
+        '''
+        :param filename: the csv filename
+        :type filename: str
+
+        :param pageSize: the number of records parsed at once, defaults to 256
+        :type pageSize: int, optional
+
+        :param cacheSize: the number of pages kept in memory, defaults to 64
+        :type cacheSize: int, optional
+        '''
+        # Signals
+        self.indexUpdated = pyTTkSignal(float)
+        self.indexed = pyTTkSignal()
+
+        self._filename = filename
+        self._fileSize = os.stat(filename).st_size
+        self._pageSize = max(1,pageSize)
+        self._cacheSize = max(1,cacheSize)
+        self._pages = {}
+        self._edits = {}
+        # Start offset of each record, the last one is the end of the latest indexed record
+        self._offsets = array('Q',[0])
+        self._offsetsMutex = threading.Lock()
+        self._rows = 0
+        self._first = 0
+        self._header = []
+        self._columns = 0
+        self._fd = open(filename, 'rb')
+        super().__init__()
+
+        with open(filename, 'r', encoding='utf-8', errors='replace') as fd:
+            sample = fd.read(0x800)
+        hasHeader = False
+        try:
+            hasHeader = bool(sample) and csv.Sniffer().has_header(sample)
+        except csv.Error:
+            pass
+
+        indexer = self._indexer()
+        # Index the first chunk in place, the first record is required to
+        # define the columns and the header
+        while len(self._offsets) < 2 and next(indexer, None) is not None: pass
+        if len(self._offsets) > 1:
+            first = self._parse(0,1)[0]
+            self._columns = len(first)
+            if hasHeader:
+                self._header = first
+                self._first = 1
+        self._rows = max(0, len(self._offsets) - 1 - self._first)
+        # The rows are published in the paint thread, where the views are updated
+        self._indexing = True
+        self._indexedEvent = threading.Event()
+        self._rootTimer = TTkTimer()
+        self._rootTimer.timeout.connect(self._connectRoot)
+        self._connectRoot()
+        threading.Thread(target=self._indexThread, args=(indexer,), daemon=True).start()
+
+    def __del__(self):
+        self._fd.close()
+
+    def _indexer(self):
+        '''
+        Generator indexing the records, a newline is a record boundary
+        only if it is not inside a quoted field.
+        Each iteration process a chunk, starting with a small one.
+        '''
+        offset = 0
+        inQuote = 0
+        chunkSize = 0x10000
+        with open(self._filename, 'rb') as infile:
+            while (chunk:=infile.read(chunkSize)):
+                indexes = []
+                if not inQuote and b'"' not in chunk:
+                    start = 0
+                    while (index:=chunk.find(0x0A,start))!=-1:
+                        indexes.append(index+offset+1)
+                        start = index+1
+                else:
+                    start = 0
+                    while (index:=chunk.find(0x0A,start))!=-1:
+                        inQuote ^= chunk.count(0x22,start,index)&1
+                        if not inQuote:
+                            indexes.append(index+offset+1)
+                        start = index+1
+                    inQuote ^= chunk.count(0x22,start)&1
+                offset += len(chunk)
+                if offset == self._fileSize and (not indexes or indexes[-1] != offset):
+                    # Last record without a trailing newline
+                    indexes.append(offset)
+                with self._offsetsMutex:
+                    self._offsets.extend(indexes)
+                chunkSize = min(chunkSize*2, 0x1000000)
+                yield offset
+
+    def _indexThread(self, indexer) -> None:
+        for offset in indexer:
+            self.indexUpdated.emit(offset/self._fileSize)
+            TTkHelper.unlockPaint()
+        self.indexUpdated.emit(1.0)
+        self._indexedEvent.set()
+        TTkHelper.unlockPaint()
+
+    @pyTTkSlot()
+    def _connectRoot(self) -> None:
+        # The root widget may be created after the model,
+        # it is polled until the rows are published
+        if not self._indexing: return
+        if rw := TTkHelper._rootWidget:
+            rw.paintExecuted.connect(self.updateRows)
+            TTkHelper.unlockPaint()
+        else:
+            self._rootTimer.start(0.1)
+
+    def _disconnectRoot(self) -> None:
+        if rw := TTkHelper._rootWidget:
+            rw.paintExecuted.disconnect(self.updateRows)
+
+    def waitIndexed(self, timeout:float=None) -> bool:
+        '''
+        Block until the whole file is indexed or the timeout (in seconds) expires.
+
+        :param timeout: defaults to None (no timeout)
+        :type timeout: float, optional
+
+        :return: True if the file is indexed
+        '''
+        return self._indexedEvent.wait(timeout)
+
+    @pyTTkSlot()
+    def updateRows(self) -> None:
+        '''
+        Publish the rows indexed so far, emitting :py:attr:`rowsInserted`,
+        and :py:attr:`indexed` once the whole file is published.
+
+        It must be called from the thread updating the views.
+        '''
+        if not self._indexing:
+            self._disconnectRoot()
+            return
+        done = self._indexedEvent.is_set()
+        with self._offsetsMutex:
+            rows = max(0, len(self._offsets) - 1 - self._first)
+        if rows > self._rows:
+            prev, self._rows = self._rows, rows
+            self.rowsInserted.emit(prev, rows-prev)
+        if done:
+            self._indexing = False
+            self._disconnectRoot()
+            self.indexed.emit()
+
+    def _parse(self, recA:int, recB:int) -> list[list[str]]:
+        '''Parse the records [recA, recB)'''
+        with self._offsetsMutex:
+            start, end = self._offsets[recA], self._offsets[recB]
+            self._fd.seek(start)
+            data = self._fd.read(end-start)
+        return list(csv.reader(io.StringIO(data.decode('utf-8', errors='replace'), newline='')))
+
+    def _getRecord(self, row:int) -> list[str]:
+        page, pos = divmod(row, self._pageSize)
+        # A page parsed while indexing may be incomplete
+        if (rows := self._pages.pop(page, None)) is None or pos >= len(rows):
+            recA = self._first + page*self._pageSize
+            recB = min(recA+self._pageSize, self._first+self._rows)
+            rows = self._parse(recA, recB)
+            while len(self._pages) >= self._cacheSize:
+                self._pages.pop(next(iter(self._pages)))
+        self._pages[page] = rows
+        return rows[pos]
+
+    def rowCount(self) -> int:
+        return self._rows
+
+    def columnCount(self) -> int:
+        return self._columns
+
+    def data(self, row:int, col:int) -> None:
+        if (row,col) in self._edits:
+            return self._edits[(row,col)]
+        record = self._getRecord(row)
+        return record[col] if col < len(record) else ''
+
+    def setData(self, row:int, col:int, data:object) -> None:
+        self._edits[(row,col)] = data
+        self.dataChanged.emit((row,col),(1,1))
+        return True
+
+    def headerData(self, num:int, orientation:int):
+        if orientation == TTkK.HORIZONTAL:
+            if num < len(self._header):
+                return self._header[num]
+        return super().headerData(num, orientation)
+
+    def flags(self, row:int, col:int) -> TTkK.ItemFlag:
+        return (
+            TTkK.ItemFlag.ItemIsEnabled  |
+            TTkK.ItemFlag.ItemIsEditable |
+            TTkK.ItemFlag.ItemIsSelectable )
@@ -24,21 +24,28 @@ __all__=['TTkTableModelSQLite3']
 
 import sqlite3
 import threading
+from bisect import bisect_right, insort
 
 from TermTk.TTkCore.log import TTkLog
 from TermTk.TTkCore.constant import TTkK
 from TermTk.TTkAbstract.abstracttablemodel import TTkAbstractTableModel, TTkModelIndex
 
 class _TTkModelIndexSQLite3(TTkModelIndex):
-    __slots__ = ('_col','_rowId','_sqModel')
-    def __init__(self, col:int, rowId:str, sqModel) -> None:
+    __slots__ = ('_col','_row','_rowId','_sortId','_sqModel')
+    def __init__(self, col:int, row:int, rowId:object, sqModel) -> None:
         self._col     = col
+        self._row     = row
         self._rowId   = rowId
+        self._sortId  = sqModel._sortId
         self._sqModel = sqModel
         super().__init__()
 
     def row(self) -> int:
-        return self._sqModel._getRow(self._rowId)-1
+        # The row is still valid if the order of the table did not change
+        if self._sortId != self._sqModel._sortId:
+            self._row    = self._sqModel._getRow(self._rowId)
+            self._sortId = self._sqModel._sortId
+        return self._row
     def col(self) -> int:
         return self._col
 
@@ -53,6 +60,15 @@ class TTkTableModelSQLite3(TTkAbstractTableModel):
     :py:class:`TTkTableModelSQLite3` extends :py:class:`TTkAbstractTableModel`,
     allowing to map an sqlite3 table to this table model
 
+    The rows are fetched in pages (one query per page) and the most recent pages
+    are kept in an LRU cache; the pages next to the one requested are
+    prefetched in a background thread.
+
+    The pages are retrieved using the keyset pagination, the
+    (sort value, key) of the last row of each fetched page is used as
+    the starting point of the next one, avoiding the OFFSET scan of the
+    previous rows.
+
     Quickstart:
 
     In This example i assume i have a database named **sqlite.database.db** which contain a table **users**
@@ -79,13 +95,16 @@ class TTkTableModelSQLite3(TTkAbstractTableModel):
     __slots__ = (
         '_conn', '_cur', '_table',
         '_key', '_columns', '_count',
-        '_sort', '_sortColumn',
+        '_sort', '_sortColumn', '_sortOrder', '_sortId',
         '_sqliteMutex',
-        '_idMap')
+        '_pageSize', '_cacheSize', '_pages', '_anchors', '_anchorsPages',
+        '_prefetch', '_prefetchRunning')
 
     def __init__(self, *,
                  fileName:str,
                  table:str,
+                 pageSize:int=128,
+                 cacheSize:int=64,
                  # header:list[str]=None
                  ) -> None:
         '''
@@ -94,13 +113,26 @@ class TTkTableModelSQLite3(TTkAbstractTableModel):
 
         :param table: the name of the sqlite3 table to be mapped
         :type table: str
+
+        :param pageSize: the number of rows fetched in a single query, defaults to 128
+        :type pageSize: int, optional
+
+        :param cacheSize: the number of pages kept in memory, defaults to 64
+        :type cacheSize: int, optional
         '''
         self._sqliteMutex = threading.Lock()
         self._table = table
         self._columns = []
-        self._idMap = {}
-        self._sort = ''
         self._sortColumn = -1
+        self._sortOrder = TTkK.AscendingOrder
+        self._sortId = 0
+        self._pageSize = max(1,pageSize)
+        self._cacheSize = max(1,cacheSize)
+        self._pages = {}
+        self._anchors = {}
+        self._anchorsPages = []
+        self._prefetch = set()
+        self._prefetchRunning = False
 
         self._sqliteMutex.acquire()
         self._conn = conn = sqlite3.connect(fileName, check_same_thread=False)
@@ -109,65 +141,139 @@ class TTkTableModelSQLite3(TTkAbstractTableModel):
         res = cur.execute(f"SELECT COUNT(*) FROM {table}")
         self._count = res.fetchone()[0]
 
-        for row in cur.execute(f"PRAGMA table_info({table})"):
-            if row[-1] == 0:
-                self._columns.append(row[1])
-            if row[-1] == 1:
-                self._key = row[1]
-
-        self._refreshIdMap()
+        info = [(row[1],row[-1]) for row in cur.execute(f"PRAGMA table_info({table})")]
+        keys = [_name for _name,_pk in info if _pk]
+        if len(keys) == 1:
+            self._key = keys[0]
+            self._columns = [_name for _name,_pk in info if not _pk]
+        else:
+            # Fallback to the rowid if there is not a single primary key
+            self._key = 'rowid'
+            self._columns = [_name for _name,_pk in info]
+        self._sort = f"ORDER BY {self._key} ASC"
         self._sqliteMutex.release()
 
         super().__init__()
 
-    def _refreshIdMap(self):
-        self._idMap = {
-            _id : _rn
-            for _rn,_id in self._cur.execute(f"SELECT ROW_NUMBER() OVER ({self._sort}) RN, {self._key} from users")}
-
     def rowCount(self) -> int:
         return self._count
 
     def columnCount(self) -> int:
         return len(self._columns)
 
-    def _getRow(self, key:str) -> int:
-        return self._idMap[key]
+    def _clearCache(self) -> None:
+        self._sortId += 1
+        self._pages = {}
+        self._anchors = {}
+        self._anchorsPages = []
+        self._prefetch = set()
 
-    def index(self, row:int, col:int) -> TTkModelIndex:
-        self._sqliteMutex.acquire()
+    def _after(self, anchor:tuple) -> tuple[str,tuple]:
+        '''
+        Return the WHERE clause and its parameters matching
+        all the rows after the (sort value, key) anchor
+        '''
+        value, key = anchor
+        k = self._key
+        if self._sortColumn == -1:
+            return f"{k} > ?", (key,)
+        c = self._columns[self._sortColumn]
+        # NULL values are placed first in ASC order and last in DESC order
+        if self._sortOrder == TTkK.AscendingOrder:
+            if value is None:
+                return f"(({c} IS NULL AND {k} > ?) OR {c} IS NOT NULL)", (key,)
+            return f"(({c}, {k}) > (?, ?))", (value, key)
+        else:
+            if value is None:
+                return f"({c} IS NULL AND {k} < ?)", (key,)
+            return f"(({c}, {k}) < (?, ?) OR {c} IS NULL)", (value, key)
+
+    def _anchor(self, row:tuple) -> tuple:
+        '''Return the (sort value, key) of a fetched row'''
+        if self._sortColumn == -1:
+            return None, row[0]
+        return row[1+self._sortColumn], row[0]
+
+    def _fetchPage(self, page:int) -> list[tuple]:
+        # Start from the closest known anchor, the page 0 does not require it
+        i = bisect_right(self._anchorsPages, page)
+        base = self._anchorsPages[i-1] if i else 0
+        where, params = self._after(self._anchors[base]) if base else ('',())
+        where = f"WHERE {where} " if where else ''
         res = self._cur.execute(
-            f"SELECT {self._key} FROM {self._table} "
+            f"SELECT {self._key}, {', '.join(self._columns)} FROM {self._table} "
+            f"{where}"
             f"{self._sort} "
-            f"LIMIT 1 OFFSET {row}")
-        key=res.fetchone()[0]
-        self._sqliteMutex.release()
-        return _TTkModelIndexSQLite3(col=col,rowId=key,sqModel=self)
+            f"LIMIT {self._pageSize} OFFSET {(page-base)*self._pageSize}", params)
+        rows = res.fetchall()
+        if rows and page+1 not in self._anchors:
+            insort(self._anchorsPages, page+1)
+            self._anchors[page+1] = self._anchor(rows[-1])
+        self._pages[page] = rows
+        while len(self._pages) > self._cacheSize:
+            self._pages.pop(next(iter(self._pages)))
+        return rows
+
+    def _getPage(self, page:int) -> list[tuple]:
+        with self._sqliteMutex:
+            if (rows := self._pages.pop(page, None)) is None:
+                rows = self._fetchPage(page)
+            else:
+                # Move the page to the end of the LRU
+                self._pages[page] = rows
+            # Schedule the neighbours
+            pages = self._count // self._pageSize + 1
+            self._prefetch |= {_p for _p in (page-1, page+1) if 0<=_p<pages and _p not in self._pages}
+            if self._prefetch and not self._prefetchRunning:
+                self._prefetchRunning = True
+                threading.Thread(target=self._prefetchThread, daemon=True).start()
+        return rows
+
+    def _prefetchThread(self) -> None:
+        while True:
+            with self._sqliteMutex:
+                if not self._prefetch:
+                    self._prefetchRunning = False
+                    return
+                page = self._prefetch.pop()
+                if page not in self._pages:
+                    self._fetchPage(page)
+
+    def _getRow(self, key:object) -> int:
+        with self._sqliteMutex:
+            if self._sortColumn == -1:
+                value = None
+            else:
+                res = self._cur.execute(
+                    f"SELECT {self._columns[self._sortColumn]} FROM {self._table} "
+                    f"WHERE {self._key} = ?", (key,))
+                value = res.fetchone()[0]
+            where, params = self._after((value,key))
+            res = self._cur.execute(f"SELECT COUNT(*) FROM {self._table} WHERE {where}", params)
+            return self._count - res.fetchone()[0] - 1
+
+    def index(self, row:int, col:int) -> TTkModelIndex:
+        key = self._getPage(row//self._pageSize)[row%self._pageSize][0]
+        return _TTkModelIndexSQLite3(col=col,row=row,rowId=key,sqModel=self)
 
     def data(self, row:int, col:int) -> None:
-        self._sqliteMutex.acquire()
-        res = self._cur.execute(
-            f"SELECT {self._columns[col]} FROM {self._table} "
-            f"{self._sort} "
-            f"LIMIT 1 OFFSET {row}")
-        self._sqliteMutex.release()
-        return res.fetchone()[0]
+        return self._getPage(row//self._pageSize)[row%self._pageSize][1+col]
 
     def setData(self, row:int, col:int, data:object) -> None:
-        self._sqliteMutex.acquire()
-        res = self._cur.execute(
-            f"SELECT {self._key} FROM {self._table} "
-            f"{self._sort} "
-            f"LIMIT 1 OFFSET {row}")
-        key=res.fetchone()[0]
-        res = self._cur.execute(
-            f"UPDATE {self._table} "
-            f"SET {self._columns[col]} = '{data}' "
-            f"WHERE {self._key} = {key} ")
-        self._conn.commit()
-        if col == self._sortColumn:
-            self._refreshIdMap()
-        self._sqliteMutex.releases()
+        page, pos = row//self._pageSize, row%self._pageSize
+        key = self._getPage(page)[pos][0]
+        with self._sqliteMutex:
+            self._cur.execute(
+                f"UPDATE {self._table} "
+                f"SET {self._columns[col]} = ? "
+                f"WHERE {self._key} = ? ", (data, key))
+            self._conn.commit()
+            if col == self._sortColumn:
+                self._clearCache()
+            elif (rows := self._pages.get(page)) is not None:
+                line = list(rows[pos])
+                line[1+col] = data
+                rows[pos] = tuple(line)
         return True
 
     def headerData(self, num:int, orientation:int):
@@ -183,14 +289,14 @@ class TTkTableModelSQLite3(TTkAbstractTableModel):
             TTkK.ItemFlag.ItemIsSelectable )
 
     def sort(self, column:int, order:TTkK.SortOrder) -> None:
-        self._sortColumn = column
-        if column == -1:
-            self._sort = ''
-        else:
-            if order ==TTkK.SortOrder.AscendingOrder:
-                self._sort = f"ORDER BY {self._columns[column]} ASC"
+        with self._sqliteMutex:
+            self._sortColumn = column
+            self._sortOrder = order
+            # The key is used to break the ties, required by the keyset pagination
+            if column == -1:
+                self._sort = f"ORDER BY {self._key} ASC"
+            elif order == TTkK.SortOrder.AscendingOrder:
+                self._sort = f"ORDER BY {self._columns[column]} ASC, {self._key} ASC"
             else:
-                self._sort = f"ORDER BY {self._columns[column]} DESC"
-        self._sqliteMutex.acquire()
-        self._refreshIdMap()
-        self._sqliteMutex.release()
+                self._sort = f"ORDER BY {self._columns[column]} DESC, {self._key} DESC"
+            self._clearCache()
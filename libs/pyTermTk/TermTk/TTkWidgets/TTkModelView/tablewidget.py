@@ -24,6 +24,7 @@
 __all__ = ['TTkTableWidget','TTkHeaderView']
 
 from dataclasses import dataclass
+from bisect import bisect_left, bisect_right
 
 from TermTk.TTkCore.log import TTkLog
 from TermTk.TTkCore.constant import TTkK
@@ -102,6 +103,111 @@ class _ClipboardTable(TTkString):
             ret += retLines
         return TTkString('\n').join(TTkString(' ').join(s.align(width=colSizes[c]) for c,s in enumerate(l)) for l in ret)
 
+class _TTkTableSelection():
+    '''_TTkTableSelection
+
+    Sparse selection model, stored as a list of disjoint
+    (rowa, cola, rowb, colb) rectangles (bounds included).
+
+    The selectable flag is evaluated from the model only
+    when a cell is queried, a full row/column/table selection
+    costs a single rectangle regardless of the model size.
+    '''
+    __slots__ = ('_model', '_rects')
+    def __init__(self, model:TTkAbstractTableModel) -> None:
+        self._model = model
+        self._rects = []
+
+    def _selectable(self, row:int, col:int) -> bool:
+        cmp = TTkK.ItemFlag.ItemIsSelectable
+        return cmp==(cmp&self._model.flags(row,col))
+
+    def clear(self) -> None:
+        self._rects = []
+
+    def _subtract(self, rowa:int, cola:int, rowb:int, colb:int) -> None:
+        rects = []
+        for _r in self._rects:
+            ra,ca,rb,cb = _r
+            if ra>rowb or rb<rowa or ca>colb or cb<cola:
+                rects.append(_r)
+                continue
+            # Split the remaining area in (up to) 4 rectangles
+            #   ┌─────────────┐
+            #   │     top     │
+            #   ├────┬───┬────┤
+            #   │left│   │rght│
+            #   ├────┴───┴────┤
+            #   │   bottom    │
+            #   └─────────────┘
+            if ra < rowa: rects.append((ra,ca,rowa-1,cb))
+            if rb > rowb: rects.append((rowb+1,ca,rb,cb))
+            _ra,_rb = max(ra,rowa),min(rb,rowb)
+            if ca < cola: rects.append((_ra,ca,_rb,cola-1))
+            if cb > colb: rects.append((_ra,colb+1,_rb,cb))
+        self._rects = rects
+
+    def select(self, rowa:int, cola:int, rowb:int, colb:int) -> None:
+        if rowa>rowb or cola>colb: return
+        self._subtract(rowa,cola,rowb,colb)
+        self._rects.append((rowa,cola,rowb,colb))
+
+    def deselect(self, rowa:int, cola:int, rowb:int, colb:int) -> None:
+        if rowa>rowb or cola>colb: return
+        self._subtract(rowa,cola,rowb,colb)
+
+    def isSelected(self, row:int, col:int) -> bool:
+        for ra,ca,rb,cb in self._rects:
+            if ra<=row<=rb and ca<=col<=cb:
+                return self._selectable(row,col)
+        return False
+
+    def _isLineSelected(self, spans:list, size:int, selectable) -> bool:
+        # True if every selectable cell outside the spans is missing
+        pos = 0
+        for a,b in sorted(spans):
+            if any(selectable(_i) for _i in range(pos,a)):
+                return False
+            pos = max(pos,b+1)
+        return not any(selectable(_i) for _i in range(pos,size))
+
+    def isRowSelected(self, row:int) -> bool:
+        spans = [(ca,cb) for ra,ca,rb,cb in self._rects if ra<=row<=rb]
+        return self._isLineSelected(spans, self._model.columnCount(), lambda _c: self._selectable(row,_c))
+
+    def isColumnSelected(self, col:int) -> bool:
+        spans = [(ra,rb) for ra,ca,rb,cb in self._rects if ca<=col<=cb]
+        return self._isLineSelected(spans, self._model.rowCount(), lambda _r: self._selectable(_r,col))
+
+    def mask(self, rowa:int, cola:int, rowb:int, colb:int) -> list[list[bool]]:
+        '''Return the selection status of the cells in the given area'''
+        ret = [[False]*(colb-cola+1) for _ in range(rowb-rowa+1)]
+        for ra,ca,rb,cb in self._rects:
+            ra,rb = max(ra,rowa),min(rb,rowb)
+            ca,cb = max(ca,cola),min(cb,colb)
+            for _r in range(ra,rb+1):
+                line = ret[_r-rowa]
+                for _c in range(ca,cb+1):
+                    line[_c-cola] = self._selectable(_r,_c)
+        return ret
+
+    def selectedRows(self):
+        '''Yield (row, [cols]) for each row with selected cells, sorted'''
+        rects = sorted(self._rects)
+        active = []
+        i,row = 0,0
+        while i<len(rects) or active:
+            if not active:
+                row = rects[i][0]
+            while i<len(rects) and rects[i][0]<=row:
+                active.append(rects[i])
+                i+=1
+            cols = sorted(_c for _,ca,_,cb in active for _c in range(ca,cb+1) if self._selectable(row,_c))
+            if cols:
+                yield row, cols
+            row += 1
+            active = [_r for _r in active if _r[2]>=row]
+
 class TTkTableWidget(TTkAbstractScrollView):
     '''
     A :py:class:`TTkTableWidget` implements a table view that displays items from a model.
@@ -239,7 +345,7 @@ class TTkTableWidget(TTkAbstractScrollView):
                   '_sortingEnabled',
                   '_dataPadding',
                   '_internal',
-                  '_selected', '_selectedBase',
+                  '_selection',
                   '_hSeparatorSelected', '_vSeparatorSelected',
                   '_hoverPos', '_dragPos', '_currentPos',
                   '_sortColumn', '_sortOrder',
@@ -313,8 +419,7 @@ class TTkTableWidget(TTkAbstractScrollView):
         self._showVSeparators = vSeparator
         self._verticalHeader    = TTkHeaderView(visible=vHeader)
         self._horizontallHeader = TTkHeaderView(visible=hHeader)
-        self._selected = None
-        self._selectedBase = None
+        self._selection = None
         self._hoverPos = None
         self._dragPos = None
         self._currentPos = None
@@ -328,6 +433,8 @@ class TTkTableWidget(TTkAbstractScrollView):
         self._tableModel.modelChanged.connect(self._refreshLayout)
         super().__init__(**kwargs)
         self._refreshLayout()
+        # The layout is extended by the inserted rows
+        self._tableModel.rowsInserted.connect(self._rowsInserted)
         self.setMinimumHeight(1)
         self.setFocusPolicy(TTkK.ClickFocus + TTkK.TabFocus)
         # self._rootItem = TTkTableWidgetItem(expanded=True)
@@ -399,23 +506,14 @@ class TTkTableWidget(TTkAbstractScrollView):
         '''
         Copies any selected cells to the clipboard.
         '''
-        data = []
-        for row,line in enumerate(self._selected):
-            dataLine = []
-            for col,x in enumerate(line):
-                if x:
-                    dataLine.append((row,col,self._tableModel.data(row,col)))
-            if dataLine:
-                data.append(dataLine)
+        data = [[(row,col,self._tableModel.data(row,col)) for col in cols]
+                for row,cols in self._selection.selectedRows()]
         clip = _ClipboardTable(data)
         # str(clip)
         self._clipboard.setText(clip)
 
     def _cleanSelectedContent(self):
-        selected = [(_r,_c) for _r,_l in enumerate(self._selected) for _c,_v in enumerate(_l) if _v]
-        mods = []
-        for _row,_col in selected:
-            mods.append((_row,_col,''))
+        mods = [(_row,_col,'') for _row,_cols in self._selection.selectedRows() for _col in _cols]
         self._tableModel_setData(mods)
         self.update()
 
@@ -537,8 +635,7 @@ class TTkTableWidget(TTkAbstractScrollView):
 
     @pyTTkSlot()
     def _refreshLayout(self):
-        self._selected = None
-        self._selectedBase = None
+        self._selection = _TTkTableSelection(self._tableModel)
         self._hoverPos = None
         self._dragPos = None
         self._currentPos = None
@@ -561,11 +658,26 @@ class TTkTableWidget(TTkAbstractScrollView):
             self._rowsPos     = [1+x*2  for x in range(rows)]
         else:
             self._rowsPos     = [1+x    for x in range(rows)]
-        # self._selectedBase = sb =  [False]*cols
-        # self._selected = [sb]*rows
         self.clearSelection()
         self.viewChanged.emit()
 
+    @pyTTkSlot(int,int)
+    def _rowsInserted(self, row:int, count:int) -> None:
+        # Only the rows appended to the bottom are handled incrementally
+        if not self._rowsPos or row != len(self._rowsPos):
+            self._refreshLayout()
+            return
+        _d = 2 if self._showHSeparators else 1
+        pos = self._rowsPos[-1]
+        self._rowsPos += [pos+_d*(1+_r) for _r in range(count)]
+        vhs = 1+max(len(self._tableModel.headerData(_p, TTkK.VERTICAL)) for _p in range(row,row+count))
+        if vhs > self._vHeaderSize:
+            self._vHeaderSize = vhs
+            self._headerVisibilityChanged()
+        else:
+            self.viewChanged.emit()
+        self.update()
+
     # Overridden function
     def viewFullAreaSize(self) -> tuple[int, int]:
         showVH = self._verticalHeader.isVisible()
@@ -581,9 +693,7 @@ class TTkTableWidget(TTkAbstractScrollView):
         Deselects all selected items.
         The current index will not be changed.
         '''
-        rows = self._tableModel.rowCount()
-        cols = self._tableModel.columnCount()
-        self._selected = [[False]*cols for _ in range(rows)]
+        self._selection.clear()
         self.update()
 
     def selectAll(self) -> None:
@@ -593,9 +703,8 @@ class TTkTableWidget(TTkAbstractScrollView):
         '''
         rows = self._tableModel.rowCount()
         cols = self._tableModel.columnCount()
-        flagFunc = self._tableModel.flags
-        cmp = TTkK.ItemFlag.ItemIsSelectable
-        self._selected = [[cmp==(cmp&flagFunc(_r,_c)) for _c in range(cols)] for _r in range(rows)]
+        self._selection.clear()
+        self._selection.select(0,0,rows-1,cols-1)
         self.update()
 
     def setSelection(self, pos:tuple[int,int], size:tuple[int,int], flags:TTkK.TTkItemSelectionModel) -> None:
@@ -613,14 +722,12 @@ class TTkTableWidget(TTkAbstractScrollView):
         w,h = size
         rows = self._tableModel.rowCount()
         cols = self._tableModel.columnCount()
-        flagFunc = self._tableModel.flags
-        cmp = TTkK.ItemFlag.ItemIsSelectable
+        rowa,rowb = max(0,y),min(y+h,rows)-1
+        cola,colb = max(0,x),min(x+w,cols)-1
         if flags & (TTkK.TTkItemSelectionModel.Clear|TTkK.TTkItemSelectionModel.Deselect):
-            for line in self._selected[y:y+h]:
-                line[x:x+w]=[False]*w
+            self._selection.deselect(rowa,cola,rowb,colb)
         elif flags & TTkK.TTkItemSelectionModel.Select:
-            for _r, line in enumerate(self._selected[y:y+h],y):
-                line[x:x+w]=[cmp==(cmp&flagFunc(_r,_c)) for _c in range(x,min(x+w,cols))]
+            self._selection.select(rowa,cola,rowb,colb)
         self.update()
 
     def selectRow(self, row:int) -> None:
@@ -631,9 +738,7 @@ class TTkTableWidget(TTkAbstractScrollView):
         :type row: int
         '''
         cols = self._tableModel.columnCount()
-        cmp = TTkK.ItemFlag.ItemIsSelectable
-        flagFunc = self._tableModel.flags
-        self._selected[row] = [cmp==(cmp&flagFunc(row,col)) for col in range(cols)]
+        self._selection.select(row,0,row,cols-1)
         self.update()
 
     def selectColumn(self, col:int) -> None:
@@ -643,10 +748,8 @@ class TTkTableWidget(TTkAbstractScrollView):
         :param col: the column to be selected
         :type col: int
         '''
-        cmp = TTkK.ItemFlag.ItemIsSelectable
-        flagFunc = self._tableModel.flags
-        for row,line in enumerate(self._selected):
-            line[col] = cmp==(cmp&flagFunc(row,col))
+        rows = self._tableModel.rowCount()
+        self._selection.select(0,col,rows-1,col)
         self.update()
 
     def unselectRow(self, row:int) -> None:
@@ -657,7 +760,7 @@ class TTkTableWidget(TTkAbstractScrollView):
         :type row: int
         '''
         cols = self._tableModel.columnCount()
-        self._selected[row] = [False]*cols
+        self._selection.deselect(row,0,row,cols-1)
         self.update()
 
     def unselectColumn(self, column:int) -> None:
@@ -667,8 +770,8 @@ class TTkTableWidget(TTkAbstractScrollView):
         :param column: the column to be unselected
         :type column: int
         '''
-        for line in self._selected:
-            line[column] = False
+        rows = self._tableModel.rowCount()
+        self._selection.deselect(0,column,rows-1,column)
         self.update()
 
     @pyTTkSlot()
@@ -810,8 +913,12 @@ class TTkTableWidget(TTkAbstractScrollView):
         :type model: :py:class:`TTkAbstractTableModel`
         '''
         self._tableModel.dataChanged.disconnect(self.update)
+        self._tableModel.modelChanged.disconnect(self._refreshLayout)
+        self._tableModel.rowsInserted.disconnect(self._rowsInserted)
         self._tableModel = model
         self._tableModel.dataChanged.connect(self.update)
+        self._tableModel.modelChanged.connect(self._refreshLayout)
+        self._tableModel.rowsInserted.connect(self._rowsInserted)
         self._refreshLayout()
 
     def focusOutEvent(self) -> None:
@@ -943,6 +1050,14 @@ class TTkTableWidget(TTkAbstractScrollView):
         self.viewChanged.emit()
         self.update()
 
+    @staticmethod
+    def _separatorAt(positions:list[int], pos:int) -> int:
+        '''Return the index of the separator at the given position, None if not found'''
+        i = bisect_left(positions, pos)
+        if i < len(positions) and positions[i] == pos:
+            return i
+        return None
+
     def _findCell(self, x, y, headers):
         showVH = self._verticalHeader.isVisible()
         showHH = self._horizontallHeader.isVisible()
@@ -959,17 +1074,13 @@ class TTkTableWidget(TTkAbstractScrollView):
             row = -1
         else:
             y += oy-hhs
-            for row,py in enumerate(rp):
-                if py>=y:
-                    break
+            row = min(bisect_left(rp,y), len(rp)-1)
 
         if headers and x<vhs:
             col = -1
         else:
             x += ox-vhs
-            for col,px in enumerate(cp):
-                if px>=x:
-                    break
+            col = min(bisect_left(cp,x), len(cp)-1)
 
         return row,col
 
@@ -1178,16 +1289,16 @@ class TTkTableWidget(TTkAbstractScrollView):
                 elif evt.mod == TTkK.ShiftModifier: self._moveCurrentCell(col=col-1, row=row, borderStop=False)
             elif evt.key == TTkK.Key_PageDown:
                 _,h = self.size()
-                rp=self._rowsPos[row]
-                for dy,rh in enumerate(self._rowsPos[row:]):
-                    if rh-rp >= h: break
-                self._moveCurrentCell(col=col, row=row+dy, borderStop=True)
+                rp = self._rowsPos
+                # First row at least one page below
+                _row = bisect_left(rp, rp[row]+h, lo=row)
+                self._moveCurrentCell(col=col, row=_row, borderStop=True)
             elif evt.key == TTkK.Key_PageUp:
                 _,h = self.size()
-                rp=self._rowsPos[row]
-                for dy,rh in enumerate(self._rowsPos[row::-1]):
-                    if rp-rh >= h: break
-                self._moveCurrentCell(col=col, row=row-dy, borderStop=True)
+                rp = self._rowsPos
+                # Last row at least one page above
+                _row = bisect_right(rp, rp[row]-h, hi=row+1)-1
+                self._moveCurrentCell(col=col, row=max(0,_row), borderStop=True)
             elif evt.key == TTkK.Key_Home: self._moveCurrentCell(col=0,    row=row, borderStop=True)
             elif evt.key == TTkK.Key_End:  self._moveCurrentCell(col=cols, row=row, borderStop=True)
             elif evt.mod==TTkK.NoModifier:
@@ -1232,20 +1343,17 @@ class TTkTableWidget(TTkAbstractScrollView):
         # This is important to handle the header selection in the next part
         if showVS and y < hhs:
             _x = x+ox-vhs
-            for i, c in enumerate(self._colsPos):
-                if _x == c:
-                    # I-th separator selected
-                    self.resizeColumnToContents(i)
-                    return True
+            if (i:=self._separatorAt(self._colsPos,_x)) is not None:
+                # I-th separator selected
+                self.resizeColumnToContents(i)
+                return True
             # return True
         elif showHS and x < vhs:
             _y = y+oy-hhs
-            for i, r in enumerate(self._rowsPos):
-                if _y == r:
-                    # I-th separator selected
-                    # I-th separator selected
-                    self.resizeRowToContents(i)
-                    return True
+            if (i:=self._separatorAt(self._rowsPos,_y)) is not None:
+                # I-th separator selected
+                self.resizeRowToContents(i)
+                return True
 
         row,col = self._findCell(x,y, headers=False)
         self.cellDoubleClicked.emit(row,col)
@@ -1265,20 +1373,18 @@ class TTkTableWidget(TTkAbstractScrollView):
         self._hoverPos = (row,col) = self._findCell(x,y, headers=True)
         if showVS and row==-1:
             _x = x+ox-vhs
-            for i, c in enumerate(self._colsPos):
-                if _x == c:
-                    # Over the I-th separator
-                    self._hoverPos = None
-                    self.update()
-                    return True
+            if self._separatorAt(self._colsPos,_x) is not None:
+                # Over the I-th separator
+                self._hoverPos = None
+                self.update()
+                return True
         if showHS and col==-1:
             _y = y+oy-hhs
-            for i, r in enumerate(self._rowsPos):
-                if _y == r:
-                    # Over the I-th separator
-                    self._hoverPos = None
-                    self.update()
-                    return True
+            if self._separatorAt(self._rowsPos,_y) is not None:
+                # Over the I-th separator
+                self._hoverPos = None
+                self.update()
+                return True
         if row>=0 and col>>0:
             self.cellEntered.emit(row,col)
         self.update()
@@ -1302,27 +1408,25 @@ class TTkTableWidget(TTkAbstractScrollView):
         # This is important to handle the header selection in the next part
         if y < hhs:
             _x = x+ox-vhs
-            for i, c in enumerate(self._colsPos):
-                if showVS and _x == c:
-                    # I-th separator selected
-                    self._hSeparatorSelected = i
-                    self.update()
-                    return True
-                elif self._sortingEnabled and _x == c-(1 if showVS else 0) : # Pressed the sort otder icon
-                    if self._sortColumn == i:
-                        order = TTkK.SortOrder.DescendingOrder if self._sortOrder==TTkK.SortOrder.AscendingOrder else TTkK.SortOrder.AscendingOrder
-                    else:
-                        order = TTkK.SortOrder.AscendingOrder
-                    self.sortByColumn(i,order)
-                    return True
+            if showVS and (i:=self._separatorAt(self._colsPos,_x)) is not None:
+                # I-th separator selected
+                self._hSeparatorSelected = i
+                self.update()
+                return True
+            elif self._sortingEnabled and (i:=self._separatorAt(self._colsPos,_x+(1 if showVS else 0))) is not None: # Pressed the sort otder icon
+                if self._sortColumn == i:
+                    order = TTkK.SortOrder.DescendingOrder if self._sortOrder==TTkK.SortOrder.AscendingOrder else TTkK.SortOrder.AscendingOrder
+                else:
+                    order = TTkK.SortOrder.AscendingOrder
+                self.sortByColumn(i,order)
+                return True
         elif showHS and x < vhs:
             _y = y+oy-hhs
-            for i, r in enumerate(self._rowsPos):
-                if _y == r:
-                    # I-th separator selected
-                    self._vSeparatorSelected = i
-                    self.update()
-                    return True
+            if (i:=self._separatorAt(self._rowsPos,_y)) is not None:
+                # I-th separator selected
+                self._vSeparatorSelected = i
+                self.update()
+                return True
 
         row,col = self._findCell(x,y, headers=True)
         if not row==col==-1:
@@ -1334,9 +1438,7 @@ class TTkTableWidget(TTkAbstractScrollView):
             self.selectAll()
         elif col==-1:
             # Row select
-            flagFunc = self._tableModel.flags
-            cmp = TTkK.ItemFlag.ItemIsSelectable
-            state = all(_sel for i,_sel in enumerate(self._selected[row]) if flagFunc(row,i)&cmp)
+            state = self._selection.isRowSelected(row)
             if not _ctrl:
                 self.clearSelection()
             if state:
@@ -1345,9 +1447,7 @@ class TTkTableWidget(TTkAbstractScrollView):
                 self.selectRow(row)
         elif row==-1:
             # Col select
-            flagFunc = self._tableModel.flags
-            cmp = TTkK.ItemFlag.ItemIsSelectable
-            state = all(_sel[col] for i,_sel in enumerate(self._selected) if flagFunc(i,col)&cmp)
+            state = self._selection.isColumnSelected(col)
             if not _ctrl:
                 self.clearSelection()
             if state:
@@ -1360,7 +1460,7 @@ class TTkTableWidget(TTkAbstractScrollView):
             # self.cellPressed.emit(row,col)
             self._setCurrentCell(row,col)
             self.setSelection(pos   = (col,row), size = (1,1),
-                              flags = TTkK.TTkItemSelectionModel.Clear if (self._selected[row][col] and  _ctrl) else TTkK.TTkItemSelectionModel.Select)
+                              flags = TTkK.TTkItemSelectionModel.Clear if (self._selection.isSelected(row,col) and  _ctrl) else TTkK.TTkItemSelectionModel.Select)
         self._hoverPos = None
         self.update()
         return True
@@ -1425,7 +1525,7 @@ class TTkTableWidget(TTkAbstractScrollView):
             if evt.mod==TTkK.ControlModifier:
                 # Pick the status to be applied to the selection if CTRL is Pressed
                 # In case of line/row selection I choose the element 0 of that line
-                state = self._selected[max(0,rowa)][max(0,cola)]
+                state = self._selection.isSelected(max(0,rowa),max(0,cola))
             else:
                 # Clear the selection if no ctrl has been pressed
                 self.clearSelection()
@@ -1510,46 +1610,35 @@ class TTkTableWidget(TTkAbstractScrollView):
         showHS = self._showHSeparators
         showVS = self._showVSeparators
 
-        sliceCol=list(zip([-1]+cp,cp))
-        sliceRow=list(zip([-1]+rp,rp))
+        def sliceCol(_col): return (cp[_col-1] if _col else -1, cp[_col])
+        def sliceRow(_row): return (rp[_row-1] if _row else -1, rp[_row])
 
         # NOTE: Add Color Cache
         # NOTE: Add Select/Hover Cache
         # Draw cell and right/bottom corner
 
         # Find First/Last displayed Rows
-        rowa, rowb = 0,rows-1
-        for row in range(rows):
-            ya,yb = sliceRow[row]
-            ya,yb = ya+hhs-oy, yb+hhs-oy
-            if ya>h  :
-                rowb = row
-                break
-            if yb<hhs:
-                rowa = row
-                continue
+        # rowa: the last row ending above the view (or the first one)
+        # rowb: the first row starting below the view (or the last one)
+        rowa = max(0, bisect_left(rp, oy)-1)
+        rowb = min(rows-1, bisect_right(rp, h+oy-hhs)+1)
         # Use this in range
         rrows = (rowa,rowb+1)
 
         # Find First/Last displayed Cols
-        cola, colb = 0, cols-1
-        for col in range(cols):
-            xa,xb = sliceCol[col]
-            xa,xb = xa+vhs-ox, xb+vhs-ox
-            if xa>w  :
-                colb = col
-                break
-            if xb<vhs:
-                cola = col
-                continue
+        cola = max(0, bisect_left(cp, ox)-1)
+        colb = min(cols-1, bisect_right(cp, w+ox-vhs)+1)
         # Use this in range
         rcols = (cola,colb+1)
 
+        # Selection status of the displayed cells (and the next row/col used by the borders)
+        _selCache2d = self._selection.mask(rowa,cola,min(rowb+1,rows-1),min(colb+1,cols-1))
+
         # Cache Cells
         _cellsCache   = []
         _colorCache2d = [[None]*(colb+1-cola) for _ in range(rowb+1-rowa)]
         for row in range(*rrows):
-            ya,yb = sliceRow[row]
+            ya,yb = sliceRow(row)
             if showHS:
                 ya,yb = ya+hhs-oy+1, yb+hhs-oy
             else:
@@ -1558,7 +1647,7 @@ class TTkTableWidget(TTkAbstractScrollView):
             if yb<hhs: continue
             rowColor = color.mod(0,row)
             for col in range(*rcols):
-                xa,xb = sliceCol[col]
+                xa,xb = sliceCol(col)
                 if showVS:
                     xa,xb = xa+vhs-ox+1, xb+vhs-ox
                 else:
@@ -1568,7 +1657,7 @@ class TTkTableWidget(TTkAbstractScrollView):
                 cellColor = (
                     currentColor if self._currentPos == (row,col) else
                     hoverColor if self._hoverPos in [(row,col),(-1,col),(row,-1),(-1,-1)] else
-                    selectedColor if self._selected[row][col] else
+                    selectedColor if _selCache2d[row-rowa][col-cola] else
                     rowColor )
                 _colorCache2d[row-rowa][col-cola] = cellColor
                 _cellsCache.append([row,col,xa,xb,ya,yb,cellColor])
@@ -1589,8 +1678,8 @@ class TTkTableWidget(TTkAbstractScrollView):
                 _belowColor:TTkColor = _colorCache2d[_row+1-rowa][_col-cola]
 
                 # force black border if there are selections
-                _sa = self._selected[_row  ][_col  ]
-                _sb = self._selected[_row+1][_col  ]
+                _sa = _selCache2d[_row-rowa][_col-cola]
+                _sb = _selCache2d[_row+1-rowa][_col-cola]
                 if (showHS and showVS) and _sa and not _sb:
                     _bgA:TTkColor = cellColor.background()
                     _bgB:TTkColor = TTkColor.RST
@@ -1614,7 +1703,7 @@ class TTkTableWidget(TTkAbstractScrollView):
                     _char='▀'
                     _color=_bgB + _bgA.invertFgBg()
             else:
-                if self._selected[_row  ][_col  ]:
+                if _selCache2d[_row-rowa][_col-cola]:
                     _char='▀'
                     _color=selectedColorInv
                 elif cellColor.hasBackground():
@@ -1631,8 +1720,8 @@ class TTkTableWidget(TTkAbstractScrollView):
                 _rightColor:TTkColor = _colorCache2d[_row-rowa][_col+1-cola]
 
                 # force black border if there are selections
-                _sa = self._selected[_row  ][_col  ]
-                _sc = self._selected[_row  ][_col+1]
+                _sa = _selCache2d[_row-rowa][_col-cola]
+                _sc = _selCache2d[_row-rowa][_col+1-cola]
                 if (showHS and showVS) and _sa and not _sc:
                     _bgA:TTkColor = cellColor.background()
                     _bgC:TTkColor = TTkColor.RST
@@ -1656,7 +1745,7 @@ class TTkTableWidget(TTkAbstractScrollView):
                     _char='▌'
                     _color=_bgC + _bgA.invertFgBg()
             else:
-                if self._selected[_row  ][_col  ]:
+                if _selCache2d[_row-rowa][_col-cola]:
                     _char='▌'
                     _color=selectedColorInv
                 elif cellColor.hasBackground():
@@ -1684,10 +1773,10 @@ class TTkTableWidget(TTkAbstractScrollView):
             if _row<rows-1 and _col<cols-1:
                 # Check if there are selected cells:
                 chId = (
-                    0x01 * self._selected[_row  ][_col  ] +
-                    0x02 * self._selected[_row  ][_col+1] +
-                    0x04 * self._selected[_row+1][_col  ] +
-                    0x08 * self._selected[_row+1][_col+1] )
+                    0x01 * _selCache2d[_row-rowa][_col-cola] +
+                    0x02 * _selCache2d[_row-rowa][_col+1-cola] +
+                    0x04 * _selCache2d[_row+1-rowa][_col-cola] +
+                    0x08 * _selCache2d[_row+1-rowa][_col+1-cola] )
                 if chId==0x00 or chId==0x0F:
                     _belowColor:TTkColor = _colorCache2d[_row+1-rowa][_col-cola]
                     _bgA:TTkColor = cellColor.background()
@@ -1711,8 +1800,8 @@ class TTkTableWidget(TTkAbstractScrollView):
 
             elif _col<cols-1:
                 chId = (
-                    0x01 * self._selected[row  ][col  ] +
-                    0x02 * self._selected[row  ][col+1] )
+                    0x01 * _selCache2d[row-rowa][col-cola] +
+                    0x02 * _selCache2d[row-rowa][col+1-cola] )
                 if chId:
                     _char = _charList[chId]
                     _color=selectedColorInv
@@ -1724,8 +1813,8 @@ class TTkTableWidget(TTkAbstractScrollView):
                     _color = lineColor
             elif _row<rows-1:
                 chId = (
-                    (0x01) * self._selected[row  ][col  ] +
-                    (0x04) * self._selected[row+1][col  ] )
+                    (0x01) * _selCache2d[row-rowa][col-cola] +
+                    (0x04) * _selCache2d[row+1-rowa][col-cola] )
                 _belowColor:TTkColor = _colorCache2d[_row+1-rowa][_col-cola]
                 _bgA:TTkColor = cellColor.background()
                 _bgB:TTkColor = _belowColor.background()
@@ -1747,7 +1836,7 @@ class TTkTableWidget(TTkAbstractScrollView):
                     _color=_bgB + _bgA.invertFgBg()
             else:
                 chId = (
-                    (0x01) * self._selected[row  ][col  ] )
+                    (0x01) * _selCache2d[row-rowa][col-cola] )
                 if chId:
                     _char = _charList[chId]
                     _color=selectedColorInv
@@ -1770,18 +1859,18 @@ class TTkTableWidget(TTkAbstractScrollView):
             if showHS and showVS:
                 _drawCellCorner(col,row,xa,xb,ya,yb,cellColor)
 
-        # return f"cc={len(_cellsCache)}  size={(w,h)} tw={(sliceCol[0],sliceCol[-1])} th={(sliceRow[0],sliceRow[-1])}"
+        # return f"cc={len(_cellsCache)}  size={(w,h)} tw={(sliceCol(0),sliceCol(-1))} th={(sliceRow(0),sliceRow(-1))}"
 
         if self._hoverPos:
             row,col = self._hoverPos
             if row == -1:
                 ya,yb = -1,rp[-1]
             else:
-                ya,yb = sliceRow[row]
+                ya,yb = sliceRow(row)
             if col == -1:
                 xa,xb = -1,cp[-1]
             else:
-                xa,xb = sliceCol[col]
+                xa,xb = sliceCol(col)
 
             if showVS:
                 xa,xb = xa+vhs-ox, xb+vhs-ox
@@ -1808,21 +1897,21 @@ class TTkTableWidget(TTkAbstractScrollView):
             (rowa,cola),(rowb,colb) = self._dragPos
             if rowa == -1:
                 cola,colb = min(cola,colb),max(cola,colb)
-                xa = sliceCol[cola][0]-ox+vhs
-                xb = sliceCol[colb][1]-ox+vhs + (0 if showHS else 1)
+                xa = sliceCol(cola)[0]-ox+vhs
+                xb = sliceCol(colb)[1]-ox+vhs + (0 if showHS else 1)
                 ya,yb = -1-oy+hhs,rp[-1]-oy+hhs
             elif cola == -1:
                 rowa,rowb = min(rowa,rowb),max(rowa,rowb)
-                ya = sliceRow[rowa][0]-oy+hhs
-                yb = sliceRow[rowb][1]-oy+hhs + (0 if showVS else 1)
+                ya = sliceRow(rowa)[0]-oy+hhs
+                yb = sliceRow(rowb)[1]-oy+hhs + (0 if showVS else 1)
                 xa,xb = -1-ox+vhs,cp[-1]-ox+vhs
             else:
                 cola,colb = min(cola,colb),max(cola,colb)
                 rowa,rowb = min(rowa,rowb),max(rowa,rowb)
-                xa = sliceCol[cola][0]-ox+vhs
-                xb = sliceCol[colb][1]-ox+vhs + (0 if showHS else 1)
-                ya = sliceRow[rowa][0]-oy+hhs
-                yb = sliceRow[rowb][1]-oy+hhs + (0 if showVS else 1)
+                xa = sliceCol(cola)[0]-ox+vhs
+                xb = sliceCol(colb)[1]-ox+vhs + (0 if showHS else 1)
+                ya = sliceRow(rowa)[0]-oy+hhs
+                yb = sliceRow(rowb)[1]-oy+hhs + (0 if showVS else 1)
 
             hoverColorInv = hoverColor.background().invertFgBg()
             canvas.drawTTkString(pos=(xa,ya), text=TTkString('▗'+('▄'*(xb-xa-1))+'▖',hoverColorInv))
@@ -1832,10 +1921,10 @@ class TTkTableWidget(TTkAbstractScrollView):
 
         if self._currentPos:
             row,col = self._currentPos
-            xa = sliceCol[col][0]-ox+vhs
-            xb = sliceCol[col][1]-ox+vhs + (0 if showVS else 1)
-            ya = sliceRow[row][0]-oy+hhs
-            yb = sliceRow[row][1]-oy+hhs + (0 if showHS else 1)
+            xa = sliceCol(col)[0]-ox+vhs
+            xb = sliceCol(col)[1]-ox+vhs + (0 if showVS else 1)
+            ya = sliceRow(row)[0]-oy+hhs
+            yb = sliceRow(row)[1]-oy+hhs + (0 if showHS else 1)
             currentColorInv = currentColor.background().invertFgBg()
             if showVS and showHS:
                 canvas.drawTTkString(pos=(xa,ya),   text=TTkString('▗'+('▄'*(xb-xa-1))+'▖',currentColorInv))
@@ -1856,7 +1945,7 @@ class TTkTableWidget(TTkAbstractScrollView):
                 if isinstance(txt,TTkString): pass
                 elif type(txt) == str: txt = TTkString(txt)
                 else:                  txt = TTkString(f"{txt}")
-                xa,xb = sliceCol[col]
+                xa,xb = sliceCol(col)
                 if showVS:
                     xa,xb = xa+vhs-ox+1, xb+vhs-ox
                 else:
@@ -1872,7 +1961,7 @@ class TTkTableWidget(TTkAbstractScrollView):
         if showVH:
             hlineHead = TTkString('╾'+'╌'*(vhs-2), color=headerColor) + vHSeparator
             for row in range(*rrows):
-                ya,yb = sliceRow[row]
+                ya,yb = sliceRow(row)
                 if showHS:
                     ya,yb = ya+hhs-oy+1, yb+hhs-oy
                 else:
@@ -147,7 +147,7 @@ class TTkTreeWidget(TTkAbstractScrollView):
                     'separatorColor': TTkColor.fg("#888888")},
             }
 
-    __slots__ = ( '_rootItem', '_cache',
+    __slots__ = ( '_rootItem', '_cache', '_cacheItems', '_dirtyItems',
                   '_header', '_columnsPos',
                   '_selectedId', '_selected', '_separatorSelected',
                   '_sortColumn', '_sortOrder', '_sortingEnabled',
@@ -186,6 +186,8 @@ class TTkTreeWidget(TTkAbstractScrollView):
         self._header = header if header else []
         self._columnsPos = []
         self._cache = []
+        self._cacheItems = []
+        self._dirtyItems = []
         self._sortingEnabled=sortingEnabled
         self._sortColumn = -1
         self._sortOrder = TTkK.AscendingOrder
@@ -205,7 +207,8 @@ class TTkTreeWidget(TTkAbstractScrollView):
     # Overridden function
     def viewFullAreaSize(self) -> tuple[int, int]:
         w = self._columnsPos[-1]+1 if self._columnsPos else 0
-        h = self._rootItem.size()
+        # The displayed rows + the header
+        h = len(self._cache)+1
         # TTkLog.debug(f"{w=} {h=}")
         return w,h
 
@@ -446,6 +449,69 @@ class TTkTreeWidget(TTkAbstractScrollView):
                     w.setGeometry(_pos,y,_width,_height)
                     w.show()
 
+    def _invalidateItem(self, item:TTkTreeWidgetItem) -> None:
+        # The rows of this item (and its subtree) will be rebuilt at the next _refreshCache
+        self._dirtyItems.append(item)
+
+    def _addToCache(self, child:TTkTreeWidgetItem, level:int, cache:list) -> None:
+        # Append to the cache the rows of the item and its expanded subtree
+        data = []
+        widgets = []
+        h = child.height()
+        for il in range(len(self._header)):
+            lines = child.data(il).split('\n')
+            if il==0:
+                data0 = []
+                for id in range(h):
+                    # Trying to define an icon to obtain this results on multiline field
+                    #  ▶ Label
+                    #  ┊ NewLine 1
+                    #  │ NewLine 2
+                    #  ╽
+                    if id == 0:
+                        icon = " "+child.icon(il)+" "
+                    elif id == h-1:
+                        icon = TTkString(" ╽ ", TTkColor.fg("#666666"))
+                    elif id == 1:
+                        icon = TTkString(" ┊ ", TTkColor.fg("#666666"))
+                    else:
+                        icon = TTkString(" │ ", TTkColor.fg("#666666"))
+                    text = lines[id] if id<len(lines) else ""
+                    data0.append('  '*level+icon+text)
+                data.append(data0)
+                widgets.append(child.widget(il))
+            else:
+                data.append([TTkString(s) for s in lines]+[TTkString()]*(h-len(lines)))
+                widgets.append(child.widget(il))
+
+        for id in range(h):
+            cache.append(TTkTreeWidget._Cache(
+                                    item  = child,
+                                    level = level,
+                                    data  = [ dt[id] for dt in data],
+                                    widgets = widgets,
+                                    firstLine=id==0))
+        if child.isExpanded():
+            for c in child.children():
+                self._addToCache(c, level+1, cache)
+
+    def _spliceItem(self, item:TTkTreeWidgetItem) -> None:
+        # Replace in the cache only the rows of the item and its subtree
+        cache = self._cache
+        try:
+            start = self._cacheItems.index(item)
+        except ValueError:
+            # The item is not displayed
+            return
+        level = cache[start].level
+        end = start+1
+        while end < len(cache) and (cache[end].item is item or cache[end].level > level):
+            end += 1
+        rows = []
+        self._addToCache(item, level, rows)
+        cache[start:end] = rows
+        self._cacheItems[start:end] = [row.item for row in rows]
+
     @pyTTkSlot()
     def _refreshCache(self) -> None:
         # I save a representation of the displayed tree in a cache array
@@ -454,49 +520,23 @@ class TTkTreeWidget(TTkAbstractScrollView):
         #
         # _cache is an array of TTkTreeWidget._Cache:
         # [ item, level, data=[txtCol1, txtCol2, txtCol3, ... ]]
-        self._cache = []
-        def _addToCache(_child, _level:int) -> None:
-            _data = []
-            _widgets = []
-            _h =_child.height()
-            for _il in range(len(self._header)):
-                _lines = _child.data(_il).split('\n')
-                if _il==0:
-                    _data0 = []
-                    for _id in range(_h):
-                        # Trying to define an icon to obtain this results on multiline field
-                        #  ▶ Label
-                        #  ┊ NewLine 1
-                        #  │ NewLine 2
-                        #  ╽
-                        if _id == 0:
-                            _icon = " "+_child.icon(_il)+" "
-                        elif _id == _h-1:
-                            _icon = TTkString(" ╽ ", TTkColor.fg("#666666"))
-                        elif _id == 1:
-                            _icon = TTkString(" ┊ ", TTkColor.fg("#666666"))
-                        else:
-                            _icon = TTkString(" │ ", TTkColor.fg("#666666"))
-                        _text = _lines[_id] if _id<len(_lines) else ""
-                        _data0.append('  '*_level+_icon+_text)
-                    _data.append(_data0)
-                    _widgets.append(_child.widget(_il))
-                else:
-                    _data.append([TTkString(s) for s in _lines]+[TTkString()]*(_h-len(_lines)))
-                    _widgets.append(_child.widget(_il))
-
-            for _id in range(_h):
-                self._cache.append(TTkTreeWidget._Cache(
-                                        item  = _child,
-                                        level = _level,
-                                        data  = [ dt[_id] for dt in _data],
-                                        widgets = _widgets,
-                                        firstLine=_id==0))
-            if _child.isExpanded():
-                for _c in _child.children():
-                   _addToCache(_c, _level+1)
-        for c in self._rootItem.children():
-            _addToCache(c,0)
+        #
+        # If the changed items are known (_dirtyItems) only their subtrees are rebuilt,
+        # any other change triggers the rebuild of the whole cache
+        dirty, self._dirtyItems = set(self._dirtyItems), []
+        if not dirty or self._rootItem in dirty:
+            self._cache = []
+            for c in self._rootItem.children():
+                self._addToCache(c, 0, self._cache)
+            self._cacheItems = [row.item for row in self._cache]
+        else:
+            for item in dirty:
+                # Skip the items already included in a dirty subtree
+                parent = item._parent
+                while parent and parent not in dirty:
+                    parent = parent._parent
+                if not parent:
+                    self._spliceItem(item)
         self._alignWidgets()
         self.update()
         self.viewChanged.emit()
@@ -528,9 +568,9 @@ class TTkTreeWidget(TTkAbstractScrollView):
             for sy in range(1,h):
                 canvas.drawChar(pos=(sx-x,sy), char=tt[4], color=lineColor)
 
-        # Draw cache
-        for i, c in enumerate(self._cache):
-            if i-y<0: continue
+        # Draw only the rows inside the viewport
+        for i in range(y, min(len(self._cache), y+h-1)):
+            c = self._cache[i]
             item  = c.item
             for il in range(len(self._header)):
                 lx = 0 if il==0 else self._columnsPos[il-1]+1
@@ -161,6 +161,7 @@ class TTkTreeWidgetItem(TTkAbstractItemModel):
             self._height = h
             self.heightChanged.emit(h)
             if self._parentWidget:
+                self._invalidate()
                 self._parentWidget._refreshCache()
 
     def height(self):
@@ -201,6 +202,11 @@ class TTkTreeWidgetItem(TTkAbstractItemModel):
 
 
 
+    def _invalidate(self):
+        # Notify the tree widget that the rows of this item and its subtree need to be refreshed
+        if self._parentWidget:
+            self._parentWidget._invalidateItem(self)
+
     def hasWidgets(self):
         return self._hasWidgets
 
@@ -210,6 +216,8 @@ class TTkTreeWidgetItem(TTkAbstractItemModel):
     def setHidden(self, hide):
         if hide == self._hidden: return
         self._hidden = hide
+        if self._parent:
+            self._parent._invalidate()
         self.dataChanged.emit()
 
     def childIndicatorPolicy(self):
@@ -232,11 +240,13 @@ class TTkTreeWidgetItem(TTkAbstractItemModel):
 
     def addChild(self, child):
         self._addChild(child)
+        self._invalidate()
         self.dataChanged.emit()
 
     def addChildren(self, children):
         for child in children:
             self._addChild(child)
+        self._invalidate()
         self.dataChanged.emit()
 
     def removeChild(self, child):
@@ -249,6 +259,7 @@ class TTkTreeWidgetItem(TTkAbstractItemModel):
         child = self._children.pop(index)
         child.dataChanged.disconnect(self.emitDataChanged)
         child.setTreeItemParent(None)
+        self._invalidate()
         self.dataChanged.emit()
         return child
 
@@ -258,6 +269,7 @@ class TTkTreeWidgetItem(TTkAbstractItemModel):
             child.dataChanged.disconnect(self.emitDataChanged)
             child.setTreeItemParent(None)
         self._children = []
+        self._invalidate()
         self.dataChanged.emit()
         return children
 
@@ -284,6 +296,7 @@ class TTkTreeWidgetItem(TTkAbstractItemModel):
         if col==0:
             self._defaultIcon = False
         self._icon[col] = icon
+        self._invalidate()
         self.dataChanged.emit()
 
     def textAlignment(self, col):
@@ -293,6 +306,7 @@ class TTkTreeWidgetItem(TTkAbstractItemModel):
 
     def setTextAlignment(self, col, alignment):
         self._alignment[col] = alignment
+        self._invalidate()
         self.dataChanged.emit()
 
     def data(self, col, role=None):
@@ -326,6 +340,7 @@ class TTkTreeWidgetItem(TTkAbstractItemModel):
         self._sortOrder = order
         if not self._children: return
         self._sort(children=True)
+        self._invalidate()
         self.dataChanged.emit()
 
     @pyTTkSlot()
@@ -348,6 +363,7 @@ class TTkTreeWidgetItem(TTkAbstractItemModel):
             _recurseHide(self)
         self._expanded = expand
         self._setDefaultIcon()
+        self._invalidate()
         self.emitDataChanged()
 
     def setSelected(self, select):
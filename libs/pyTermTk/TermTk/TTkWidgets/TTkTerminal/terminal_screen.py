@@ -23,7 +23,6 @@
 __all__ = []
 
 import collections
-import unicodedata
 from dataclasses import dataclass
 
 from TermTk.TTkCore.canvas import TTkCanvas
@@ -172,7 +171,7 @@ class _TTkTerminalScreen(_TTkTerminalScreen_CSI, _TTkTerminalScreen_C1):
                 if ord(ch) < 0x20:
                     # TTkLog.error(f"Unhandled ASCII: 0x{ord(ch):02x}")
                     continue
-                l = TTkString._getWidthText(ch)
+                l = TTkString._getWidthChar(ch)
                 # Scroll up if we are at the right border
                 if l+x > w:
                     x=0
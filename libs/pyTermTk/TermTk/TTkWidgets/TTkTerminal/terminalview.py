@@ -413,9 +413,9 @@ class TTkTerminalView(TTkAbstractScrollView, _TTkTerminal_CSI_DEC):
                             else:
                                 _termLog.warn(f"Unhandled color: <ESC>{slice}")
                         if mod:
-                            color = _TTkColor_mod(fg=fg, bg=bg, mod=mod, clean=clean)
+                            color = _TTkColor._intern(_TTkColor_mod(fg=fg, bg=bg, mod=mod, clean=clean))
                         else:
-                            color = _TTkColor(fg=fg, bg=bg, clean=clean)
+                            color = _TTkColor._intern(_TTkColor(fg=fg, bg=bg, clean=clean))
                         # color = TTkColor(fg=fg, bg=bg, mod=mod, clean=clean)
 
                     self._screen_alt.setColor(color)
@@ -962,7 +962,8 @@ class TTkTerminalView(TTkAbstractScrollView, _TTkTerminal_CSI_DEC):
                 TTkK.WHEEL_Right:(k, 3,'M')}.get(
                     evt.evt,(0,0,'M'))
             # _termLog.mouse(f'Mouse: <ESC>[<{k+km};{x};{y}{pr}')
-            self.termData.emit(f'\033[<{k+km};{x};{y}{pr}'.encode())
+            # The merged wheel steps are reported one by one
+            self.termData.emit(f'\033[<{k+km};{x};{y}{pr}'.encode()*evt.delta)
         else:
             head = {
                 TTkK.Press:     b'\033[M ',
@@ -979,7 +980,7 @@ class TTkTerminalView(TTkAbstractScrollView, _TTkTerminal_CSI_DEC):
             bah.append((x+32)%0xff)
             bah.append((y+32)%0xff)
             # _termLog.mouse(f'Mouse: '+bah.decode().replace('\033','<ESC>'))
-            self.termData.emit(bah)
+            self.termData.emit(bah*evt.delta)
         return True
 
     def mousePressEvent(self, evt:TTkMouseEvent) -> bool:
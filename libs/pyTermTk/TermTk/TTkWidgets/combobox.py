@@ -391,9 +391,10 @@ class TTkComboBox(TTkContainer):
 
     def wheelEvent(self, evt:TTkMouseEvent) -> bool:
         if evt.evt == TTkK.WHEEL_Up:
-            self.setCurrentIndex(self._id-1)
+            if self._id > 0:
+                self.setCurrentIndex(max(0, self._id-evt.delta))
         else:
-            self.setCurrentIndex(self._id+1)
+            self.setCurrentIndex(min(len(self._list)-1, self._id+evt.delta))
         return True
 
     def mousePressEvent(self, evt:TTkMouseEvent) -> bool:
@@ -101,6 +101,7 @@ class TTkContainer(TTkWidget):
     __slots__ = (
         '_padt', '_padb', '_padl', '_padr',
         '_forwardStyle',
+        '_childPlacements',
         '_layout')
 
     def __init__(self, *,
@@ -132,6 +133,7 @@ class TTkContainer(TTkWidget):
         :type forwardStyle: bool
         '''
         self._forwardStyle = forwardStyle
+        self._childPlacements = None
         if padding:
             self._padt = padding[0]
             self._padb = padding[1]
@@ -236,10 +238,108 @@ class TTkContainer(TTkWidget):
                 bh = min(iy+ih,ly+lh)-by
                 TTkContainer._paintChildCanvas(canvas, child, (bx,by,bw,bh), (ix+iox,iy+ioy))
 
+    @staticmethod
+    def _childCanvasPlacements(item, geometry, offset, placements:list) -> None:
+        ''' .. caution:: Don't touch this!
+
+        Same walk as :py:meth:`_paintChildCanvas`, it collects
+        (child, geometry, bound, visible) without painting
+        '''
+        lx,ly,lw,lh = geometry
+        ox, oy = offset
+        if item.layoutItemType() == TTkK.WidgetItem and not item.isEmpty():
+            child = item.widget()
+            cx,cy,cw,ch = child.geometry()
+            placements.append((child, (cx+ox, cy+oy, cw, ch), (lx, ly, lw, lh), child.getCanvas()._visible))
+        else:
+            for child in item.zSortedItems:
+                igx, igy, igw, igh = item.geometry()
+                iox, ioy = item.offset()
+                ix = igx+ox
+                iy = igy+oy
+                iw = igw
+                ih = igh
+                if ix+iw < lx and ix > lx+lw and iy+ih < ly and iy > ly+lh: continue
+                bx = max(ix,lx)
+                by = max(iy,ly)
+                bw = min(ix+iw,lx+lw)-bx
+                bh = min(iy+ih,ly+lh)-by
+                TTkContainer._childCanvasPlacements(child, (bx,by,bw,bh), (ix+iox,iy+ioy), placements)
+
+    def _canvasPlacements(self) -> list:
+        ''' .. caution:: Don't touch this! '''
+        placements = []
+        TTkContainer._childCanvasPlacements(self.rootLayout(), self.rootLayout().geometry(), self.rootLayout().offset(), placements)
+        return placements
+
+    def _canComposePartially(self, children) -> bool:
+        ''' .. caution:: Don't touch this!
+
+        The paintEvent can be skipped and only the damaged areas composed again if
+        the canvas still holds the previous frame and
+        the placement of the children did not change since the last full composition
+        '''
+        if getattr(self.paintChildCanvas, '__func__', None) is not TTkContainer.paintChildCanvas:
+            return False
+        if self._childPlacements is None:
+            return False
+        canvas = self._canvas
+        if (canvas._width, canvas._height) != (canvas._newWidth, canvas._newHeight):
+            return False
+        for child in children:
+            if child.getCanvas()._transparent:
+                return False
+        return self._canvasPlacements() == self._childPlacements
+
+    def _childDamage(self, child, damage) -> list:
+        ''' .. caution:: Don't touch this!
+
+        Translate the damaged areas of the child in the coordinates of this canvas,
+        cropped to the visible area of the child
+
+        :param damage: the damaged areas (x,y,w,h) of the child, None if the whole child is damaged
+        '''
+        for c, (gx,gy,gw,gh), (bx,by,bw,bh), _ in self._childPlacements:
+            if c is child: break
+        else:
+            return []
+        cw,ch = self._canvas.size()
+        xa = max(gx,bx,0)
+        ya = max(gy,by,0)
+        xb = min(gx+gw,bx+bw,cw)
+        yb = min(gy+gh,by+bh,ch)
+        if xa>=xb or ya>=yb: return []
+        if damage is None:
+            return [(xa,ya,xb-xa,yb-ya)]
+        ret = []
+        for dx,dy,dw,dh in damage:
+            dxa = max(xa,gx+dx)
+            dya = max(ya,gy+dy)
+            dxb = min(xb,gx+dx+dw)
+            dyb = min(yb,gy+dy+dh)
+            if dxa<dxb and dya<dyb:
+                ret.append((dxa,dya,dxb-dxa,dyb-dya))
+        return ret
+
     def paintChildCanvas(self) -> None:
         ''' .. caution:: Don't touch this! '''
         TTkContainer._paintChildCanvas(self._canvas, self.rootLayout(), self.rootLayout().geometry(), self.rootLayout().offset())
 
+    def _paintChildCanvasArea(self, area:tuple[int,int,int,int]) -> None:
+        ''' .. caution:: Don't touch this!
+
+        Compose again only the children intersecting the area (x,y,w,h) of this canvas,
+        the content outside this area is left untouched
+        '''
+        ax,ay,aw,ah = area
+        lx,ly,lw,lh = self.rootLayout().geometry()
+        bx = max(ax,lx)
+        by = max(ay,ly)
+        bw = min(ax+aw,lx+lw)-bx
+        bh = min(ay+ah,ly+lh)-by
+        if bw <= 0 or bh <= 0: return
+        TTkContainer._paintChildCanvas(self._canvas, self.rootLayout(), (bx,by,bw,bh), self.rootLayout().offset())
+
     def getPadding(self) -> TTkPadding:
         ''' Retrieve the :py:class:`TTkContainer`'s paddings sizes as shown in :ref:`Layout Topology <Container-Layout-Topology>`
 
@@ -27,25 +27,50 @@ __all__ = ['TTkGraph']
 # And of course:
 # https://github.com/aristocratos/bpytop
 
+from bisect import bisect_left
+from collections import deque
+from itertools import islice
+
 from TermTk.TTkCore.cfg import TTkCfg
 from TermTk.TTkCore.color import TTkColor
 from TermTk.TTkCore.constant import TTkK
 from TermTk.TTkWidgets.widget import TTkWidget
 
 class TTkGraph(TTkWidget):
-    __slots__ = ('_data', '_maxData', '_offset', '_direction', '_align', '_color')
+    '''
+    TTkGraph
+
+    The last **maxData** values are kept in a ring buffer.
+
+    With **decimation** > 1 every **decimation** values added are reduced
+    to their min and max, plotted in the same column.
+    '''
+    __slots__ = (
+        '_data', '_maxData', '_offset', '_direction', '_align', '_color',
+        '_count', '_maxQueue', '_minQueue',
+        '_decimation', '_bucket', '_bucketSize')
     def __init__(self, *,
                  color:TTkColor=TTkColor.RST,
                  maxData:int=0x1000,
                  direction:int=TTkK.RIGHT,
                  align:TTkK.Alignment=TTkK.CENTER,
+                 decimation:int=1,
                  **kwargs) -> None:
-        self._data = [[0]]
+        self._data = deque(maxlen=maxData)
+        # Monotonic queues of (valueId, value) used to get
+        # the max/min of the latest values without scanning them
+        self._count = 0
+        self._maxQueue = deque()
+        self._minQueue = deque()
+        self._decimation = decimation
+        self._bucket = None
+        self._bucketSize = 0
         self._offset = 0
         self._color = color
         self._align = align
         self._maxData = maxData
         self._direction = direction
+        self._append([0])
         super().__init__(**kwargs)
 
     def color(self):
@@ -56,10 +81,51 @@ class TTkGraph(TTkWidget):
             self._color = color
             self.update()
 
-    def addValue(self, values):
+    def maxData(self) -> int:
+        return self._maxData
+
+    def decimation(self) -> int:
+        return self._decimation
+
+    def _append(self, values):
+        count = self._count = self._count+1
+        vmax, vmin = max(values), min(values)
+        maxQueue, minQueue = self._maxQueue, self._minQueue
+        while maxQueue and maxQueue[-1][1] <= vmax: maxQueue.pop()
+        while minQueue and minQueue[-1][1] >= vmin: minQueue.pop()
+        maxQueue.append((count,vmax))
+        minQueue.append((count,vmin))
+        # Drop the values out of the ring buffer
+        if maxQueue[0][0] <= count-self._maxData: maxQueue.popleft()
+        if minQueue[0][0] <= count-self._maxData: minQueue.popleft()
         self._data.append(values)
+
+    def addValue(self, values):
+        if self._decimation <= 1:
+            self._append(values)
+        elif self._bucket is None:
+            self._bucket = (list(values),list(values))
+            self._bucketSize = 1
+        else:
+            bmin, bmax = self._bucket
+            for i,v in enumerate(values):
+                if v < bmin[i]: bmin[i] = v
+                if v > bmax[i]: bmax[i] = v
+            self._bucketSize += 1
+            if self._bucketSize < self._decimation:
+                return
+            self._append(bmin)
+            self._append(bmax)
+            self._bucket = None
         self.update()
 
+    def _range(self, num):
+        '''Return the max and min of the latest num values'''
+        first = self._count-num+1
+        vmax = self._maxQueue[bisect_left(self._maxQueue, (first,))][1]
+        vmin = self._minQueue[bisect_left(self._minQueue, (first,))][1]
+        return vmax, vmin
+
     def paintEvent(self, canvas):
         if not self._data: return
         w,h = self.size()
@@ -72,12 +138,27 @@ class TTkGraph(TTkWidget):
             y = h
         v1,v2 = [0],[0]
         i=0
-        data = self._data[-w*2:]
+        num = min(len(self._data), w*2)
+        if self._decimation > 1:
+            # The last value is always the max of a bucket,
+            # an even window starts at the min of a bucket
+            num -= num%2
+        if num <= 0: return
+        data = list(islice(reversed(self._data), num))[::-1]
         # TTkLog.debug(data)
         # TODO: use deep unpacking technique to grab couples of values
         # https://mathspp.com/blog/pydonts/enumerate-me#deep-unpacking
-        mv = max(max(map(max,data)),-min(map(min,data)))
+        vmax, vmin = self._range(num)
+        mv = max(vmax,-vmin)
         zoom = 2*h/mv if mv>0 else 1.0
+        if self._decimation > 1:
+            # Each column plots the (min,max) of a bucket
+            for i in range(0,num,2):
+                if self._direction == TTkK.RIGHT:
+                    canvas.drawHChart(pos=(x+i//2,y),values=(data[i],data[i+1]), zoom=zoom, color=self._color.modParam(val=-y))
+                else:
+                    canvas.drawHChart(pos=(w-(x+i//2+1),y),values=(data[i+1],data[i]), zoom=zoom, color=self._color.modParam(val=-y))
+            return
         for i in range(len(data)):
             v2 = v1
             v1 = data[i]
@@ -24,9 +24,62 @@ __all__ = ['TTkImage']
 
 from TermTk.TTkCore.color import TTkColor
 from TermTk.TTkCore.canvas import TTkCanvas
-from TermTk.TTkCore.string import TTkString
 from TermTk.TTkWidgets.widget import TTkWidget
 
+def _midColor(c1,c2):
+    return ((c1[0]+c2[0])//2,(c1[1]+c2[1])//2,(c1[2]+c2[2])//2)
+
+def _closer(a,b,c):
+    return \
+        ( (a[0]-c[0])**2 + (a[1]-c[1])**2 + (a[2]-c[2])**2 ) > \
+        ( (b[0]-c[0])**2 + (b[1]-c[1])**2 + (b[2]-c[2])**2 )
+
+def _reduceBlock(l, cache):
+    ''' quad/sex blitter notcurses like
+
+    return the bitmask of the pixels closer to the fg color and the (bg, fg) colors,
+    the results are memoized in the cache for the repeated blocks
+    (the pixels are tuples)
+    '''
+    if (ret := cache.get(l)) is not None:
+        return ret
+    deltaR = max(v[0] for v in l) - min(v[0] for v in l)
+    deltaG = max(v[1] for v in l) - min(v[1] for v in l)
+    deltaB = max(v[2] for v in l) - min(v[2] for v in l)
+
+    if deltaR >= deltaG and deltaR >= deltaB:
+        # Use Red as splitter
+        i = 0
+    elif deltaG >= deltaB and deltaG >= deltaR:
+        # Use Green as splitter
+        i = 1
+    else:
+        # Use Blue as splitter
+        i = 2
+
+    s = sorted(l,key=lambda x:x[i])
+    mid = (s[-1][i]+s[0][i])//2
+    if s[1][i] < mid:
+        if s[2][i] > mid:
+            c1 = _midColor(s[0],s[1])
+            c2 = _midColor(s[2],s[3])
+        else:
+            c1 = _midColor(s[0],s[1])
+            c1 = _midColor(c1,s[2])
+            c2 = s[3]
+    else:
+        c1 = s[0]
+        c2 = _midColor(s[1],s[2])
+        c2 = _midColor(c1,s[3])
+
+    ch = 0
+    for b,p in enumerate(l):
+        if _closer(c1,c2,p):
+            ch |= 1<<b
+
+    ret = cache[l] = (ch,c1,c2)
+    return ret
+
 class TTkImage(TTkWidget):
     FULLBLOCK = 0x00
     HALFBLOCK = 0x01
@@ -64,6 +117,9 @@ class TTkImage(TTkWidget):
         # 0x38 0x39 0x3A 0x3B 0x3C 0x3D 0x3E 0x3F
           '🬵', '🬶', '🬷', '🬸', '🬹', '🬺', '🬻', '█']
 
+    _rasterCache:dict = {}
+    _rasterCacheSize:int = 16
+
     __slots__ = ('_data', '_rasterType', '_canvasImage')
     def __init__(self, *,
                  data=None,
@@ -77,7 +133,9 @@ class TTkImage(TTkWidget):
             self.setData(self._data)
 
     def setData(self, data):
-        self._data = data
+        # The pixels are stored as tuples,
+        # they are the keys of the rasterised blocks and canvases
+        self._data = [[tuple(p) for p in row] for row in data]
         w = min(len(i) for i in self._data)
         h = len(self._data)
         if self._rasterType == TTkImage.FULLBLOCK:
@@ -88,11 +146,8 @@ class TTkImage(TTkWidget):
             w,h = w//2,h//2
         elif self._rasterType == TTkImage.SEXBLOCK:
             w,h = w//2,h//3
-        self._canvasImage.resize(*(self.size()))
         self.resize(w,h)
-        self._canvasImage.resize(w,h)
-        self._canvasImage.updateSize()
-        self._drawImage(self._canvasImage)
+        self._canvasImage = self._rasterise(w,h)
         self.update()
 
     def setRasteriser(self, rasteriser):
@@ -101,157 +156,77 @@ class TTkImage(TTkWidget):
         if self._data:
             self.setData(self._data)
 
-    def _reduceQuad(self, a,b,c,d):
-        # quadblitter notcurses like
-        l = (a,b,c,d)
-        def delta(i):
-            return max(v[i] for v in l) - min(v[i] for v in l)
-        deltaR = delta(0)
-        deltaG = delta(1)
-        deltaB = delta(2)
-
-        def midColor(c1,c2):
-            return ((c1[0]+c2[0])//2,(c1[1]+c2[1])//2,(c1[2]+c2[2])//2)
-
-        def closer(a,b,c):
-            return \
-                ( (a[0]-c[0])**2 + (a[1]-c[1])**2 + (a[2]-c[2])**2 ) > \
-                ( (b[0]-c[0])**2 + (b[1]-c[1])**2 + (b[2]-c[2])**2 )
-
-        def splitReduce(i):
-            s = sorted(l,key=lambda x:x[i])
-            mid = (s[3][i]+s[0][i])//2
-            if s[1][i] < mid:
-                if s[2][i] > mid:
-                    c1 = midColor(s[0],s[1])
-                    c2 = midColor(s[2],s[3])
-                else:
-                    c1 = midColor(s[0],s[1])
-                    c1 = midColor(c1,s[2])
-                    c2 = s[3]
-            else:
-                c1 = s[0]
-                c2 = midColor(s[1],s[2])
-                c2 = midColor(c1,s[3])
-
-
-            ch  = 0x01 if closer(c1,c2,l[0]) else 0
-            ch |= 0x02 if closer(c1,c2,l[1]) else 0
-            ch |= 0x04 if closer(c1,c2,l[2]) else 0
-            ch |= 0x08 if closer(c1,c2,l[3]) else 0
-
-            return  TTkString() + \
-                    (TTkColor.bg(f'#{c1[0]:02X}{c1[1]:02X}{c1[2]:02X}') +
-                     TTkColor.fg(f'#{c2[0]:02X}{c2[1]:02X}{c2[2]:02X}')) + \
-                    TTkImage._quadMap[ch]
-
-        if deltaR >= deltaG and deltaR >= deltaB:
-            # Use Red as splitter
-            return splitReduce(0)
-        elif deltaG >= deltaB and deltaG >= deltaR:
-            # Use Green as splitter
-            return splitReduce(1)
-        else:
-            # Use Blue as splitter
-            return splitReduce(2)
-
-    def _reduceSex(self, a,b,c,d,e,f):
-        # sexblitter notcurses like
-        l = (a,b,c,d,e,f)
-        def delta(i):
-            return max(v[i] for v in l) - min(v[i] for v in l)
-        deltaR = delta(0)
-        deltaG = delta(1)
-        deltaB = delta(2)
-
-        def midColor(c1,c2):
-            return ((c1[0]+c2[0])//2,(c1[1]+c2[1])//2,(c1[2]+c2[2])//2)
-
-        def closer(a,b,c):
-            return \
-                ( (a[0]-c[0])**2 + (a[1]-c[1])**2 + (a[2]-c[2])**2 ) > \
-                ( (b[0]-c[0])**2 + (b[1]-c[1])**2 + (b[2]-c[2])**2 )
-
-        def splitReduce(i):
-            s = sorted(l,key=lambda x:x[i])
-            mid = (s[5][i]+s[0][i])//2
-            if s[1][i] < mid:
-                if s[2][i] > mid:
-                    c1 = midColor(s[0],s[1])
-                    c2 = midColor(s[2],s[3])
-                else:
-                    c1 = midColor(s[0],s[1])
-                    c1 = midColor(c1,s[2])
-                    c2 = s[3]
-            else:
-                c1 = s[0]
-                c2 = midColor(s[1],s[2])
-                c2 = midColor(c1,s[3])
-
-
-            ch  = 0x01 if closer(c1,c2,l[0]) else 0
-            ch |= 0x02 if closer(c1,c2,l[1]) else 0
-            ch |= 0x04 if closer(c1,c2,l[2]) else 0
-            ch |= 0x08 if closer(c1,c2,l[3]) else 0
-            ch |= 0x10 if closer(c1,c2,l[4]) else 0
-            ch |= 0x20 if closer(c1,c2,l[5]) else 0
-
-            return  TTkString() + \
-                    (TTkColor.bg(f'#{c1[0]:02X}{c1[1]:02X}{c1[2]:02X}') +
-                     TTkColor.fg(f'#{c2[0]:02X}{c2[1]:02X}{c2[2]:02X}')) + \
-                    TTkImage._sexMap[ch]
-
-        if deltaR >= deltaG and deltaR >= deltaB:
-            # Use Red as splitter
-            return splitReduce(0)
-        elif deltaG >= deltaB and deltaG >= deltaR:
-            # Use Green as splitter
-            return splitReduce(1)
-        else:
-            # Use Blue as splitter
-            return splitReduce(2)
+    def _rasterise(self, w, h) -> TTkCanvas:
+        # The rasterised canvases are shared between the images
+        # with the same content, they are never drawn after this point
+        key = (self._rasterType, w, h, tuple(map(tuple,self._data)))
+        cache = TTkImage._rasterCache
+        if (canvas := cache.pop(key, None)) is not None:
+            cache[key] = canvas
+            return canvas
+        canvas = TTkCanvas(width=w, height=h)
+        self._drawImage(canvas)
+        cache[key] = canvas
+        while len(cache) > TTkImage._rasterCacheSize:
+            del cache[next(iter(cache))]
+        return canvas
 
     def rotHue(self, deg):
-        old = self._data
-        self._data = [[p for p in l ] for l in old]
-        for row in self._data:
-            for i,pixel in enumerate(row):
+        rotated = {}
+        def _rot(pixel):
+            key = (pixel[0],pixel[1],pixel[2])
+            if (ret := rotated.get(key)) is None:
                 h,s,l = TTkColor.rgb2hsl(pixel)
-                row[i] = TTkColor.hsl2rgb(((h+deg)%360,s,l))
+                ret = rotated[key] = TTkColor.hsl2rgb(((h+deg)%360,s,l))
+            return ret
+        self._data = [[_rot(p) for p in l] for l in self._data]
         self.setData(self._data)
 
     def _drawImage(self, canvas):
         img = self._data
-        if self._rasterType == TTkImage.FULLBLOCK:
-            for y in range(0, len(img)):
-                for x in range(0, len(img[y])):
-                    c1 = img[y][x]
+        colors = {}
+        def _color(c1,c2=None):
+            # Convert and combine the rgb tuples only once per image
+            key = (c1[0],c1[1],c1[2]) if c2 is None else (c1[0],c1[1],c1[2],c2[0],c2[1],c2[2])
+            if (color := colors.get(key)) is None:
+                if c2 is None:
                     color = TTkColor.fg(f'#{c1[0]:02X}{c1[1]:02X}{c1[2]:02X}')
-                    canvas.drawChar(pos=(x,y), char='█', color=color)
+                elif self._rasterType == TTkImage.HALFBLOCK:
+                    color = ( TTkColor.fg(f'#{c1[0]:02X}{c1[1]:02X}{c1[2]:02X}') +
+                              TTkColor.bg(f'#{c2[0]:02X}{c2[1]:02X}{c2[2]:02X}') )
+                else:
+                    color = ( TTkColor.bg(f'#{c1[0]:02X}{c1[1]:02X}{c1[2]:02X}') +
+                              TTkColor.fg(f'#{c2[0]:02X}{c2[1]:02X}{c2[2]:02X}') )
+                colors[key] = color
+            return color
+        if self._rasterType == TTkImage.FULLBLOCK:
+            for y,row in enumerate(img):
+                for x,c1 in enumerate(row):
+                    canvas.drawChar(pos=(x,y), char='█', color=_color(c1))
         elif self._rasterType == TTkImage.HALFBLOCK:
             for y in range(0, len(img)&(~1), 2):
-                for x in range(0, len(img[y])):
-                    c1, c2 = img[y][x] ,img[y+1][x]
-                    color = ( TTkColor.fg(f'#{c1[0]:02X}{c1[1]:02X}{c1[2]:02X}') +
-                             TTkColor.bg(f'#{c2[0]:02X}{c2[1]:02X}{c2[2]:02X}') )
-                    canvas.drawChar(pos=(x,y//2), char='▀', color=color)
+                row1, row2 = img[y], img[y+1]
+                for x in range(0, len(row1)):
+                    canvas.drawChar(pos=(x,y//2), char='▀', color=_color(row1[x],row2[x]))
         elif self._rasterType == TTkImage.QUADBLOCK:
+            blocks = {}
             for y in range(0, len(img)&(~1), 2):
-                for x in range(0, min(len(img[y])&(~1),len(img[y+1])&(~1)), 2):
-                    canvas.drawText(
-                            pos=(x//2,y//2),
-                            text=self._reduceQuad(
-                                        img[y][x]   , img[y][x+1]   ,
-                                        img[y+1][x] , img[y+1][x+1] ))
+                row1, row2 = img[y], img[y+1]
+                for x in range(0, min(len(row1)&(~1),len(row2)&(~1)), 2):
+                    block = (row1[x], row1[x+1],
+                             row2[x], row2[x+1])
+                    ch,c1,c2 = _reduceBlock(block, blocks)
+                    canvas.drawChar(pos=(x//2,y//2), char=TTkImage._quadMap[ch], color=_color(c1,c2))
         elif self._rasterType == TTkImage.SEXBLOCK:
+            blocks = {}
             for y in range(0, len(img)-2, 3):
-                for x in range(0, min(len(img[y])-1,len(img[y+1])-1,len(img[y+2])-1), 2):
-                    canvas.drawText(
-                            pos=(x//2,y//3),
-                            text=self._reduceSex(
-                                        img[y][x]   , img[y][x+1]   ,
-                                        img[y+1][x] , img[y+1][x+1] ,
-                                        img[y+2][x] , img[y+2][x+1] ))
+                row1, row2, row3 = img[y], img[y+1], img[y+2]
+                for x in range(0, min(len(row1)-1,len(row2)-1,len(row3)-1), 2):
+                    block = (row1[x], row1[x+1],
+                             row2[x], row2[x+1],
+                             row3[x], row3[x+1])
+                    ch,c1,c2 = _reduceBlock(block, blocks)
+                    canvas.drawChar(pos=(x//2,y//3), char=TTkImage._sexMap[ch], color=_color(c1,c2))
 
     def paintEvent(self, canvas: TTkCanvas):
         w,h=self.size()
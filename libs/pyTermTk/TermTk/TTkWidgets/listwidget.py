@@ -35,90 +35,62 @@ from TermTk.TTkCore.TTkTerm.inputkey import TTkKeyEvent
 from TermTk.TTkCore.TTkTerm.inputmouse import TTkMouseEvent
 from TermTk.TTkGui.drag import TTkDrag, TTkDnDEvent
 
-from TermTk.TTkWidgets.widget import TTkWidget
+from TermTk.TTkAbstract.abstractitemmodel import TTkAbstractItemModel
 from TermTk.TTkAbstract.abstractscrollview import TTkAbstractScrollView
 
-class TTkAbstractListItem(TTkWidget):
-    '''TTkAbstractListItem'''
+class TTkAbstractListItem(TTkAbstractItemModel):
+    '''
+    The :py:class:`TTkAbstractListItem` is the lightweight item model used by :py:class:`TTkListWidget`.
 
-    classStyle = TTkWidget.classStyle | {
-                'default':     {'color': TTkColor.RST},
-                'highlighted': {'color': TTkColor.bg('#008855')+TTkColor.UNDERLINE},
-                'hover':       {'color': TTkColor.bg('#0088FF')},
-                'selected':    {'color': TTkColor.bg('#0055FF')},
-                'clicked':     {'color': TTkColor.fg('#FFFF00')},
-                'disabled':    {'color': TTkColor.fg('#888888')},
-            }
+    It is not a widget, the list paints only the items inside its viewport.
+    '''
 
-    __slots__ = ('_text', '_selected', '_highlighted', '_data',
-                 '_lowerText', '_quickVisible',
+    __slots__ = ('_text', '_lowerText', '_data',
+                 '_selected', '_highlighted', '_listWidget',
+                 # Signals
                  'listItemClicked')
-    def __init__(self, *, text='', data=None, **kwargs) -> None:
+    def __init__(self, *, text='', data=None) -> None:
         self.listItemClicked = pyTTkSignal(TTkAbstractListItem)
 
         self._selected = False
         self._highlighted = False
+        self._listWidget = None
 
         self._text = TTkString(text)
-        self._lowerText = str(self._text).lower()
-        self._quickVisible = True
+        self._lowerText = (text if isinstance(text,str) else str(self._text)).lower()
         self._data  = data
 
-        super().__init__(**kwargs)
-
-        self.setFocusPolicy(TTkK.ParentFocus)
+        super().__init__()
 
-    def text(self):
+    def text(self) -> TTkString:
+        '''text'''
         return self._text
 
-    def setText(self, text):
+    def setText(self, text) -> None:
+        '''setText'''
         self._text = TTkString(text)
         self._lowerText = str(self._text).lower()
-        self.update()
+        if self._listWidget:
+            self._listWidget._itemTextChanged()
+        self.dataChanged.emit()
 
     def data(self):
         '''data'''
         return self._data
 
-    def setData(self, data):
+    def setData(self, data) -> None:
         '''setData'''
         if self._data == data: return
         self._data = data
-        self.update()
-
-    def mousePressEvent(self, evt:TTkMouseEvent) -> bool:
-        self.listItemClicked.emit(self)
-        return True
+        self.dataChanged.emit()
 
-    def _setSelected(self, selected):
+    def _setSelected(self, selected) -> None:
         if self._selected == selected: return
         self._selected = selected
         self._highlighted = not selected
-        self.update()
 
-    def _setHighlighted(self, highlighted):
-        if self._highlighted == highlighted: return
+    def _setHighlighted(self, highlighted) -> None:
         self._highlighted = highlighted
-        self.update()
-
-    def geometry(self):
-        if self._quickVisible:
-            return super().geometry()
-        else:
-            return 0,0,0,0
-
-    def paintEvent(self, canvas):
-        color = (style:=self.currentStyle())['color']
-        if self._highlighted:
-            color = color+self.style()['highlighted']['color']
-        if self._selected:
-            color = color+self.style()['selected']['color']
-        if style==self.style()['hover']:
-            color = color+self.style()['hover']['color']
-
-        w = self.width()
-
-        canvas.drawTTkString(pos=(0,0), width=w, color=color ,text=self._text)
 
 class TTkListWidget(TTkAbstractScrollView):
     '''
@@ -178,7 +150,13 @@ class TTkListWidget(TTkAbstractScrollView):
     '''
 
     classStyle = {
-        'default':{'searchColor': TTkColor.fg("#FFFF00") + TTkColor.UNDERLINE}}
+                'default':     {'color': TTkColor.RST,
+                                'highlightedColor': TTkColor.bg('#008855')+TTkColor.UNDERLINE,
+                                'hoverColor':       TTkColor.bg('#0088FF'),
+                                'selectedColor':    TTkColor.bg('#0055FF'),
+                                'searchColor':      TTkColor.fg("#FFFF00") + TTkColor.UNDERLINE},
+                'disabled':    {'color': TTkColor.fg('#888888')},
+            }
 
     @dataclass(frozen=True)
     class _DropListData:
@@ -186,8 +164,8 @@ class TTkListWidget(TTkAbstractScrollView):
         items: list
 
     __slots__ = ('_selectedItems', '_selectionMode',
-                 '_highlighted', '_items', '_filteredItems',
-                 '_dragPos', '_dndMode',
+                 '_highlighted', '_items', '_filteredItems', '_filterCache',
+                 '_hoverRow', '_dragPos', '_dndMode',
                  '_searchText', '_showSearch',
                  # Signals
                  'itemClicked', 'textClicked', 'searchModified')
@@ -217,7 +195,11 @@ class TTkListWidget(TTkAbstractScrollView):
         self._selectedItems:list[TTkAbstractListItem] = []
         self._items:list[TTkAbstractListItem]= []
         self._filteredItems:list[TTkAbstractListItem] = self._items
+        # Stack of the (search, filteredItems) already evaluated,
+        # each entry is a subset of the previous one
+        self._filterCache:list[tuple[str,list[TTkAbstractListItem]]] = []
         self._highlighted = None
+        self._hoverRow = None
         self._dragPos = None
         self._dndMode = dragDropMode
         self._searchText:str = ''
@@ -225,15 +207,9 @@ class TTkListWidget(TTkAbstractScrollView):
         # Init Super
         super().__init__(**kwargs)
         self.addItems(items)
-        self.viewChanged.connect(self._viewChangedHandler)
         self.setFocusPolicy(TTkK.ClickFocus + TTkK.TabFocus)
         self.searchModified.connect(self._searchModifiedHandler)
 
-    @pyTTkSlot()
-    def _viewChangedHandler(self):
-        x,y = self.getViewOffsets()
-        self.layout().setOffset(-x,-y)
-
     @pyTTkSlot(TTkAbstractListItem)
     def _labelSelectedHandler(self, label:TTkAbstractListItem):
         if self._selectionMode == TTkK.SingleSelection:
@@ -254,9 +230,31 @@ class TTkListWidget(TTkAbstractScrollView):
             self._highlighted._setHighlighted(False)
         label._setHighlighted(True)
         self._highlighted = label
+        self.update()
+        label.listItemClicked.emit(label)
         self.itemClicked.emit(label)
         self.textClicked.emit(label.text())
 
+    def _filter(self, text:str) -> list[TTkAbstractListItem]:
+        # Narrow down the closest previous search containing this text,
+        # typing refines the last result and backspace reuses the cached one
+        cache = self._filterCache
+        while cache and cache[-1][0] not in text:
+            cache.pop()
+        if cache and cache[-1][0] == text:
+            return cache[-1][1]
+        items = cache[-1][1] if cache else self._items
+        filtered = [i for i in items if text in i._lowerText]
+        cache.append((text, filtered))
+        return filtered
+
+    def _itemTextChanged(self) -> None:
+        self._filterCache.clear()
+        if self._searchText:
+            self._searchModifiedHandler()
+        else:
+            self.update()
+
     @pyTTkSlot(str)
     def _searchModifiedHandler(self, text:str='s') -> None:
         if self._searchVisibility and self._searchText:
@@ -265,14 +263,10 @@ class TTkListWidget(TTkAbstractScrollView):
             self.setPadding(0,0,0,0)
 
         if self._searchText:
-            text = self._searchText.lower()
-            self._filteredItems = [i for i in self._items if text in i._lowerText]
-            for item in self._items:
-                item._quickVisible = text in item._lowerText
+            self._filteredItems = self._filter(self._searchText.lower())
         else:
+            self._filterCache.clear()
             self._filteredItems = self._items
-            for item in self._items:
-                item.setVisible(True)
 
         self._placeItems()
 
@@ -325,15 +319,9 @@ class TTkListWidget(TTkAbstractScrollView):
         '''filteredItems'''
         return self._filteredItems
 
-    def resizeEvent(self, w, h):
-        maxw = 0
-        for item in self.layout().children():
-            maxw = max(maxw,item.minimumWidth())
-        maxw = max(self.width(),maxw)
-        for item in self.layout().children():
-            x,y,_,h = item.geometry()
-            item.setGeometry(x,y,maxw,h)
-        TTkAbstractScrollView.resizeEvent(self, w, h)
+    def viewFullAreaSize(self) -> tuple[int,int]:
+        t,b,l,r = self.getPadding()
+        return self.width()+l+r, len(self._filteredItems)+t+b
 
     def addItem(self, item, data=None):
         '''addItem'''
@@ -344,15 +332,16 @@ class TTkListWidget(TTkAbstractScrollView):
         self.addItemsAt(items=items, pos=len(self._items))
 
     def _placeItems(self):
-        minw = self.width()
-        for item in self._items:
-            if item in self._filteredItems:
-                minw = max(minw,item.minimumWidth())
-        for y,item in enumerate(self._filteredItems):
-            item.setGeometry(0,y,minw,1)
         self.viewChanged.emit()
         self.update()
 
+    def _refreshItems(self):
+        # The cached searches are no longer valid after a change in the items
+        self._filterCache.clear()
+        if self._searchText:
+            self._filteredItems = self._filter(self._searchText.lower())
+        self._placeItems()
+
     def addItemAt(self, item, pos, data=None):
         '''addItemAt'''
         if isinstance(item, str) or isinstance(item, TTkString):
@@ -367,17 +356,16 @@ class TTkListWidget(TTkAbstractScrollView):
                 TTkLog.error(f"{item=} is not an TTkAbstractListItem")
                 return
         for item in items:
-            item.listItemClicked.connect(self._labelSelectedHandler)
+            item._listWidget = self
         self._items[pos:pos] = items
-        self.layout().addWidgets(items)
-        self._placeItems()
+        self._refreshItems()
 
     def indexOf(self, item):
         '''indexOf'''
-        for i, it in enumerate(self._items):
-            if it == item:
-                return i
-        return -1
+        try:
+            return self._items.index(item)
+        except ValueError:
+            return -1
 
     def itemAt(self, pos):
         '''itemAt'''
@@ -389,7 +377,7 @@ class TTkListWidget(TTkAbstractScrollView):
         to = max(min(to,len(self._items)-1),0)
         # Swap
         self._items[to] , self._items[fr] = self._items[fr] , self._items[to]
-        self._placeItems()
+        self._refreshItems()
 
     def removeItem(self, item):
         '''removeItem'''
@@ -397,17 +385,18 @@ class TTkListWidget(TTkAbstractScrollView):
 
     def removeItems(self, items):
         '''removeItems'''
-        self.layout().removeWidgets(items)
-        for item in items.copy():
-            item.listItemClicked.disconnect(self._labelSelectedHandler)
+        # items may be the list returned by items()
+        removed = set(items)
+        for item in removed:
+            item._listWidget = None
             item._setSelected(False)
             item._setHighlighted(False)
-            self._items.remove(item)
-            if item in self._selectedItems:
-                self._selectedItems.remove(item)
-            if item == self._highlighted:
-                self._highlighted = None
-        self._placeItems()
+        self._items[:] = [i for i in self._items if i not in removed]
+        self._selectedItems = [i for i in self._selectedItems if i not in removed]
+        if self._highlighted in removed:
+            self._highlighted = None
+        self._hoverRow = None
+        self._refreshItems()
 
     def removeAt(self, pos):
         '''removeAt'''
@@ -421,21 +410,45 @@ class TTkListWidget(TTkAbstractScrollView):
 
     def setCurrentItem(self, item):
         '''setCurrentItem'''
-        item.listItemClicked.emit(item)
+        self._labelSelectedHandler(item)
 
     def _moveToHighlighted(self):
-        index = self._items.index(self._highlighted)
-        h = self.height()
+        try:
+            index = self._filteredItems.index(self._highlighted)
+        except ValueError:
+            return
+        t,b,_,_ = self.getPadding()
+        h = self.height()-t-b
         offx,offy = self.getViewOffsets()
         if index >= h+offy-1:
-            TTkLog.debug(f"{index} {h} {offy}")
             self.viewMoveTo(offx, index-h+1)
         elif index <= offy:
             self.viewMoveTo(offx, index)
 
+    def _itemAtPos(self, y:int):
+        t,_,_,_ = self.getPadding()
+        _,offy = self.getViewOffsets()
+        row = y-t+offy
+        if y >= t and 0 <= row < len(self._filteredItems):
+            return row
+        return None
+
     def mousePressEvent(self, evt:TTkMouseEvent) -> bool:
+        if (row:=self._itemAtPos(evt.y)) is not None:
+            self._labelSelectedHandler(self._filteredItems[row])
+        return True
+
+    def mouseMoveEvent(self, evt:TTkMouseEvent) -> bool:
+        if (row:=self._itemAtPos(evt.y)) != self._hoverRow:
+            self._hoverRow = row
+            self.update()
         return True
 
+    def leaveEvent(self, evt:TTkMouseEvent) -> bool:
+        self._hoverRow = None
+        self.update()
+        return super().leaveEvent(evt)
+
     def mouseDragEvent(self, evt:TTkMouseEvent) -> bool:
         if not(self._dndMode & TTkK.DragDropMode.AllowDrag):
             return False
@@ -493,8 +506,6 @@ class TTkListWidget(TTkAbstractScrollView):
         if wid and items:
             wid.removeItems(items)
             wid._searchModifiedHandler()
-            for it in items:
-                it.setCurrentStyle(it.style()['default'])
             yPos = offy+evt.y-t
             if self._filteredItems:
                 if yPos < 0:
@@ -519,8 +530,7 @@ class TTkListWidget(TTkAbstractScrollView):
         if ( not self._searchText and evt.type == TTkK.Character and evt.key==" " ) or \
            ( evt.type == TTkK.SpecialKey and evt.key == TTkK.Key_Enter ):
             if self._highlighted:
-                # TTkLog.debug(self._highlighted)
-                self._highlighted.listItemClicked.emit(self._highlighted)
+                self._labelSelectedHandler(self._highlighted)
 
         elif evt.type == TTkK.Character:
             # Add this char to the search text
@@ -575,6 +585,7 @@ class TTkListWidget(TTkAbstractScrollView):
             self._highlighted = self._filteredItems[index]
             self._highlighted._setHighlighted(True)
             self._moveToHighlighted()
+            self.update()
 
         else:
             return False
@@ -586,33 +597,44 @@ class TTkListWidget(TTkAbstractScrollView):
             self._highlighted = self._items[0]
         self._highlighted._setHighlighted(True)
         self._moveToHighlighted()
+        self.update()
 
     def focusOutEvent(self):
         if self._highlighted:
             self._highlighted._setHighlighted(False)
         self._dragPos = None
-
-    # Stupid hack to paint on top of the child widgets
-    def paintChildCanvas(self):
-        super().paintChildCanvas()
-        if self._dragPos:
-            canvas = self.getCanvas()
-            x,y = self._dragPos
-            offx,offy = self.getViewOffsets()
-            p1 = (0,y-offy-1)
-            p2 = (0,y-offy)
-            canvas.drawText(pos=p1,text="╙─╼", color=TTkColor.fg("#FFFF00")+TTkColor.bg("#008855"))
-            canvas.drawText(pos=p2,text="╓─╼", color=TTkColor.fg("#FFFF00")+TTkColor.bg("#008855"))
+        self.update()
 
     def paintEvent(self, canvas):
+        style = self.currentStyle()
+        w,h = self.size()
+        t,b,_,_ = self.getPadding()
+        offx,offy = self.getViewOffsets()
+
+        # Draw only the rows inside the viewport
+        items = self._filteredItems
+        for row in range(offy, min(len(items), offy+h-t-b)):
+            item = items[row]
+            color = style['color']
+            if item._highlighted:
+                color = color+style['highlightedColor']
+            if item._selected:
+                color = color+style['selectedColor']
+            if row == self._hoverRow:
+                color = color+style['hoverColor']
+            canvas.drawTTkString(pos=(-offx,row-offy+t), width=w, color=color, text=item._text)
+
         if self._searchVisibility and self._searchText:
-            w,h = self.size()
-            color = self.currentStyle()['searchColor']
+            color = style['searchColor']
             if len(self._searchText) > w:
                 text = TTkString("≼",TTkColor.BG_BLUE+TTkColor.FG_CYAN)+TTkString(self._searchText[-w+1:],color)
             else:
                 text = TTkString(self._searchText,color)
             canvas.drawTTkString(pos=(0,0),text=text, color=color, width=w)
 
-
-
+        if self._dragPos:
+            x,y = self._dragPos
+            p1 = (0,y-offy-1)
+            p2 = (0,y-offy)
+            canvas.drawText(pos=p1,text="╙─╼", color=TTkColor.fg("#FFFF00")+TTkColor.bg("#008855"))
+            canvas.drawText(pos=p2,text="╓─╼", color=TTkColor.fg("#FFFF00")+TTkColor.bg("#008855"))
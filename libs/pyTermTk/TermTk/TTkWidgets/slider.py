@@ -52,11 +52,11 @@ class TTkSlider(TTkScrollBar):
 
     def wheelEvent(self, evt:TTkMouseEvent) -> bool:
         if self._orientation == TTkK.VERTICAL:
-            if evt.evt == TTkK.WHEEL_Up: value = self._value+self._pageStep
-            else:                        value = self._value-self._pageStep
+            if evt.evt == TTkK.WHEEL_Up: value = self._value+self._pageStep*evt.delta
+            else:                        value = self._value-self._pageStep*evt.delta
         else:
-            if evt.evt == TTkK.WHEEL_Up: value = self._value-self._pageStep
-            else:                        value = self._value+self._pageStep
+            if evt.evt == TTkK.WHEEL_Up: value = self._value-self._pageStep*evt.delta
+            else:                        value = self._value+self._pageStep*evt.delta
         self.setValue(max(self._minimum,min(self._maximum,value)))
         self.sliderMoved.emit(self._value)
         return True
@@ -125,9 +125,9 @@ class TTkSpinBox(TTkContainer):
 
     def wheelEvent(self, evt:TTkMouseEvent) -> bool:
         if evt.evt == TTkK.WHEEL_Up:
-            self.setValue(self._value+1)
+            self.setValue(self._value+evt.delta)
         else:
-            self.setValue(self._value-1)
+            self.setValue(self._value-evt.delta)
         return True
 
     def keyEvent(self, evt:TTkKeyEvent) -> bool:
@@ -498,21 +498,21 @@ class TTkTabBar(TTkContainer):
 
         self.update()
 
-    def _moveToTheLeft(self):
-        self._currentIndex = max(self._currentIndex-1,0)
+    def _moveToTheLeft(self, steps:int=1):
+        self._currentIndex = max(self._currentIndex-steps,0)
         self._highlighted = self._currentIndex
         self._updateTabs()
 
-    def _andMoveToTheRight(self):
-        self._currentIndex = min(self._currentIndex+1,len(self._tabButtons)-1)
+    def _andMoveToTheRight(self, steps:int=1):
+        self._currentIndex = min(self._currentIndex+steps,len(self._tabButtons)-1)
         self._highlighted = self._currentIndex
         self._updateTabs()
 
     def wheelEvent(self, evt:TTkMouseEvent) -> bool:
         if evt.evt == TTkK.WHEEL_Up:
-            self._moveToTheLeft()
+            self._moveToTheLeft(evt.delta)
         else:
-            self._andMoveToTheRight()
+            self._andMoveToTheRight(evt.delta)
         return True
 
     def keyEvent(self, evt:TTkKeyEvent) -> bool:
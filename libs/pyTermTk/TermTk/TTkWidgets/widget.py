@@ -34,6 +34,7 @@ from TermTk.TTkCore.helper    import TTkHelper
 from TermTk.TTkCore.color     import TTkColor
 from TermTk.TTkCore.string    import TTkString
 from TermTk.TTkCore.canvas    import TTkCanvas
+from TermTk.TTkCore.canvas_array import TTkCanvasArray
 from TermTk.TTkCore.signal    import pyTTkSignal, pyTTkSlot
 from TermTk.TTkTemplates.dragevents import TDragEvents
 from TermTk.TTkTemplates.mouseevents import TMouseEvents
@@ -227,7 +228,7 @@ class TTkWidget(TMouseEvents,TKeyEvents, TDragEvents):
         if addStyle:
             self.mergeStyle(addStyle)
 
-        self._canvas = TTkCanvas(
+        self._canvas = (TTkCanvasArray if TTkCfg.arrayCanvas else TTkCanvas)(
                             width  = self._width  ,
                             height = self._height )
 
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2025 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Headless rendering benchmark
+#
+# The scenes defined in scenes.py are rendered on a headless terminal
+# (tests/pytest/mock_term.py) and driven by scripted input,
+# each scene runs in its own process and reports:
+#   fps         - frames rendered per second (input step + paint)
+#   bytes/frame - bytes pushed to the terminal for each frame (after the first full repaint)
+#   KiB/frame   - peak memory allocated while processing a frame (tracemalloc)
+#   RSS MiB     - peak resident set size of the process
+#
+# Usage:
+#   python3 tests/benchmark/benchmark.py                # compare with the stored baseline
+#   python3 tests/benchmark/benchmark.py --save         # store the results as the new baseline
+#   python3 tests/benchmark/benchmark.py big_table -f 500 -t 0.1
+#
+# The fps baseline depends on the machine, store it on the reference host
+
+import sys, os
+import argparse
+import json
+import platform
+import subprocess
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+sys.path.append(os.path.join(sys.path[0],'../pytest'))
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)),'baseline.json')
+
+# metric: (label, higher is better)
+METRICS = {
+    'fps'           : ('fps',         True),
+    'bytesPerFrame' : ('bytes/frame', False),
+    'allocKiB'      : ('KiB/frame',   False),
+    'peakRssMiB'    : ('RSS MiB',     False),
+}
+
+def _runScene(name, frames, allocFrames):
+    from mock_term  import Mock_TTkTerm
+    from mock_input import Mock_TTkInput
+
+    class _HeadlessTerm(Mock_TTkTerm):
+        pushed = 0
+        @staticmethod
+        def push(*args):
+            _HeadlessTerm.pushed += sum(len(str(a).encode()) for a in args)
+
+    moduleTerm = type(sys)('TermTk.TTkCore.drivers.term_unix')
+    moduleTerm.TTkTerm = _HeadlessTerm
+    moduleInput = type(sys)('TermTk.TTkCore.TTkTerm.input')
+    moduleInput.TTkInput = Mock_TTkInput
+    sys.modules['TermTk.TTkCore.drivers.term_unix'] = moduleTerm
+    sys.modules['TermTk.TTkCore.TTkTerm.input'] = moduleInput
+
+    import TermTk as ttk
+    from scenes import SCENES
+
+    root = ttk.TTk()
+    root.show()
+
+    def _frame():
+        with root._drawMutex:
+            ttk.TTkHelper.paintAll()
+
+    step = SCENES[name](root)
+    _frame()
+
+    pushed = _HeadlessTerm.pushed
+    startTime = time.perf_counter()
+    for i in range(frames):
+        step(i)
+        _frame()
+    elapsed = time.perf_counter() - startTime
+    pushed = _HeadlessTerm.pushed - pushed
+
+    tracemalloc.start()
+    allocated = 0
+    for i in range(frames, frames+allocFrames):
+        current,_ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        step(i)
+        _frame()
+        allocated += tracemalloc.get_traced_memory()[1] - current
+    tracemalloc.stop()
+
+    peakRss = 0
+    if resource:
+        peakRss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and KiB on Linux
+        peakRss /= 1024*1024 if platform.system() == 'Darwin' else 1024
+
+    return {
+        'fps'           : round(frames/elapsed, 1),
+        'bytesPerFrame' : round(pushed/frames),
+        'allocKiB'      : round(allocated/allocFrames/1024, 1),
+        'peakRssMiB'    : round(peakRss, 1)}
+
+def _compare(results, baseline, threshold):
+    failed = []
+    print(f"{'scene':<18}" + ''.join(f"{label:>22}" for label,_ in METRICS.values()))
+    for name,res in results.items():
+        line = f"{name:<18}"
+        for metric,(_,higherIsBetter) in METRICS.items():
+            value = res[metric]
+            ref = baseline.get(name,{}).get(metric)
+            if not ref:
+                line += f"{value:>22}"
+                continue
+            delta = (value-ref)/ref
+            regression = -delta if higherIsBetter else delta
+            mark = ' '
+            if regression > threshold:
+                mark = '!'
+                failed.append(f"{name}:{metric} {ref} -> {value}")
+            line += f"{value:>12} ({delta:+6.1%}){mark}"
+        print(line)
+    return failed
+
+def main():
+    parser = argparse.ArgumentParser(description='pyTermTk headless rendering benchmark')
+    parser.add_argument('scenes', nargs='*', help='scenes to run (default: all)')
+    parser.add_argument('-f', '--frames', type=int, default=300, help='frames rendered for each scene')
+    parser.add_argument('-a', '--allocFrames', type=int, default=20, help='frames traced for the allocations')
+    parser.add_argument('-t', '--threshold', type=float, default=0.25, help='max regression allowed (0.25 = 25%%)')
+    parser.add_argument('-b', '--baseline', default=BASELINE, help='baseline file')
+    parser.add_argument('-s', '--save', action='store_true', help='store the results as the baseline')
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(_runScene(args.child, args.frames, args.allocFrames)))
+        sys.stdout.flush()
+        # Do not wait for the timers of the scene
+        os._exit(0)
+
+    # Imported only here, the scenes import TermTk
+    # and the child process requires the headless terminal
+    from scenes import SCENES
+    scenes = args.scenes or list(SCENES)
+    if unknown := [s for s in scenes if s not in SCENES]:
+        parser.error(f"Unknown scenes: {unknown}")
+
+    results = {}
+    for name in scenes:
+        proc = subprocess.run(
+                [sys.executable, os.path.abspath(__file__), '--child', name,
+                 '-f', str(args.frames), '-a', str(args.allocFrames)],
+                capture_output=True, text=True)
+        if proc.returncode:
+            print(proc.stderr, file=sys.stderr)
+            sys.exit(f"Scene {name} failed")
+        results[name] = json.loads(proc.stdout.splitlines()[-1])
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f).get('scenes',{})
+
+    failed = _compare(results, baseline, args.threshold)
+
+    if args.save:
+        with open(args.baseline,'w') as f:
+            json.dump({
+                'python'   : platform.python_version(),
+                'platform' : f"{platform.system()} {platform.machine()}",
+                'frames'   : args.frames,
+                'scenes'   : baseline | results}, f, indent=2)
+        print(f"Baseline saved in {args.baseline}")
+    elif failed:
+        print(f"Regressions above {args.threshold:.0%}:")
+        for f in failed:
+            print(f"  {f}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
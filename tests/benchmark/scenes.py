@@ -0,0 +1,123 @@
+# MIT License
+#
+# Copyright (c) 2025 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+# Canonical scenes used by benchmark.py
+#
+# Each scene builds its widgets on the root and returns the step
+# function called before each frame with the frame number,
+# the steps drive the scene through scripted input events
+
+__all__ = ['SCENES']
+
+import os
+
+import TermTk as ttk
+
+def _mouse(root, x, y, evt, key=ttk.TTkK.NoButton):
+    root._processInput(None, ttk.TTkMouseEvent(x, y, key, evt, ttk.TTkK.NoModifier, 0, ''))
+
+def _wheel(root, x, y, down=True):
+    _mouse(root, x, y, ttk.TTkK.WHEEL_Down if down else ttk.TTkK.WHEEL_Up, ttk.TTkK.Wheel)
+
+def _key(root, key):
+    root._processInput(ttk.TTkKeyEvent(ttk.TTkK.SpecialKey, key, '', ttk.TTkK.NoModifier), None)
+
+def _ansiText():
+    with open(os.path.join(os.path.dirname(os.path.abspath(__file__)),'../textedit.ANSI.txt')) as f:
+        return f.read()
+
+def manyWidgets(root):
+    # ~1000 widgets, the mouse hovering through them
+    root.setLayout(layout := ttk.TTkGridLayout())
+    for y in range(22):
+        for x in range(12):
+            if (x+y)%3 == 0:
+                layout.addWidget(ttk.TTkButton(text=f"Btn {x},{y}", border=True), y*3, x, 3, 1)
+            else:
+                layout.addWidget(ttk.TTkCheckbox(text=f"Chk {x},{y}"), y*3,   x)
+                layout.addWidget(ttk.TTkLabel(text=f"Lbl {x},{y}"),    y*3+1, x)
+                layout.addWidget(ttk.TTkLineEdit(text=f"Edit {x},{y}"),y*3+2, x)
+    w,h = root.size()
+    def _step(i):
+        _mouse(root, (i*7)%w, (i*3)%h, ttk.TTkK.Move)
+    return _step
+
+def deepTree(root):
+    # ~6000 nodes, 7 levels deep, all expanded, scrolled with the wheel
+    root.setLayout(ttk.TTkGridLayout())
+    tree = ttk.TTkTree(parent=root)
+    tree.setHeaderLabels(["Name", "Level", "Index"])
+    def _addChildren(item, level):
+        if level > 6: return
+        for i in range(2):
+            child = ttk.TTkTreeWidgetItem([f"Node {level}-{i}", str(level), str(i)])
+            item.addChild(child)
+            _addChildren(child, level+1)
+            child.setExpanded(True)
+    for i in range(25):
+        top = ttk.TTkTreeWidgetItem([f"Top {i}", "0", str(i)])
+        tree.addTopLevelItem(top)
+        _addChildren(top, 1)
+        top.setExpanded(True)
+    def _step(i):
+        _wheel(root, 10, 10, down=(i//100)%2==0)
+    return _step
+
+def bigTable(root):
+    # 20000x15 cells table, scrolled with the wheel and the keyboard
+    root.setLayout(ttk.TTkGridLayout())
+    data = [[f"{r}x{c}" for c in range(15)] for r in range(20000)]
+    table = ttk.TTkTable(parent=root, tableModel=ttk.TTkTableModelList(data=data))
+    _mouse(root, 20, 10, ttk.TTkK.Press, ttk.TTkK.LeftButton)
+    _mouse(root, 20, 10, ttk.TTkK.Release, ttk.TTkK.LeftButton)
+    def _step(i):
+        if i%4:
+            _wheel(root, 20, 10)
+        else:
+            _key(root, ttk.TTkK.Key_Down)
+    return _step
+
+def terminalReplay(root):
+    # A chunk of the ANSI test output written to the terminal emulator for each frame
+    root.setLayout(ttk.TTkGridLayout())
+    term = ttk.TTkTerminal(parent=root)
+    lines = _ansiText().replace('\n','\r\n').splitlines(keepends=True)
+    def _step(i):
+        term.termWrite(''.join(lines[(i*5+n)%len(lines)] for n in range(5)))
+    return _step
+
+def textEditScroll(root):
+    # ~2000 lines of ANSI colored text scrolled with the wheel
+    root.setLayout(ttk.TTkGridLayout())
+    te = ttk.TTkTextEdit(parent=root, lineNumber=True)
+    te.append('\n'.join([_ansiText()]*100))
+    def _step(i):
+        _wheel(root, 20, 10, down=(i//150)%2==0)
+    return _step
+
+SCENES = {
+    'many_widgets'    : manyWidgets,
+    'deep_tree'       : deepTree,
+    'big_table'       : bigTable,
+    'terminal_replay' : terminalReplay,
+    'text_edit_scroll': textEditScroll,
+}
@@ -74,6 +74,13 @@ class Mock_TTkTerm():
         sys.stdout.write(str(*args))
         sys.stdout.flush()
 
+    @staticmethod
+    def setSyncOutput(sync=True): pass
+    @staticmethod
+    def beginFrame(): pass
+    @staticmethod
+    def endFrame(): return 0
+
     @staticmethod
     def registerResizeCb(_): pass
     @staticmethod
@@ -65,3 +65,15 @@ def test_stringAlign1():
     assert '  Yes⌛⌛⌛  '== str(test1.align(width=13, alignment=TermTk.TTkK.CENTER_ALIGN))
     # width=14: |  Yes⌛⌛⌛   |
     assert '  Yes⌛⌛⌛   '==str(test1.align(width=14, alignment=TermTk.TTkK.CENTER_ALIGN))
+
+def test_stringWidth():
+    # Half, Wide (BMP and other planes) and Zero sized chars
+    assert [TermTk.TTkString._getWidthChar(ch) for ch in 'aé中😁́⌛'] == [1,1,2,2,0,2]
+    assert TermTk.TTkString._getWidthsText('a中😁́') == '\x01\x02\x02\x00'
+    assert TermTk.TTkString._getWidthText('Yes⌛⌛⌛') == 9
+    assert TermTk.TTkString._getWidthText('é 日本語 😁') == 1+1+6+1+2
+    assert TermTk.TTkString._getLenTextWoZero('é 日本語') == 5
+    assert TermTk.TTkString('日本😁 x').termWidth() == 8
+    assert TermTk.TTkString('abc').nextPos(0) == 1
+    assert TermTk.TTkString('aé́b').nextPos(1) == 4
+    assert TermTk.TTkString('aé́b').prevPos(4) == 1
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2025 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import sys, os, re, threading
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+
+import TermTk as ttk
+
+def _composeFrames(damageTracking, arrayCanvas=False):
+    ttk.TTkCfg.damageTracking = damageTracking
+    ttk.TTkCfg.arrayCanvas = arrayCanvas
+    ttk.TTkHelper._updateWidget.clear()
+    ttk.TTkHelper._updateBuffer.clear()
+    root = ttk.TTk(layout=ttk.TTkGridLayout())
+    root.show()
+    win = ttk.TTkWindow(parent=root, title='Win', layout=ttk.TTkGridLayout(), border=True)
+    frame = ttk.TTkFrame(parent=win, border=True, layout=ttk.TTkVBoxLayout())
+    labels = [ttk.TTkLabel(parent=frame, text='-') for _ in range(5)]
+    over = ttk.TTkWindow(parent=root, pos=(5,3), size=(20,6), title='Overlap')
+    ttk.TTkHelper.paintAll()
+    frames = []
+    for i in range(20):
+        labels[i%5].setText(f'Counter {i} 中文')
+        if i == 10:
+            over.move(8,4)
+        ttk.TTkHelper.paintAll()
+        canvas = ttk.TTkHelper._rootCanvas
+        if arrayCanvas:
+            canvas = canvas.toCanvas()
+            frames.append((canvas._data, canvas._colors))
+        else:
+            frames.append((
+                [l.copy() for l in canvas._bufferedData],
+                [l.copy() for l in canvas._bufferedColors]))
+    root.quit()
+    ttk.TTkCfg.arrayCanvas = False
+    return frames
+
+def test_damageTracking():
+    bkDamage = ttk.TTkCfg.damageTracking
+    full    = _composeFrames(False)
+    partial = _composeFrames(True)
+    ttk.TTkCfg.damageTracking = bkDamage
+    assert full == partial
+
+def test_damageSpans():
+    spans = ttk.TTkCanvas._damageSpans([(2,0,3,2),(4,1,4,1),(10,1,2,1),(-5,5,3,1)], 11, 4)
+    assert spans == {0:[(2,5)], 1:[(2,8),(10,11)]}
+
+def _drawSample(canvas):
+    canvas.fill(pos=(1,1), size=(10,3), char='x', color=ttk.TTkColor.BLUE)
+    canvas.drawText(pos=(2,0), text='Plain', color=ttk.TTkColor.RED)
+    canvas.drawText(pos=(0,2), text=ttk.TTkString('Wide 中文 text', ttk.TTkColor.GREEN))
+    canvas.drawBox(pos=(0,3), size=(8,3))
+    canvas.drawChar(pos=(15,4), char='@', color=ttk.TTkColor.bg('#334455'))
+
+def test_arrayCanvas():
+    listCanvas  = ttk.TTkCanvas(width=20, height=6)
+    arrayCanvas = ttk.TTkCanvasArray(width=20, height=6)
+    _drawSample(listCanvas)
+    _drawSample(arrayCanvas)
+    converted = arrayCanvas.toCanvas()
+    assert listCanvas._data   == converted._data
+    assert listCanvas._colors == converted._colors
+
+    # Compose the same child on both backends
+    child = ttk.TTkCanvas(width=6, height=2)
+    child.drawText(pos=(0,0), text='中文ab')
+    listCanvas.paintCanvas(child, (13,1,6,2), (0,0,6,2), (0,0,20,6))
+    arrayCanvas.paintCanvas(child, (13,1,6,2), (0,0,6,2), (0,0,20,6))
+    converted = arrayCanvas.toCanvas()
+    assert listCanvas._data   == converted._data
+    assert listCanvas._colors == converted._colors
+
+    listCanvas.clean()
+    arrayCanvas.clean()
+    assert listCanvas._data == arrayCanvas.toCanvas()._data
+
+def test_arrayCanvasFrames():
+    bkDamage = ttk.TTkCfg.damageTracking
+    full    = _composeFrames(False)
+    array   = _composeFrames(True, arrayCanvas=True)
+    ttk.TTkCfg.damageTracking = bkDamage
+    assert full == array
+
+def _replay(stream, w, h):
+    # Minimal terminal, it handles only the sequences used by the renderer
+    screen = [[' ']*w for _ in range(h)]
+    y = x = 0
+    for tok in re.findall(r'\033\[[0-9;]*[a-zA-Z]|\033\]8;[^\033]*\033\\\\|.', stream, re.S):
+        if tok[0] != '\033':
+            if   tok == '\r': x = 0
+            elif tok == '\n': y += 1
+            else:
+                screen[y][x] = tok
+                x += 1
+                if ttk.TTkString._isWideCharData(tok):
+                    screen[y][x] = ''
+                    x += 1
+            continue
+        if not tok.startswith('\033['): continue
+        args = [int(a) for a in tok[2:-1].split(';') if a]
+        cmd = tok[-1]
+        if   cmd == 'f': y, x = args[0]-1, args[1]-1
+        elif cmd == 'C': x += args[0]
+        elif cmd == 'D': x -= args[0]
+        elif cmd == 'B': y += args[0]
+    return screen
+
+def test_cursorMotion(monkeypatch):
+    out = []
+    monkeypatch.setattr(ttk.TTkTerm, 'push', staticmethod(lambda *args: out.append(str(*args))))
+    motion = ttk.TTkCore.canvas._TTkCursorMotion()
+    assert motion.motion(3,10) == '\033[4;11f'
+    motion.y, motion.x = 3, 10
+    assert motion.motion(3,12) == '\033[2C'
+    assert motion.motion(4,0)  == '\r\n'
+    assert motion.motion(3,10) == ''
+
+    for arrayCanvas in (False, True):
+        canvas = (ttk.TTkCanvasArray if arrayCanvas else ttk.TTkCanvas)(width=30, height=8)
+        canvas.cleanBuffers()
+        stream = ''
+        for i in range(3):
+            out.clear()
+            canvas.clean()
+            _drawSample(canvas)
+            canvas.drawText(pos=(i,6), text=ttk.TTkString(f'a{i}b{i}  c{i} 中{i}', ttk.TTkColor.YELLOW))
+            canvas.drawText(pos=(29,7), text='z')
+            canvas.pushToTerminalDamage()
+            stream += ''.join(out)
+        data = canvas.toCanvas()._data if arrayCanvas else canvas._data
+        assert _replay(stream, 30, 8) == data
+    # The short gaps are written again instead of moving the cursor
+    assert 'c2 中' in stream
+
+def test_colorIntern():
+    c1 = ttk.TTkColor.fg('#FFFF00')+ttk.TTkColor.bg('#000080')
+    c2 = ttk.TTkColor.fg('#FFFF00')+ttk.TTkColor.bg('#000080')
+    assert c1 is c2
+    assert ttk.TTkColor.fgbg('#FFFF00','#000080') is c1
+    assert ttk.TTkColor.fg('#FF0000') is ttk.TTkColor.RED
+    assert c1 + ttk.TTkColor.BOLD is c2 + ttk.TTkColor.BOLD
+    # Colors with a modifier are stateful and are not interned
+    grad = ttk.TTkColor.fg('#FF0000', modifier=ttk.TTkColorGradient(increment=6))
+    assert grad is not ttk.TTkColor.fg('#FF0000', modifier=ttk.TTkColorGradient(increment=6))
+    assert grad._id is None
+
+    _transition = ttk.TTkCore.color._TTkColor._transition
+    colors = [ttk.TTkColor.RST, c1, ttk.TTkColor.BOLD, c1+ttk.TTkColor.UNDERLINE,
+              ttk.TTkColor.fg('#00FF00', link='https://example.com'), grad, ttk.TTkColor.RED.copy()]
+    for ca in colors:
+        for cb in colors:
+            assert _transition(ca, cb) == ca - cb
+
+def test_colorInternThreads():
+    # The same colors interned by many threads at once
+    barrier = threading.Barrier(8)
+    results = []
+    def _intern():
+        barrier.wait()
+        results.append([ttk.TTkColor.fg(f'#AB{_i:04X}')+ttk.TTkColor.bg('#0A0B0C') for _i in range(2000)])
+    threads = [threading.Thread(target=_intern) for _ in range(8)]
+    # Switch thread as often as possible
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        for _t in threads: _t.start()
+        for _t in threads: _t.join()
+    finally:
+        sys.setswitchinterval(interval)
+    _internList = ttk.TTkCore.color._TTkColor._internList
+    for colors in zip(*results):
+        assert all(_c is colors[0] for _c in colors)
+        assert _internList[colors[0]._id] is colors[0]
+
+def test_arrayCanvasTables(monkeypatch):
+    canvas_array = ttk.TTkCore.canvas_array
+    glyphTable, colorTable = canvas_array._glyphTable, canvas_array._colorTable
+    monkeypatch.setattr(glyphTable, '_maxSize', 64)
+    monkeypatch.setattr(colorTable, '_maxSize', 64)
+    listCanvas  = ttk.TTkCanvas(width=10, height=2)
+    arrayCanvas = ttk.TTkCanvasArray(width=10, height=2)
+    arrayCanvas.enableDoubleBuffer()
+    other = ttk.TTkCanvasArray(width=1, height=1)
+    for i in range(2000):
+        for canvas in (listCanvas, arrayCanvas):
+            canvas.drawText(pos=(i%10,i%2), text=chr(0x100+i), color=ttk.TTkColor.fg(f'#{i:06X}'))
+        # The unused glyphs and colors are dropped at the beginning of a canvas update
+        other.clean()
+    assert len(glyphTable._values) < 1000
+    assert len(colorTable._values) < 1000
+    converted = arrayCanvas.toCanvas()
+    assert listCanvas._data   == converted._data
+    assert listCanvas._colors == converted._colors
+    assert [list(_r) for _r in arrayCanvas._bufferedData] == [[glyphTable[' ']]*10]*2
+    assert all(colorTable._colors[_i]._internKey() == colorTable._values[_i] for _i in range(1,len(colorTable._values)))
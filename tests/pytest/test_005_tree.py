@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2025 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import sys, os, random
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+
+import TermTk as ttk
+
+def _rows(tree, cache):
+    return [(r.item, r.level, [str(d) for d in r.data]) for r in cache]
+
+def _fullCache(tree):
+    cache = []
+    for c in tree._rootItem.children():
+        tree._addToCache(c, 0, cache)
+    return _rows(tree, cache)
+
+def test_treeCacheSplice():
+    random.seed(1)
+    tree = ttk.TTkTreeWidget(header=['Name','Value'])
+    tree.setHeaderLabels(['Name','Value'])
+    tops, items = [], []
+    for i in range(10):
+        top = ttk.TTkTreeWidgetItem([f'top{i}', f'{i}'])
+        tops.append(top)
+        for j in range(10):
+            item = ttk.TTkTreeWidgetItem([f'child{i}.{j}', f'{j}'], parent=top)
+            items.append(item)
+            ttk.TTkTreeWidgetItem([f'leaf{i}.{j}', 'multi\nline'], parent=item)
+    tree.addTopLevelItems(tops)
+    assert len(tree._cache) == 10
+    assert tree.viewFullAreaSize()[1] == 11
+
+    for step in range(200):
+        item = random.choice(tops+items)
+        op = random.randrange(5)
+        if   op == 0: item.setExpanded(not item.isExpanded())
+        elif op == 1: item.addChild(ttk.TTkTreeWidgetItem([f'new{step}', 'x']))
+        elif op == 2: item.takeChild(0)
+        elif op == 3: item.setHidden(not item.isHidden())
+        elif op == 4: item.sortChildren(0, random.choice([ttk.TTkK.AscendingOrder, ttk.TTkK.DescendingOrder]))
+        assert _rows(tree, tree._cache) == _fullCache(tree)
+        assert tree._cacheItems == [r.item for r in tree._cache]
+        assert tree.viewFullAreaSize()[1] == tree._rootItem.size()
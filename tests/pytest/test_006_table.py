@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2025 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import sys, os, random, sqlite3, csv, time
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+
+import TermTk as ttk
+
+class _Model(ttk.TTkTableModelList):
+    # Every 7th cell is not selectable
+    def flags(self, row:int, col:int) -> ttk.TTkK.ItemFlag:
+        if (row*3+col)%7:
+            return super().flags(row,col)
+        return ttk.TTkK.ItemFlag.ItemIsEnabled
+
+def test_tableSelection():
+    random.seed(1)
+    rows,cols = 40,12
+    model = _Model(data=[[f'{r}.{c}' for c in range(cols)] for r in range(rows)])
+    table = ttk.TTkTableWidget(tableModel=model)
+    sel = table._selection
+    ref = [[False]*cols for _ in range(rows)]
+    Select = ttk.TTkK.TTkItemSelectionModel.Select
+    Clear  = ttk.TTkK.TTkItemSelectionModel.Clear
+
+    for _ in range(300):
+        op = random.randrange(8)
+        r,c = random.randrange(rows),random.randrange(cols)
+        if op in (0,1):
+            w,h = random.randint(1,cols),random.randint(1,rows)
+            table.setSelection(pos=(c,r), size=(w,h), flags=Select if op==0 else Clear)
+            for _r in range(r,min(r+h,rows)):
+                ref[_r][c:c+w] = [op==0]*len(ref[_r][c:c+w])
+        elif op == 2:
+            table.selectRow(r)
+            ref[r] = [True]*cols
+        elif op == 3:
+            table.selectColumn(c)
+            for _l in ref: _l[c] = True
+        elif op == 4:
+            table.unselectRow(r)
+            ref[r] = [False]*cols
+        elif op == 5:
+            table.unselectColumn(c)
+            for _l in ref: _l[c] = False
+        elif op == 6 and not random.randrange(10):
+            table.selectAll()
+            ref = [[True]*cols for _ in range(rows)]
+        elif op == 7 and not random.randrange(10):
+            table.clearSelection()
+            ref = [[False]*cols for _ in range(rows)]
+
+        expected = [[_v and bool(model.flags(_r,_c)&ttk.TTkK.ItemFlag.ItemIsSelectable)
+                        for _c,_v in enumerate(_l)] for _r,_l in enumerate(ref)]
+        assert sel.mask(0,0,rows-1,cols-1) == expected
+        assert all(sel.isSelected(_r,_c) == expected[_r][_c] for _r in range(rows) for _c in range(cols))
+        assert list(sel.selectedRows()) == [
+            (_r,[_c for _c,_v in enumerate(_l) if _v]) for _r,_l in enumerate(expected) if any(_l)]
+        assert sel.isRowSelected(r) == all(_v for _c,_v in enumerate(ref[r]) if model.flags(r,_c)&ttk.TTkK.ItemFlag.ItemIsSelectable)
+        assert sel.isColumnSelected(c) == all(_l[c] for _r,_l in enumerate(ref) if model.flags(_r,c)&ttk.TTkK.ItemFlag.ItemIsSelectable)
+
+def test_tableViewport():
+    random.seed(2)
+    rows,cols = 100000,30
+    model = ttk.TTkTableModelList(data=[[r,'a\nb']+list(range(cols-2)) for r in range(rows)])
+    table = ttk.TTkTableWidget(tableModel=model)
+    table.resize(80,25)
+    table.setRowHeight(3,5)
+    table.setColumnWidth(2,1)
+    table.selectColumn(4)
+    table.setSelection(pos=(1,10), size=(3,50000), flags=ttk.TTkK.TTkItemSelectionModel.Select)
+
+    def _findCell(x,y):
+        # Linear reference
+        vhs,hhs = table._vHeaderSize, table._hHeaderSize
+        ox,oy = table.getViewOffsets()
+        row = next((i for i,py in enumerate(table._rowsPos) if py>=y+oy-hhs), rows-1)
+        col = next((i for i,px in enumerate(table._colsPos) if px>=x+ox-vhs), cols-1)
+        return row,col
+
+    canvas = ttk.TTkCanvas(width=80, height=25)
+    for _ in range(20):
+        table.viewMoveTo(random.randrange(table._colsPos[-1]), random.randrange(table._rowsPos[-1]))
+        canvas.clean()
+        table.paintEvent(canvas)
+        for _ in range(20):
+            x,y = random.randrange(80),random.randrange(25)
+            assert table._findCell(x,y,headers=False) == _findCell(x,y)
+
+def test_tableModelSQLite3(tmp_path):
+    random.seed(3)
+    fileName = str(tmp_path/'test.db')
+    data = [(i, f'name{random.randrange(500)}', random.choice([None,*range(100)])) for i in range(1,3001)]
+    conn = sqlite3.connect(fileName)
+    conn.execute("CREATE TABLE tbl (id INTEGER PRIMARY KEY, name TEXT, value INTEGER)")
+    conn.executemany("INSERT INTO tbl VALUES (?,?,?)", data)
+    conn.commit()
+    conn.close()
+
+    model = ttk.TTkTableModelSQLite3(fileName=fileName, table='tbl', pageSize=50, cacheSize=4)
+    assert model.rowCount() == 3000
+    assert model.columnCount() == 2
+    Asc, Desc = ttk.TTkK.SortOrder.AscendingOrder, ttk.TTkK.SortOrder.DescendingOrder
+
+    def _check(col, order):
+        # NULLs first in ASC order, the key breaks the ties
+        ref = sorted(data, key=lambda _d: (_d[0],) if col==-1 else (_d[1+col] is not None, _d[1+col] or 0, _d[0]))
+        if order == Desc: ref.reverse()
+        rows = random.sample(range(3000),200) + list(range(1000,1300))
+        assert [model.data(_r,0) for _r in rows] == [ref[_r][1] for _r in rows]
+        assert [model.data(_r,1) for _r in rows] == [ref[_r][2] for _r in rows]
+        return ref
+
+    for col,order in ((-1,Asc),(1,Asc),(1,Desc),(0,Asc),(0,Desc),(-1,Asc)):
+        model.sort(col,order)
+        _check(col,order)
+        assert len(model._pages) <= 4
+
+    model.sort(1,Asc)
+    index = model.index(row=1234, col=1)
+    rowId = index._rowId
+    model.setData(row=1234, col=0, data='changed')
+    data = [(_i,'changed',_v) if _i==rowId else (_i,_n,_v) for _i,_n,_v in data]
+    model.setData(row=1234, col=1, data=1000)
+    data = [(_i,_n,1000) if _i==rowId else (_i,_n,_v) for _i,_n,_v in data]
+    ref = _check(1,Asc)
+    assert index.row() == [_d[0] for _d in ref].index(rowId)
+    assert index.data() == 1000
+    model.sort(-1,Asc)
+    assert index.row() == rowId-1
+
+def test_tableModelCSVStream(tmp_path):
+    random.seed(4)
+    fileName = str(tmp_path/'test.csv')
+    header = ['id','name','note']
+    data = [[str(i), f'name{i}', random.choice(['plain', 'with, comma', 'multi\nline "quoted"', '', 'àèì 中文'])]
+            for i in range(20000)]
+    with open(fileName, 'w', newline='', encoding='utf-8') as fd:
+        csv.writer(fd).writerows([header]+data)
+    # Remove the trailing newline
+    with open(fileName, 'rb+') as fd:
+        fd.truncate(os.path.getsize(fileName)-2)
+
+    inserted = []
+    model = ttk.TTkTableModelCSVStream(filename=fileName, pageSize=100, cacheSize=4)
+    model.rowsInserted.connect(lambda row,count: inserted.append((row,count)))
+    indexed = []
+    model.indexed.connect(lambda: indexed.append(model.rowCount()))
+    table = ttk.TTkTableWidget(tableModel=model)
+    assert model.waitIndexed(10)
+    # The indexed rows are published only by updateRows (the paint routine)
+    assert model.rowCount() == len(table._rowsPos) < len(data)
+    model.updateRows()
+    model.updateRows()
+    assert indexed == [len(data)]
+
+    assert model.rowCount() == len(data)
+    assert model.columnCount() == 3
+    assert [model.headerData(_c, ttk.TTkK.HORIZONTAL) for _c in range(3)] == header
+    # The table layout followed the indexed rows
+    assert len(table._rowsPos) == len(data)
+    assert all(_b==_a+2 for _a,_b in zip(table._rowsPos,table._rowsPos[1:]))
+    for _row,_count in inserted:
+        assert _row+_count <= len(data)
+    rows = random.sample(range(len(data)),500) + list(range(len(data)-300,len(data)))
+    for _r in rows:
+        assert [model.data(_r,_c) for _c in range(3)] == data[_r]
+    assert len(model._pages) <= 4
+    model.setData(10,2,'edited')
+    assert model.data(10,2) == 'edited'
+
+def test_tableModelCSVStreamLateRoot(tmp_path, monkeypatch):
+    fileName = str(tmp_path/'test.csv')
+    with open(fileName, 'w', newline='') as fd:
+        csv.writer(fd).writerows([['id','value']]+[[str(i), 'x'*40] for i in range(20000)])
+
+    # The model is created before the TTk root
+    monkeypatch.setattr(ttk.TTkHelper, '_rootWidget', None)
+    indexed = []
+    model = ttk.TTkTableModelCSVStream(filename=fileName)
+    model.indexed.connect(lambda: indexed.append(model.rowCount()))
+    table = ttk.TTkTableWidget(tableModel=model)
+    assert model.waitIndexed(10)
+    root = ttk.TTk()
+    # The rows are published by the paint routine once the root is available
+    for _ in range(50):
+        if not indexed:
+            time.sleep(0.05)
+            root.paintExecuted.emit()
+    assert indexed == [20000]
+    assert len(table._rowsPos) == 20000
+    assert model.updateRows not in root.paintExecuted._connected_slots
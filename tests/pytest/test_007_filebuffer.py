@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2025 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import sys, os, random, threading
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+
+import TermTk as ttk
+
+def _createLog(fileName, lines):
+    random.seed(1)
+    words = ['alpha','beta','ERROR','warn','中文','x y','']
+    with open(fileName, 'w') as f:
+        for _ in range(lines):
+            f.write(' '.join(random.choice(words) for _ in range(random.randint(0,6)))+'\n')
+        f.write('last alpha')
+
+def _searchAsync(fb, regex, ignoreCase=False, fromLine=0):
+    done = threading.Event()
+    ret = {}
+    def _updated(searchId, indexes, progress):
+        ret.setdefault(searchId,[]).extend(indexes)
+    fb.searchUpdated.connect(_updated)
+    fb.searched.connect(lambda _id: done.set())
+    searchId = fb.searchReAsync(regex, ignoreCase=ignoreCase, fromLine=fromLine)
+    assert done.wait(30)
+    fb.searchUpdated.clear()
+    fb.searched.clear()
+    return ret.get(searchId,[])
+
+def test_searchReAsync(tmp_path):
+    fileName = str(tmp_path/'test.log')
+    _createLog(fileName, 200000)
+    fb = ttk.TTkFileBuffer(fileName, 0x100, 0x1000)
+    for regex,ignoreCase in (
+            ('alpha',False), ('error',True), ('^beta',False), ('warn$',False),
+            ('^$',False), ('',False), ('a\\sb',False), ('x y\\n',False), ('中',False)):
+        assert _searchAsync(fb, regex, ignoreCase) == fb.searchRe(regex, ignoreCase)
+
+def test_searchReAsyncCancel(tmp_path):
+    fileName = str(tmp_path/'test.log')
+    _createLog(fileName, 200000)
+    fb = ttk.TTkFileBuffer(fileName, 0x100, 0x1000)
+    results = {}
+    done = threading.Event()
+    fb.searchUpdated.connect(lambda _id,_idx,_p: results.setdefault(_id,[]).extend(_idx))
+    fb.searched.connect(lambda _id: done.set())
+    idA = fb.searchReAsync('alpha')
+    idB = fb.searchReAsync('beta')
+    assert done.wait(30)
+    # Only the last search is completed
+    assert fb.searchId() == idB
+    assert results[idB] == fb.searchRe('beta')
+    assert len(results.get(idA,[])) < len(fb.searchRe('alpha'))
+
+def _loadBuffer(fileName):
+    fb = ttk.TTkFileBuffer(fileName, 0x10, 0x20)
+    assert fb.waitIndexed(10)
+    return fb
+
+def test_fileBufferIndex(tmp_path):
+    random.seed(2)
+    for i,txt in enumerate((
+            ''.join(random.choice(['a','bb ','中文','\r\n','\n','\n\n','xyz']) for _ in range(100000)),
+            'abc\ndef\n', 'single', '\n', '')):
+        fileName = str(tmp_path/f'test.{i}.txt')
+        with open(fileName, 'w', newline='') as f:
+            f.write(txt)
+        fb = _loadBuffer(fileName)
+        lines = txt.split('\n')
+        expected = [_l+'\n' for _l in lines[:-1]] + [lines[-1]]
+        assert fb.getLen() == len(expected)
+        assert [fb.getLine(_i) for _i in range(fb.getLen()+3)] == [_l.replace('\r','') for _l in expected] + ['']*3
+        assert [fb.getLineDirect(_i) for _i in range(fb.getLen())] == expected
+        assert fb.getWidth() == max((len(_l.encode())+1 for _l in lines[:-1]), default=0)
+
+def test_fileBufferTruncated(tmp_path):
+    fileName = str(tmp_path/'test.log')
+    _createLog(fileName, 20000)
+    fb = _loadBuffer(fileName)
+    assert fb.getLen() == 20001
+    assert fb.getLine(100) == fb.getLineDirect(100) != ''
+    # i.e. logrotate copytruncate, the old mapping must not be read
+    with open(fileName, 'w') as f: f.write('abc\n')
+    assert fb.getLine(15000) == ''
+    assert fb.getLineDirect(15001) == ''
+    assert fb.waitIndexed(10)
+    assert fb.getLen() == 2
+    assert fb.getLine(0) == 'abc\n'
+
+def test_fileBufferFollow(tmp_path):
+    fileName = str(tmp_path/'test.log')
+    _createLog(fileName, 1000)
+    fb = _loadBuffer(fileName)
+    appended = []
+    reloaded = []
+    fb.appended.connect(appended.append)
+    fb.reloaded.connect(lambda: reloaded.append(True))
+
+    def _check(txt):
+        lines = txt.split('\n')
+        assert fb.getLen() == len(lines)
+        assert [fb.getLine(_i) for _i in range(fb.getLen())] == [_l+'\n' for _l in lines[:-1]] + [lines[-1]]
+
+    # Fill the page cache before the changes
+    with open(fileName) as f: txt = f.read()
+    _check(txt)
+    fb.checkFile()
+    assert not appended and not reloaded
+
+    # Append, the last line is completed
+    with open(fileName, 'a') as f: f.write(' beta\nalpha new\n'*50+'tail')
+    fb.checkFile()
+    assert appended == [1000]
+    with open(fileName) as f: txt = f.read()
+    _check(txt)
+    assert _searchAsync(fb, 'alpha', fromLine=appended[0]) == [_i for _i in fb.searchRe('alpha') if _i >= appended[0]]
+
+    # Truncate
+    with open(fileName, 'w') as f: f.write('abc\ndef')
+    fb.checkFile()
+    assert fb.waitIndexed(10)
+    assert reloaded == [True]
+    _check('abc\ndef')
+
+    # Rotate
+    os.rename(fileName, fileName+'.1')
+    fb.checkFile()
+    assert len(reloaded) == 1
+    with open(fileName, 'w') as f: f.write('new\nfile\n')
+    fb.checkFile()
+    assert fb.waitIndexed(10)
+    assert len(reloaded) == 2
+    _check('new\nfile\n')
+    assert _searchAsync(fb, 'file') == [1]
+
+    # Truncate and read before the follow timer checks the file
+    with open(fileName, 'a') as f: f.write('line\n'*5000)
+    fb.checkFile()
+    assert fb.getLen() == 5003
+    with open(fileName, 'w') as f: f.write('short\n')
+    assert fb.getLine(4000) == ''
+    assert len(reloaded) == 3
+    assert fb.waitIndexed(10)
+    _check('short\n')
+    fb.checkFile()
+    assert len(reloaded) == 3
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2025 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import sys, os, time, threading
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+
+import TermTk as ttk
+
+def test_timers():
+    fired = []
+    done = threading.Event()
+    timers = [ttk.TTkTimer() for _ in range(200)]
+    for i,t in enumerate(timers):
+        t.timeout.connect(lambda i=i: fired.append(i))
+    # Restarted, Stopped and Quit timers
+    for i,t in enumerate(timers):
+        t.start(10)
+        t.start(0.001*(200-i))
+    timers[10].stop()
+    timers[20].quit()
+    timers[20].start(0.01)
+    last = ttk.TTkTimer()
+    last.timeout.connect(done.set)
+    last.start(0.5)
+    # A single thread drives all the timers
+    assert len([_t for _t in threading.enumerate() if _t.name == 'TTkTimer']) == 1
+    assert done.wait(5)
+    # The timeouts are emitted once, ordered by deadline
+    assert fired == [i for i in range(199,-1,-1) if i not in (10,20)]
+    for t in timers+[last]:
+        t.quit()
+
+def test_timerRestart():
+    # A periodic timer restarted in its own timeout
+    count = []
+    done = threading.Event()
+    timer = ttk.TTkTimer()
+    def _timeout():
+        count.append(time.monotonic())
+        if len(count) < 5:
+            timer.start(0.01)
+        else:
+            done.set()
+    timer.timeout.connect(_timeout)
+    timer.start(0.01)
+    assert done.wait(5)
+    timer.quit()
+    timer.join()
+    assert len(count) == 5
+    # The thread ends when there are no pending timeouts
+    for _ in range(100):
+        if not [_t for _t in threading.enumerate() if _t.name == 'TTkTimer']: break
+        time.sleep(0.01)
+    assert not [_t for _t in threading.enumerate() if _t.name == 'TTkTimer']
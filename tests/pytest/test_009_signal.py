@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2025 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import sys, os, gc, threading
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+
+import TermTk as ttk
+
+def test_signalWeakSlots():
+    signal = ttk.pyTTkSignal(str)
+    ret = []
+    class _Widget(ttk.TTkWidget):
+        @ttk.pyTTkSlot(str)
+        def _slot(self, txt): ret.append(('widget',txt))
+    class _Obj():
+        def _slot(self, txt): ret.append(('obj',txt))
+    widget = _Widget()
+    signal.connect(widget._slot)
+    signal.connect(widget._slot)
+    # Not widgets and lambdas are kept alive by the signal
+    signal.connect(_Obj()._slot)
+    signal.connect(lambda: ret.append(('lambda',)))
+    signal.emit('a')
+    assert ret == [('widget','a'),('obj','a'),('lambda',)]
+
+    # The deleted widget releases its slot
+    del widget
+    gc.collect()
+    ret.clear()
+    signal.emit('b')
+    assert ret == [('obj','b'),('lambda',)]
+    assert len(signal._connected_slots) == 2
+
+    widget = _Widget()
+    signal.connect(widget._slot)
+    signal.disconnect(widget._slot)
+    ret.clear()
+    signal.emit('c')
+    assert ret == [('obj','c'),('lambda',)]
+
+def _releaseWidgets():
+    # The pending updates are processed by the paint routine
+    ttk.TTkHelper._updateWidget.clear()
+    ttk.TTkHelper._updateBuffer.clear()
+    gc.collect()
+
+def test_signalRegistry():
+    # The widgets of the previous tests may be still queued for an update
+    _releaseWidgets()
+    count = len(ttk.pyTTkSignal._signals)
+    widgets = [ttk.TTkButton() for _ in range(100)]
+    assert len(ttk.pyTTkSignal._signals) > count
+    del widgets
+    _releaseWidgets()
+    assert len(ttk.pyTTkSignal._signals) == count
+
+def test_signalSnapshotRace(monkeypatch):
+    signal = ttk.pyTTkSignal()
+    ret = []
+    threads = []
+    snapshot = ttk.pyTTkSignal._snapshot
+    def _snapshot(slots):
+        # Another thread connects a slot while the snapshot is built
+        threads.append(_t := threading.Thread(target=signal.connect, args=(lambda: ret.append('b'),)))
+        _t.start()
+        _t.join(0.1)
+        return snapshot(slots)
+    monkeypatch.setattr(ttk.pyTTkSignal, '_snapshot', staticmethod(_snapshot))
+    signal.connect(lambda: ret.append('a'))
+    signal.emit()
+    monkeypatch.undo()
+    threads[0].join()
+    # The stale snapshot does not hide the new slot
+    signal.emit()
+    assert ret == ['a','a','b']
+
+def test_signalArgs():
+    signal = ttk.pyTTkSignal(int, str)
+    ret = []
+    def _slot1(a): ret.append(a)
+    def _slot2(a, b, c=None): ret.append((a,b))
+    def _slot3(a, b, c): pass
+    signal.connect(_slot1)
+    signal.connect(_slot2)
+    signal.emit(1,'x')
+    assert ret == [1,(1,'x')]
+    for _ in range(2):
+        try:
+            signal.connect(_slot3)
+            assert False
+        except TypeError:
+            pass
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2025 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import sys, os, random
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+
+import TermTk as ttk
+
+def test_graphRingBuffer():
+    random.seed(6)
+    graph = ttk.TTkGraph(size=(30,10), maxData=100)
+    values = [[0]]
+    for _ in range(1000):
+        v = [random.uniform(-50,50) for _ in range(3)]
+        values.append(v)
+        graph.addValue(v)
+        assert len(graph._data) == min(100, len(values))
+        num = random.randint(1, len(graph._data))
+        assert graph._range(num) == (max(map(max,values[-num:])), min(map(min,values[-num:])))
+    assert list(graph._data) == values[-100:]
+    graph.paintEvent(ttk.TTkCanvas(width=30,height=10))
+
+def test_graphDecimation():
+    graph = ttk.TTkGraph(size=(30,10), decimation=4)
+    for i in range(10):
+        graph.addValue([i%4, -i])
+    # The pending values are not plotted yet
+    assert list(graph._data) == [[0], [0,-3], [3,0], [0,-7], [3,-4]]
+    graph.paintEvent(ttk.TTkCanvas(width=30,height=10))
+
+def test_graphDecimationColumns():
+    random.seed(7)
+    for maxData,width,direction in ((9,3,ttk.TTkK.RIGHT),(10,8,ttk.TTkK.RIGHT),(9,3,ttk.TTkK.LEFT),(11,3,ttk.TTkK.LEFT)):
+        graph = ttk.TTkGraph(size=(width,10), maxData=maxData, decimation=3, direction=direction)
+        buckets = []
+        for _ in range(60):
+            values = [[random.randint(-9,9) for _ in range(2)] for _ in range(3)]
+            for v in values:
+                graph.addValue(v)
+            buckets.append(([min(_v[0] for _v in values), min(_v[1] for _v in values)],
+                            [max(_v[0] for _v in values), max(_v[1] for _v in values)]))
+            columns = {}
+            class _Canvas():
+                def drawHChart(self, pos, values, zoom, color):
+                    columns[pos[0]] = values
+            graph.paintEvent(_Canvas())
+            # Each column plots the (min,max) of a bucket, the latest ones are visible
+            num = min(width, len(graph._data)//2)
+            if direction == ttk.TTkK.RIGHT:
+                assert columns == {_c:_b for _c,_b in enumerate(buckets[-num:])}
+            else:
+                assert columns == {width-1-_c:_b[::-1] for _c,_b in enumerate(buckets[-num:])}
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2025 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import sys, os, logging, inspect
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+
+import TermTk as ttk
+
+def test_logLevel():
+    ret = []
+    def _handler(mode, context, message):
+        ret.append((mode, context.function, message))
+    ttk.TTkLog.installMessageHandler(_handler)
+    try:
+        evaluated = []
+        def _lazy():
+            evaluated.append(True)
+            return "Lazy"
+
+        ttk.TTkLog.debug("Test %d %s", 1, "a")
+        ttk.TTkLog.info(_lazy)
+        ttk.TTkLog.error("Multi\nLine")
+        assert ret == [
+            (ttk.TTkLog.DebugMsg, 'test_logLevel', 'Test 1 a'),
+            (ttk.TTkLog.InfoMsg,  'test_logLevel', 'Lazy'),
+            (ttk.TTkLog.ErrorMsg, 'test_logLevel', 'Multi'),
+            (ttk.TTkLog.ErrorMsg, 'test_logLevel', 'Line')]
+        assert evaluated == [True]
+
+        ret.clear()
+        ttk.TTkLog.setLevel(ttk.TTkLog.WarningMsg)
+        assert not ttk.TTkLog.isEnabled(ttk.TTkLog.DebugMsg)
+        assert not ttk.TTkLog.isEnabled(ttk.TTkLog.InfoMsg)
+        assert ttk.TTkLog.isEnabled(ttk.TTkLog.ErrorMsg)
+        ttk.TTkLog.debug("No")
+        ttk.TTkLog.info(_lazy)
+        ttk.TTkLog.warn("Warn")
+        ttk.TTkLog.fatal("Fatal")
+        assert ret == [
+            (ttk.TTkLog.WarningMsg, 'test_logLevel', 'Warn'),
+            (ttk.TTkLog.FatalMsg,   'test_logLevel', 'Fatal')]
+        assert evaluated == [True]
+    finally:
+        ttk.TTkLog.setLevel(ttk.TTkLog.DebugMsg)
+        ttk.TTkLog._messageHandler.remove(_handler)
+        ttk.TTkLog._updateEnabled()
+
+def test_logFile(tmp_path):
+    logFile = tmp_path / 'session.log'
+    rootHandlers = logging.root.handlers
+    logging.root.handlers = []
+    try:
+        ttk.TTkLog.use_default_file_logging(str(logFile))
+        line = inspect.currentframe().f_lineno + 2
+        for i in range(100):
+            ttk.TTkLog.debug("Line %d", i)
+        handler = logging.root.handlers[0]
+        handler.queue.join()
+    finally:
+        logging.root.handlers = rootHandlers
+        ttk.TTkLog._messageHandler.remove(ttk.TTkLog._logging_message_handler)
+        ttk.TTkLog._updateEnabled()
+    lines = logFile.read_text().splitlines()
+    assert len(lines) == 100
+    assert lines[0].startswith('DEBUG:(MainThread)')
+    assert lines[99].endswith(f'test_011_log.py:{line} Line 99')
+
+def test_logViewer():
+    view = ttk.TTkTestWidgets.logviewer._TTkLogViewer(maxMessages=10, size=(30,4))
+    ttk.TTkLog._messageHandler.remove(view.loggingCallback)
+    ttk.TTkLog._updateEnabled()
+    # The refresh is driven by the test
+    view._refreshTimer.timeout.disconnect(view._refresh)
+    class _Context:
+        file, line = 'file.py', 1
+    prefix = len('INFO : file.py:1 ')
+    def _log(msg):
+        view.loggingCallback(ttk.TTkLog.InfoMsg, _Context, msg)
+    def _texts():
+        return [str(_m)[prefix:] for _m in view._messages]
+
+    _log('W'*50)
+    for i in range(9):
+        _log(f'Line {i}')
+    view._refresh()
+    # The initial empty line has been evicted
+    assert _texts() == ['W'*50]+[f'Line {i}' for i in range(9)]
+    assert view.viewFullAreaSize() == (prefix+50, 10)
+
+    # The widest line is evicted
+    _log('Line 9')
+    view._refresh()
+    assert _texts() == [f'Line {i}' for i in range(10)]
+    assert view.viewFullAreaSize() == (prefix+6, 10)
+
+    # The same lines are kept in view while the oldest ones are dropped
+    view.viewMoveTo(0, 3)
+    _log('Line 10')
+    _log('Line 11')
+    view._refresh()
+    assert view.getViewOffsets() == (0, 1)
+    assert _texts()[1] == 'Line 3'
+
+    # Scrolled to the bottom, the view follows the new lines
+    view.viewMoveTo(0, 6)
+    for i in range(12,15):
+        _log(f'Line {i}')
+    view._refresh()
+    assert view.getViewOffsets() == (0, 6)
+    assert _texts()[-1] == 'Line 14'
+    assert view.viewFullAreaSize() == (prefix+7, 10)
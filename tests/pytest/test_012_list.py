@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2025 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+
+import sys, os
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+
+import TermTk as ttk
+
+def test_listFilter():
+    names = [f"host-{i:04d}.rack{i%7}" for i in range(2000)]
+    lw = ttk.TTkListWidget(items=names, size=(30,10))
+
+    assert len(lw.items()) == 2000
+    assert lw.filteredItems() is lw.items()
+    assert lw.viewFullAreaSize() == (30,2000)
+
+    for text in ('r','ra','rack','rack3'):
+        lw.setSearch(text)
+        assert [str(i.text()) for i in lw.filteredItems()] == [n for n in names if text in n]
+    assert lw.viewFullAreaSize() == (30,len(lw.filteredItems())+1)
+
+    lw.setSearch('rack')
+    assert [str(i.text()) for i in lw.filteredItems()] == [n for n in names if 'rack' in n]
+
+    lw.setSearch('0001')
+    lw.items()[3].setText('host-0001.renamed')
+    assert [str(i.text()) for i in lw.filteredItems()] == ['host-0001.rack1', 'host-0001.renamed']
+
+    lw.setSearch('')
+    assert lw.filteredItems() is lw.items()
+
+def test_listSelection():
+    ret = []
+    lw = ttk.TTkListWidget(items=[f"Item {i}" for i in range(100)], size=(20,5))
+    lw.textClicked.connect(lambda text: ret.append(str(text)))
+
+    lw.setCurrentRow(3)
+    assert ret == ['Item 3']
+    assert lw.selectedLabels() == ['Item 3']
+
+    lw.viewMoveTo(0,50)
+    lw.mousePressEvent(ttk.TTkMouseEvent(1,2,ttk.TTkK.LeftButton,ttk.TTkK.Press,0,1,''))
+    assert ret == ['Item 3', 'Item 52']
+    assert lw.selectedLabels() == ['Item 52']
+
+    lw.removeItems(lw.items()[50:])
+    assert len(lw.items()) == 50
+    assert lw.selectedItems() == []
+    assert lw.indexOf(lw.itemAt(10)) == 10
+
+    lw.removeItems(lw.items())
+    assert lw.items() == []
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2025 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+
+import sys, os, threading, queue
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+
+import TermTk as ttk
+from TermTk.TTkCore.TTkTerm.input_thread import TTkInput
+
+def _process(stdin:list[str]) -> list:
+    ret = []
+    @ttk.pyTTkSlot(ttk.TTkKeyEvent, ttk.TTkMouseEvent)
+    def _inputEvent(kevt, mevt):
+        ret.append((str(kevt.key) if kevt else None,
+                    (mevt.x, mevt.y, mevt.evt, mevt.delta) if mevt else None))
+    TTkInput._inputThread = threading.Thread(target=lambda: None)
+    TTkInput._inputQueue = queue.Queue()
+    for s in stdin:
+        TTkInput._inputQueue.put(TTkInput.key_process(s))
+    TTkInput._inputQueue.put(None)
+    TTkInput.inputEvent.connect(_inputEvent)
+    try:
+        TTkInput.start()
+    finally:
+        TTkInput.inputEvent.disconnect(_inputEvent)
+    return ret
+
+def test_mouseCoalescing():
+    move  = lambda x,y: f"\033[<35;{x+1};{y+1}M"
+    drag  = lambda x,y: f"\033[<32;{x+1};{y+1}M"
+    up    = lambda x,y: f"\033[<64;{x+1};{y+1}M"
+    down  = lambda x,y: f"\033[<65;{x+1};{y+1}M"
+    press = lambda x,y: f"\033[<0;{x+1};{y+1}M"
+
+    K = ttk.TTkK
+    assert _process(
+        [move(1,1), move(2,1), move(3,1),
+         down(3,1), down(3,1), down(3,1),
+         up(3,1), up(4,1),
+         'a',
+         move(5,5), press(5,5), drag(6,5), drag(7,5), drag(8,6)]) == [
+            (None, (3,1,K.Move,1)),
+            (None, (3,1,K.WHEEL_Down,3)),
+            (None, (3,1,K.WHEEL_Up,1)),
+            (None, (4,1,K.WHEEL_Up,1)),
+            ('a',  None),
+            (None, (5,5,K.Move,1)),
+            (None, (5,5,K.Press,1)),
+            (None, (8,6,K.Drag,1))]
+
+def test_wheelDelta():
+    class _View(ttk.TTkAbstractScrollView):
+        def viewFullAreaSize(self) -> tuple[int,int]:
+            return 10,100
+    sv = _View(size=(10,10))
+    sv.wheelEvent(ttk.TTkMouseEvent(0,0,ttk.TTkK.Wheel,ttk.TTkK.WHEEL_Down,0,0,'',3))
+    assert sv.getViewOffsets() == (0,3*ttk.TTkCfg.scrollDelta)
+    sv.wheelEvent(ttk.TTkMouseEvent(0,0,ttk.TTkK.Wheel,ttk.TTkK.WHEEL_Up,0,0,'').clone(pos=(1,1)))
+    assert sv.getViewOffsets() == (0,2*ttk.TTkCfg.scrollDelta)
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2025 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+
+import sys, os
+
+import pytest
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+
+import TermTk as ttk
+from TermTk.TTkCore.TTkTerm.term_base import TTkTermBase
+
+def test_frameSingleWrite(monkeypatch):
+    pushed, frames = [], []
+    monkeypatch.setattr(TTkTermBase, 'push', lambda *args: pushed.append(str(*args)))
+    monkeypatch.setattr(TTkTermBase, 'pushFrame', lambda data: frames.append(data))
+    push = TTkTermBase.push
+
+    TTkTermBase.setSyncOutput(False)
+    TTkTermBase.beginFrame()
+    TTkTermBase.push('Hello')
+    TTkTermBase.push(' World')
+    assert TTkTermBase.endFrame() == len('Hello World')
+    assert frames == ['Hello World']
+    assert pushed == []
+    assert TTkTermBase.push is push
+
+    # DEC 2026, the synchronized output markers wrap the whole frame
+    frames.clear()
+    TTkTermBase.setSyncOutput(True)
+    try:
+        TTkTermBase.beginFrame()
+        TTkTermBase.push('─┼─')
+        # The bytes written are counted, not the characters
+        frame = TTkTermBase.BEGIN_SYNC_UPDATE+'─┼─'+TTkTermBase.END_SYNC_UPDATE
+        assert TTkTermBase.endFrame() == len(frame.encode()) > len(frame)
+        assert frames == [TTkTermBase.BEGIN_SYNC_UPDATE+'─┼─'+TTkTermBase.END_SYNC_UPDATE]
+    finally:
+        TTkTermBase.setSyncOutput(False)
+
+    # Empty frames are not written
+    frames.clear()
+    TTkTermBase.beginFrame()
+    assert TTkTermBase.endFrame() == 0
+    assert frames == []
+    assert TTkTermBase.push is push
+
+def test_frameRestoredOnError(monkeypatch):
+    calls = []
+    monkeypatch.setattr(ttk.TTkTerm, 'beginFrame', staticmethod(lambda: calls.append('begin')))
+    monkeypatch.setattr(ttk.TTkTerm, 'endFrame',   staticmethod(lambda: calls.append('end') or 0))
+
+    root = ttk.TTk()
+    ttk.TTkLabel(parent=root, text='Frame')
+    root.show()
+
+    def _fail(*args): raise RuntimeError('push')
+    canvas = type(ttk.TTkHelper._rootCanvas)
+    for name in ('pushToTerminal', 'pushToTerminalDamage', 'pushToTerminalBuffered', 'pushToTerminalBufferedNew'):
+        monkeypatch.setattr(canvas, name, _fail)
+
+    with pytest.raises(RuntimeError):
+        ttk.TTkHelper.paintAll()
+    assert calls == ['begin', 'end']
+
+def test_frameProfiling(monkeypatch):
+    frame = []
+    monkeypatch.setattr(ttk.TTkTerm, 'push',       staticmethod(lambda *args: frame.append(str(*args))))
+    monkeypatch.setattr(ttk.TTkTerm, 'beginFrame', staticmethod(frame.clear))
+    monkeypatch.setattr(ttk.TTkTerm, 'endFrame',   staticmethod(lambda: len(''.join(frame).encode())))
+
+    root = ttk.TTk()
+    label = ttk.TTkLabel(parent=root, text='Profile 中文')
+    root.show()
+    ttk.TTkHelper.paintAll()
+
+    profiles = []
+    ttk.TTkHelper.frameProfiled.connect(profiles.append)
+    ttk.TTkHelper.setFrameProfiling(True)
+    try:
+        label.setText('Profiled 中文')
+        ttk.TTkHelper.paintAll()
+    finally:
+        ttk.TTkHelper.setFrameProfiling(False)
+        ttk.TTkHelper.frameProfiled.disconnect(profiles.append)
+
+    assert len(profiles) == 1
+    profile = profiles[0]
+    assert label in profile.paintTimes
+    assert all(_t >= 0 for _t in profile.paintTimes.values())
+    assert profile.updatedBuffers == len(profile.paintTimes)
+    assert profile.updatedWidgets >= profile.updatedBuffers
+    assert '中文' in ''.join(frame)
+    assert profile.pushed == len(''.join(frame).encode())
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2025 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import sys, os, random
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+
+import TermTk as ttk
+
+# Reference rasteriser, the blitter used before the blocks memoization
+def _refReduce(l, charMap):
+    def delta(i):
+        return max(v[i] for v in l) - min(v[i] for v in l)
+    def midColor(c1,c2):
+        return ((c1[0]+c2[0])//2,(c1[1]+c2[1])//2,(c1[2]+c2[2])//2)
+    def closer(a,b,c):
+        return \
+            ( (a[0]-c[0])**2 + (a[1]-c[1])**2 + (a[2]-c[2])**2 ) > \
+            ( (b[0]-c[0])**2 + (b[1]-c[1])**2 + (b[2]-c[2])**2 )
+    deltaR, deltaG, deltaB = delta(0), delta(1), delta(2)
+    if deltaR >= deltaG and deltaR >= deltaB:
+        i = 0
+    elif deltaG >= deltaB and deltaG >= deltaR:
+        i = 1
+    else:
+        i = 2
+    s = sorted(l,key=lambda x:x[i])
+    mid = (s[-1][i]+s[0][i])//2
+    if s[1][i] < mid:
+        if s[2][i] > mid:
+            c1 = midColor(s[0],s[1])
+            c2 = midColor(s[2],s[3])
+        else:
+            c1 = midColor(s[0],s[1])
+            c1 = midColor(c1,s[2])
+            c2 = s[3]
+    else:
+        c1 = s[0]
+        c2 = midColor(s[1],s[2])
+        c2 = midColor(c1,s[3])
+    ch = 0
+    for b,p in enumerate(l):
+        ch |= (1<<b) if closer(c1,c2,p) else 0
+    return  ttk.TTkString() + \
+            (ttk.TTkColor.bg(f'#{c1[0]:02X}{c1[1]:02X}{c1[2]:02X}') +
+             ttk.TTkColor.fg(f'#{c2[0]:02X}{c2[1]:02X}{c2[2]:02X}')) + \
+            charMap[ch]
+
+def _refDrawImage(img, rasterType, canvas):
+    if rasterType == ttk.TTkImage.FULLBLOCK:
+        for y in range(0, len(img)):
+            for x in range(0, len(img[y])):
+                c1 = img[y][x]
+                color = ttk.TTkColor.fg(f'#{c1[0]:02X}{c1[1]:02X}{c1[2]:02X}')
+                canvas.drawChar(pos=(x,y), char='█', color=color)
+    elif rasterType == ttk.TTkImage.HALFBLOCK:
+        for y in range(0, len(img)&(~1), 2):
+            for x in range(0, len(img[y])):
+                c1, c2 = img[y][x] ,img[y+1][x]
+                color = ( ttk.TTkColor.fg(f'#{c1[0]:02X}{c1[1]:02X}{c1[2]:02X}') +
+                          ttk.TTkColor.bg(f'#{c2[0]:02X}{c2[1]:02X}{c2[2]:02X}') )
+                canvas.drawChar(pos=(x,y//2), char='▀', color=color)
+    elif rasterType == ttk.TTkImage.QUADBLOCK:
+        for y in range(0, len(img)&(~1), 2):
+            for x in range(0, min(len(img[y])&(~1),len(img[y+1])&(~1)), 2):
+                canvas.drawText(
+                        pos=(x//2,y//2),
+                        text=_refReduce((img[y][x]   , img[y][x+1]   ,
+                                         img[y+1][x] , img[y+1][x+1] ), ttk.TTkImage._quadMap))
+    elif rasterType == ttk.TTkImage.SEXBLOCK:
+        for y in range(0, len(img)-2, 3):
+            for x in range(0, min(len(img[y])-1,len(img[y+1])-1,len(img[y+2])-1), 2):
+                canvas.drawText(
+                        pos=(x//2,y//3),
+                        text=_refReduce((img[y][x]   , img[y][x+1]   ,
+                                         img[y+1][x] , img[y+1][x+1] ,
+                                         img[y+2][x] , img[y+2][x+1] ), ttk.TTkImage._sexMap))
+
+def test_imageRasterisers():
+    random.seed(8)
+    palette = [[random.randint(0,255) for _ in range(3)] for _ in range(6)]
+    # List pixels (as in the TTkCfg icons), with repeated blocks
+    data = [[list(random.choice(palette)) for _ in range(13)] for _ in range(11)]
+    for rasterType in (ttk.TTkImage.FULLBLOCK, ttk.TTkImage.HALFBLOCK,
+                       ttk.TTkImage.QUADBLOCK, ttk.TTkImage.SEXBLOCK):
+        for pixels in (data, [[tuple(_p) for _p in _r] for _r in data]):
+            image = ttk.TTkImage(data=pixels, rasteriser=rasterType)
+            w,h = image.size()
+            ref = ttk.TTkCanvas(width=w, height=h)
+            _refDrawImage(data, rasterType, ref)
+            canvas = image._canvasImage
+            assert canvas._data == ref._data
+            assert canvas._colors == ref._colors
+        # The rotated hue is rasterised as the rotated data
+        image.rotHue(90)
+        def _rot(pixel):
+            h,s,l = ttk.TTkColor.rgb2hsl(pixel)
+            return ttk.TTkColor.hsl2rgb(((h+90)%360,s,l))
+        ref = ttk.TTkCanvas(width=w, height=h)
+        _refDrawImage([[_rot(_p) for _p in _r] for _r in data], rasterType, ref)
+        assert image._canvasImage._data == ref._data
+        assert image._canvasImage._colors == ref._colors
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2025 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import sys, os
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+sys.path.append(os.path.join(sys.path[0],'../../apps/dumbPaintTool'))
+
+import TermTk as ttk
+
+from dumbPaintTool.app.canvaslayer import CanvasLayer
+from dumbPaintTool.app.const import ToolType
+
+def _content(layer):
+    return ([row.copy() for row in layer._data],
+            [row.copy() for row in layer._colors])
+
+def _newLayer():
+    layer = CanvasLayer()
+    layer.resize(10,4)
+    layer.placeGlyph(1,1,'A',ttk.TTkColor.RED)
+    return layer
+
+def test_snapshots():
+    layer = _newLayer()
+    v0 = layer.saveSnapshot()
+    c0 = _content(layer)
+
+    layer.placeGlyph(2,1,'B',ttk.TTkColor.GREEN)
+    layer.placeFill((0,3,4,3),ToolType.RECTFILL,'C',ttk.TTkColor.BLUE)
+    v1 = layer.saveSnapshot()
+    c1 = _content(layer)
+    assert c1 != c0
+    assert _content(layer._snapshots[v0]) == c0
+
+    # The untouched rows are shared with the snapshot
+    assert layer._data[0] is layer._snapshots[v0]._data[0]
+    assert layer._data[1] is not layer._snapshots[v0]._data[1]
+
+    layer.placeGlyph(1,1,'D',ttk.TTkColor.YELLOW)
+    layer.placeGlyph(1,2,'E',ttk.TTkColor.YELLOW)
+    v2 = layer.saveSnapshot()
+    c2 = _content(layer)
+
+    layer.restoreSnapshot(v0)
+    assert _content(layer) == c0
+
+    # Editing the restored layer must not touch any snapshot
+    layer.placeGlyph(1,1,'F',ttk.TTkColor.CYAN)
+    layer.placeFill((0,0,9,3),ToolType.RECTEMPTY,'G',ttk.TTkColor.CYAN)
+    area = CanvasLayer()
+    area.resize(3,3)
+    area.placeFill((0,0,2,2),ToolType.RECTFILL,'H',ttk.TTkColor.WHITE)
+    layer.placeArea(2,2,area)
+    assert _content(layer._snapshots[v0]) == c0
+    assert _content(layer._snapshots[v1]) == c1
+    assert _content(layer._snapshots[v2]) == c2
+
+    layer.restoreSnapshot(v2)
+    assert _content(layer) == c2
+    layer.restoreSnapshot(v0)
+    assert _content(layer) == c0
+    layer.restoreSnapshot(v1)
+    assert _content(layer) == c1
+    assert _content(layer._snapshots[v0]) == c0
+    assert _content(layer._snapshots[v2]) == c2
+
+def test_preview():
+    layer = _newLayer()
+    v0 = layer.saveSnapshot()
+    c0 = _content(layer)
+    rows = layer._data.copy()
+
+    area = CanvasLayer()
+    area.resize(3,3)
+    area.placeFill((0,0,2,2),ToolType.RECTFILL,'H',ttk.TTkColor.WHITE)
+
+    for _edit in (
+            lambda: layer.placeGlyph(1,1,'P',ttk.TTkColor.RED,preview=True),
+            lambda: layer.placeFill((0,0,3,1),ToolType.RECTFILL,'P',ttk.TTkColor.RED,preview=True),
+            lambda: layer.placeFill((0,1,9,3),ToolType.RECTEMPTY,'P',ttk.TTkColor.RED,preview=True),
+            lambda: layer.placeGlyph(1,1,' ',ttk.TTkColor.BLUE,glyphEnabled=False,preview=True),
+            lambda: layer.placeArea(2,2,area,preview=True),
+            lambda: layer.placeArea(2,2,area,transparent=True,preview=True)):
+        _edit()
+        preview = layer._preview
+        assert (preview['data'],preview['colors']) != c0
+        # The preview never writes into the rows of the layer
+        assert _content(layer) == c0
+        assert _content(layer._snapshots[v0]) == c0
+        assert all(a is b for a,b in zip(layer._data,rows))
+        # and copies only the rows it touches
+        assert any(a is b for a,b in zip(preview['data'],rows))
+
+    layer.cleanPreview()
+    layer.placeGlyph(1,2,'E',ttk.TTkColor.YELLOW)
+    assert layer._preview is None
+    assert _content(layer._snapshots[v0]) == c0
+    assert layer._data[2][1] == 'E'
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# MIT License
+#
+# Copyright (c) 2025 Eugenio Parodi <ceccopierangiolieugenio AT googlemail DOT com>
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import sys, os, re
+
+sys.path.append(os.path.join(sys.path[0],'../..'))
+sys.path.append(os.path.join(sys.path[0],'../../apps/tlogg'))
+
+import TermTk as ttk
+
+from tlogg.app import TloggCfg
+from tlogg.app.fileviewer import FileViewer, _compileHighlighters
+
+_lines = [
+    '', 'info', 'INFO: started', 'Warning: low memory', 'error: failed',
+    'an Error and a warning', 'debug warning error', 'abc', 'ab', 'aa bb',
+    'x'*200+'error', 'tab\tseparated ERROR', 'start error end', 'end',
+    'the end\r', 'ERR-42', 'fooBAR', 'no match at all']
+
+def _color(pattern, ignorecase=False, fg='#FF0000', bg='#000000'):
+    return {'pattern':pattern, 'ignorecase':ignorecase, 'fg':fg, 'bg':bg}
+
+def _refMatch(colors, text):
+    # The highlighters evaluated one by one, in order
+    for i,color in enumerate(colors):
+        if re.search(color['pattern'], text, re.IGNORECASE if color['ignorecase'] else 0):
+            return i
+    return None
+
+def _check(colors, merged=True):
+    match = _compileHighlighters(colors)
+    assert (match.__name__ == '_matchMerged') == merged
+    for line in _lines:
+        assert match(line) == _refMatch(colors, line), (line, colors)
+
+def test_highlightersMerged():
+    _check([], merged=False)
+    _check([_color('error')])
+    # Priority, the first rule matching wins even if a later one matches before
+    _check([_color('error', True), _color('warning', True), _color('info', True)])
+    _check([_color('warning', True), _color('error', True), _color('info', True)])
+    _check([_color('error'), _color('ERROR'), _color('error', True)])
+    _check([_color('ERROR'), _color('error', True), _color('error')])
+    # Anchors, alternations and lookarounds are kept inside each rule
+    _check([_color('^end'), _color('end$'), _color('^$'), _color(r'\Aab\Z')])
+    _check([_color('debug|info', True), _color('a|b'), _color('(?<=the )end')])
+    _check([_color('(?:err|warn)(?!or)', True), _color(r'\d+'), _color('a.b')])
+    _check([_color('x{150,}'), _color(r'\t'), _color('[A-Z]{3}')])
+
+def test_highlightersFallback():
+    # Groups may be referenced by the pattern
+    _check([_color(r'(\w)\1'), _color('error', True)], merged=False)
+    _check([_color('error'), _color(r'(?P<c>[ab]) (?P=c)')], merged=False)
+    # The global inline flags would be applied to all the rules
+    _check([_color('error'), _color('(?i)warning'), _color('ERROR')], merged=False)
+    _check([_color('(?x) e r r o r'), _color('info')], merged=False)
+
+def test_highlightersCache(tmp_path):
+    fileName = str(tmp_path/'test.log')
+    with open(fileName, 'w') as f:
+        f.write('\n'.join(_lines))
+    fb = ttk.TTkFileBuffer(fileName, 0x100, 0x1000)
+    fb.waitIndexed()
+    viewer = FileViewer(filebuffer=fb, size=(40,len(_lines)))
+    canvas = ttk.TTkCanvas(width=40, height=len(_lines))
+    red  = ttk.TTkColor.fg('#FF0000')+ttk.TTkColor.bg('#000000')
+    blue = ttk.TTkColor.fg('#0000FF')+ttk.TTkColor.bg('#000000')
+
+    def _colors():
+        return [viewer._colorizedLine(i)[1] for i in range(len(_lines))]
+
+    TloggCfg.colors = [_color('error', True)]
+    viewer.paintEvent(canvas)
+    assert _colors() == [red if _refMatch(TloggCfg.colors, l) is not None else ttk.TTkColor.RST for l in _lines]
+
+    # The highlighters are replaced as a whole when edited
+    TloggCfg.colors = [_color('warning', True, fg='#0000FF'), _color('error', True)]
+    viewer.paintEvent(canvas)
+    assert _colors() == [
+        {0:blue, 1:red, None:ttk.TTkColor.RST}[_refMatch(TloggCfg.colors, l)] for l in _lines]
+
+    TloggCfg.colors = []
+    viewer.paintEvent(canvas)
+    assert _colors() == [ttk.TTkColor.RST]*len(_lines)
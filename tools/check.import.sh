@@ -11,17 +11,24 @@ __check(){
             -e "signal.py:from inspect import getfullargspec" \
             -e "signal.py:from types import LambdaType" \
             -e "signal.py:from threading import Lock" \
+            -e "signal.py:from weakref import WeakSet, WeakKeyDictionary, ref" \
             -e "signal.py:import asyncio" \
             -e "signal.py:import importlib.util" \
             -e "colors.py:from .colors_ansi_map" \
-            -e "log.py:import inspect" \
+            -e "log.py:import sys" \
+            -e "log.py:import atexit" \
             -e "log.py:import logging" \
+            -e "log.py:import logging.handlers" \
+            -e "log.py:from queue import Queue" \
             -e "log.py:from collections.abc import Callable, Set" \
             -e "term.py:import importlib.util" \
             -e "term.*.py:import sys, os, signal" \
             -e "term.*.py:from .term_base import TTkTermBase" \
             -e "timer.py:import importlib" \
+            -e "timer_unix.py:import time" \
             -e "timer_unix.py:import threading" \
+            -e "timer_unix.py:import traceback" \
+            -e "timer_unix.py:from heapq import heappush, heappop" \
             -e "timer_pyodide.py:import pyodideProxy" \
             -e "ttk.py:import signal" \
             -e "ttk.py:import time" \
@@ -30,9 +37,26 @@ __check(){
             -e "ttk.py:import platform" \
             -e "clipboard.py:import importlib.util" \
             -e "filebuffer.py:import threading" \
+            -e "helper.py:from time import perf_counter" \
+            -e "filebuffer.py:import mmap" \
+            -e "filebuffer.py:from array import array" \
             -e "texedit.py:from math import log10, floor" \
-            -e "string.py:import unicodedata" \
+            -e "canvas_array.py:from array import array" \
+            -e "canvas_array.py:from threading import Lock" \
+            -e "canvas_array.py:from weakref import WeakSet" \
+            -e "color.py:from functools import lru_cache" \
+            -e "color.py:from threading import Lock" \
+            -e "string.py:from bisect import bisect_right" \
             -e "string.py:from types import GeneratorType" \
+            -e "tablewidget.py:from bisect import bisect_left, bisect_right" \
+            -e "graph.py:from bisect import bisect_left" \
+            -e "graph.py:from collections import deque" \
+            -e "graph.py:from itertools import islice" \
+            -e "logviewer.py:from collections import deque" \
+            -e "logviewer.py:from itertools import islice" \
+            -e "logviewer.py:from threading import Lock" \
+            -e "frameinspector.py:from weakref import WeakKeyDictionary" \
+            -e "tablemodelsqlite3.py:from bisect import bisect_right, insort" \
             -e "progressbar.py:import math" \
             -e "uiloader.py:import json" \
             -e "uiproperties.py:from .properties.* import" \
@@ -103,6 +127,9 @@ __check(){
         grep -v \
             -e "TTkModelView/__init__.py:from importlib.util import find_spec" \
             -e "TTkModelView/tablemodelcsv.py:import csv" \
+            -e "TTkModelView/tablemodelcsv.py:import io" \
+            -e "TTkModelView/tablemodelcsv.py:import threading" \
+            -e "TTkModelView/tablemodelcsv.py:from array import array" \
             -e "TTkModelView/tablemodelsqlite3.py:import sqlite3" \
             -e "TTkModelView/tablemodelsqlite3.py:import threading"
 } ;